@@ -0,0 +1 @@
+"""Ad hoc performance benchmarks for the AI processing layer."""
@@ -0,0 +1,87 @@
+"""
+Benchmark: streaming DOCX extraction vs the python-docx object model.
+
+Generates long policy-style documents (headings, paragraphs and tables) and
+parses each in a fresh process with both paths, reporting time, peak resident
+memory growth and extracted words. The python-docx baseline is the previous
+parse_docx(), which reads paragraphs only.
+
+Usage (from ai-processing/):
+    python -m benchmarks.docx_parsing [PARAGRAPHS ...]
+"""
+
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+from docx import Document
+
+from src.ingestion.file_parser import parse_docx
+from src.ingestion.text_stats import count_words
+
+ROWS_PER_TABLE = 10
+PARAGRAPHS_PER_TABLE = 50
+
+
+def build_document(path: Path, paragraphs: int) -> None:
+    document = Document()
+    for number in range(paragraphs):
+        if number % 25 == 0:
+            document.add_heading(f"Section {number // 25 + 1}", level=1 + number % 2)
+        document.add_paragraph(
+            f"Clause {number}: the customer agrees that the service level described "
+            "here applies to every workspace, integration and data export request."
+        )
+        if number % PARAGRAPHS_PER_TABLE == 0:
+            table = document.add_table(rows=ROWS_PER_TABLE, cols=3)
+            for row in range(ROWS_PER_TABLE):
+                for column in range(3):
+                    table.cell(row, column).text = f"Tier {row} limit {column}"
+    document.save(path)
+
+
+def parse_with_python_docx(path: str) -> int:
+    """Previous parse_docx(): python-docx paragraphs only."""
+    document = Document(path)
+    text_parts = [p.text.strip() for p in document.paragraphs if p.text.strip()]
+    return count_words("\n\n".join(text_parts))
+
+
+def parse_streaming(path: str) -> int:
+    return parse_docx(path, Path(path).name).word_count
+
+
+def _measure(name: str, path: str) -> Tuple[float, float, int]:
+    parse = {"python-docx": parse_with_python_docx, "streaming": parse_streaming}[name]
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    started = time.perf_counter()
+    words = parse(path)
+    elapsed = time.perf_counter() - started
+    peak_mb = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before) / 1024
+    return elapsed, peak_mb, words
+
+
+def main(sizes: List[int]) -> None:
+    # A fresh process per run so peak memory is not shared between paths
+    context = multiprocessing.get_context("spawn")
+    print(f"{'paragraphs':>10} {'size':>8} {'path':<12} {'seconds':>8} {'peak MB':>8} {'words':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        for paragraphs in sizes:
+            path = Path(directory) / f"policy-{paragraphs}.docx"
+            build_document(path, paragraphs)
+            size = f"{path.stat().st_size / 1024 / 1024:.1f}MB"
+            for name in ("python-docx", "streaming"):
+                with context.Pool(1) as pool:
+                    elapsed, peak_mb, words = pool.apply(_measure, (name, str(path)))
+                print(
+                    f"{paragraphs:>10} {size:>8} {name:<12} {elapsed:>8.2f} "
+                    f"{peak_mb:>8.1f} {words:>8}"
+                )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [2000, 10000, 40000])
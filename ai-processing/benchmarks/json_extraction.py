@@ -0,0 +1,348 @@
+"""
+Benchmark: single-pass JSON extraction vs the previous multi-strategy extractor.
+
+Runs both extractors over messy agent responses: prose around fenced JSON,
+trailing commas, raw newlines in strings, a missing opening brace, output
+cut off at max_tokens, and long synthesis-style responses. Reports the time
+per call and whether each extractor recovered the expected JSON. The
+baseline is the previous extract_json_from_text(), which tried a dozen
+regex strategies and retried json.loads after each.
+
+Usage (from ai-processing/):
+    python -m benchmarks.json_extraction [REPEATS]
+"""
+
+import json
+import re
+import sys
+import time
+from typing import Callable, List, Optional, Tuple, Union
+
+from src.utils.json_parser import extract_json_from_text
+
+CLARITY = {
+    "what_they_do": {"score": 62, "assessment": "The homepage names the product category."},
+    "how_theyre_different": {"score": 41, "assessment": "Differentiators are generic."},
+    "who_uses_them": {"score": 55, "assessment": "Customer logos but no named segments."},
+}
+FINDINGS = {
+    "findings": [
+        {
+            "id": f"finding-{number}",
+            "severity": ["low", "medium", "high"][number % 3],
+            "quote": f"We deliver end-to-end value for stakeholder {number}.",
+            "recommendation": "Replace the abstraction with a concrete customer outcome.",
+            "scores": {"clarity": 40 + number % 50, "vividness": 30 + number % 40},
+        }
+        for number in range(150)
+    ]
+}
+
+
+def _fenced(value, before="Here is my assessment:", after="Let me know if you need more."):
+    return f"{before}\n\n```json\n{json.dumps(value, indent=2)}\n```\n\n{after}"
+
+
+def _samples() -> List[Tuple[str, str, object]]:
+    """(name, response text, expected JSON) triples."""
+    clarity = json.dumps(CLARITY, indent=2)
+    findings = json.dumps(FINDINGS, indent=2)
+    cut = findings[: len(findings) * 2 // 3]
+    cut = cut[: cut.rfind("},") + 1]
+    return [
+        ("bare object", clarity, CLARITY),
+        ("fenced with prose", _fenced(CLARITY), CLARITY),
+        (
+            "trailing commas",
+            _fenced(CLARITY).replace('"\n  }', '",\n  }').replace("}\n}", "},\n}"),
+            CLARITY,
+        ),
+        ("missing opening brace", clarity[1:], CLARITY),
+        (
+            "raw newline in string",
+            clarity.replace("names the product", "names\nthe product"),
+            json.loads(clarity.replace("names the product", "names\\nthe product")),
+        ),
+        (
+            "example block then answer",
+            _fenced({"what_they_do": {"score": 0, "assessment": "..."}}, "Format:")
+            + "\n"
+            + _fenced(CLARITY),
+            CLARITY,
+        ),
+        (
+            "prose with braces first",
+            "Scores use the {0-100} scale [see rubric].\n" + clarity,
+            CLARITY,
+        ),
+        ("long synthesis", _fenced(FINDINGS), FINDINGS),
+        (
+            "cut off at max_tokens",
+            "```json\n" + cut,
+            {"findings": json.loads(cut[cut.index("[") :] + "]")},
+        ),
+        ("no JSON", "I could not assess this content. " * 200, None),
+    ]
+
+
+def legacy_extract_json_from_text(text: str) -> Optional[Union[dict, list]]:
+    """Previous extract_json_from_text(), unchanged."""
+    if not text:
+        return None
+
+    code_block_patterns = [
+        r"```json\s*(.*?)```",
+        r"```\s*(.*?)```",
+    ]
+
+    for pattern in code_block_patterns:
+        matches = list(re.finditer(pattern, text, re.DOTALL))
+        if matches:
+            for match in reversed(matches):
+                code_block_content = match.group(1).strip()
+                if not code_block_content:
+                    continue
+
+                json_str = _legacy_balance_json(code_block_content)
+                if json_str:
+                    try:
+                        result = json.loads(json_str)
+                        if isinstance(result, (dict, list)):
+                            return result
+                    except json.JSONDecodeError:
+                        json_str_fixed = _legacy_fix_trailing_commas(json_str)
+                        try:
+                            result = json.loads(json_str_fixed)
+                            if isinstance(result, (dict, list)):
+                                return result
+                        except json.JSONDecodeError:
+                            pass
+
+                try:
+                    result = json.loads(code_block_content)
+                    if isinstance(result, (dict, list)):
+                        return result
+                except json.JSONDecodeError:
+                    json_str_fixed = _legacy_fix_trailing_commas(code_block_content)
+                    try:
+                        result = json.loads(json_str_fixed)
+                        if isinstance(result, (dict, list)):
+                            return result
+                    except json.JSONDecodeError:
+                        continue
+
+    trimmed_text = text.strip()
+    looks_like_missing_brace = (
+        not trimmed_text.startswith("{")
+        and not trimmed_text.startswith("[")
+        and "}" in trimmed_text
+        and '"' in trimmed_text
+    )
+
+    if looks_like_missing_brace or (
+        "}" in trimmed_text and '"' in trimmed_text and not trimmed_text.startswith("{")
+    ):
+        last_brace = trimmed_text.rfind("}")
+        if last_brace != -1:
+            potential_content = trimmed_text[: last_brace + 1].strip()
+            json_like_pattern = r'["\'][^"\']+["\']\s*:\s*[^,}]+'
+            if re.search(json_like_pattern, potential_content, re.DOTALL):
+                if not potential_content.strip().startswith("{"):
+                    reconstructed = "{" + potential_content
+                else:
+                    reconstructed = potential_content
+
+                try:
+                    result = json.loads(reconstructed)
+                    if isinstance(result, dict):
+                        return result
+                except json.JSONDecodeError:
+                    reconstructed_fixed = _legacy_fix_trailing_commas(reconstructed)
+                    try:
+                        result = json.loads(reconstructed_fixed)
+                        if isinstance(result, dict):
+                            return result
+                    except json.JSONDecodeError:
+                        pass
+
+        first_key_match = re.search(r'["\']([^"\']+)["\']\s*:', trimmed_text, re.MULTILINE)
+        if first_key_match:
+            start_pos = first_key_match.start()
+            last_brace_after_start = trimmed_text.rfind("}", start_pos)
+            if last_brace_after_start != -1:
+                potential_content = trimmed_text[
+                    max(0, start_pos - 1) : last_brace_after_start + 1
+                ].strip()
+                if not potential_content.startswith("{"):
+                    potential_content = "{" + potential_content.lstrip()
+
+                try:
+                    result = json.loads(potential_content)
+                    if isinstance(result, dict):
+                        return result
+                except json.JSONDecodeError:
+                    potential_content_fixed = _legacy_fix_trailing_commas(potential_content)
+                    try:
+                        result = json.loads(potential_content_fixed)
+                        if isinstance(result, dict):
+                            return result
+                    except json.JSONDecodeError:
+                        pass
+
+        first_key_match = re.search(
+            r'["\']([^"\']+)["\']\s*:', trimmed_text, re.MULTILINE | re.DOTALL
+        )
+        last_brace = trimmed_text.rfind("}")
+
+        if first_key_match and last_brace != -1 and last_brace > first_key_match.start():
+            start_idx = max(0, first_key_match.start() - 2)
+            content = trimmed_text[start_idx : last_brace + 1].strip()
+            if not content.startswith("{"):
+                content = "{" + content.lstrip()
+
+            try:
+                result = json.loads(content)
+                if isinstance(result, dict):
+                    return result
+            except json.JSONDecodeError:
+                content_fixed = _legacy_fix_trailing_commas(content)
+                try:
+                    result = json.loads(content_fixed)
+                    if isinstance(result, dict):
+                        return result
+                except json.JSONDecodeError:
+                    if not content.startswith("{"):
+                        reconstructed = "{" + content
+                        reconstructed_fixed = _legacy_fix_trailing_commas(reconstructed)
+                        try:
+                            result = json.loads(reconstructed_fixed)
+                            if isinstance(result, dict):
+                                return result
+                        except json.JSONDecodeError:
+                            pass
+
+    patterns = [
+        r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}",
+        r"\[[^\[\]]*(?:\[[^\[\]]*\][^\[\]]*)*\]",
+    ]
+
+    for pattern in patterns:
+        matches = re.finditer(pattern, text, re.DOTALL)
+        for match in matches:
+            json_str = match.group(0)
+            try:
+                parsed = json.loads(json_str)
+                if isinstance(parsed, dict):
+                    return parsed
+                if isinstance(parsed, list) and not any(isinstance(m, dict) for m in matches):
+                    return parsed
+            except json.JSONDecodeError:
+                json_str_fixed = _legacy_fix_trailing_commas(json_str)
+                try:
+                    parsed = json.loads(json_str_fixed)
+                    if isinstance(parsed, dict):
+                        return parsed
+                except json.JSONDecodeError:
+                    continue
+
+    brace_start = text.find("{")
+    brace_end = text.rfind("}")
+    if brace_start != -1 and brace_end != -1 and brace_end > brace_start:
+        json_str = text[brace_start : brace_end + 1]
+        try:
+            result = json.loads(json_str)
+            if isinstance(result, dict):
+                return result
+        except json.JSONDecodeError:
+            json_str_fixed = _legacy_fix_trailing_commas(json_str)
+            try:
+                result = json.loads(json_str_fixed)
+                if isinstance(result, dict):
+                    return result
+            except json.JSONDecodeError:
+                pass
+
+    bracket_start = text.find("[")
+    bracket_end = text.rfind("]")
+    if bracket_start != -1 and bracket_end != -1 and bracket_end > bracket_start:
+        json_str = text[bracket_start : bracket_end + 1]
+        try:
+            result = json.loads(json_str)
+            if isinstance(result, list):
+                return result
+        except json.JSONDecodeError:
+            json_str_fixed = _legacy_fix_trailing_commas(json_str)
+            try:
+                result = json.loads(json_str_fixed)
+                if isinstance(result, list):
+                    return result
+            except json.JSONDecodeError:
+                pass
+
+    return None
+
+
+def _legacy_balance_json(json_str: str) -> str:
+    if not json_str:
+        return ""
+    start_idx = -1
+    for i, char in enumerate(json_str):
+        if char in "{[":
+            start_idx = i
+            break
+    if start_idx == -1:
+        return ""
+    depth = 0
+    end_idx = -1
+    opening_char = json_str[start_idx]
+    closing_char = "}" if opening_char == "{" else "]"
+    for i in range(start_idx, len(json_str)):
+        char = json_str[i]
+        if char == opening_char:
+            depth += 1
+        elif char == closing_char:
+            depth -= 1
+            if depth == 0:
+                end_idx = i
+                break
+    if end_idx != -1:
+        return json_str[start_idx : end_idx + 1]
+    return ""
+
+
+def _legacy_fix_trailing_commas(json_str: str) -> str:
+    return re.sub(r",\s*([}\]])", r"\1", json_str)
+
+
+def _time(extract: Callable, text: str, repeats: int) -> Tuple[float, object]:
+    started = time.perf_counter()
+    for _ in range(repeats):
+        result = extract(text)
+    return (time.perf_counter() - started) / repeats * 1e6, result
+
+
+def main(repeats: int) -> None:
+    print(
+        f"{'response':<28} {'chars':>7} {'previous us':>12} {'ok':>3} {'single-pass us':>15} {'ok':>3}"
+    )
+    totals = [0.0, 0.0]
+    recovered = [0, 0]
+    samples = _samples()
+    for name, text, expected in samples:
+        row = [f"{name:<28} {len(text):>7}"]
+        for column, extract in enumerate((legacy_extract_json_from_text, extract_json_from_text)):
+            micros, result = _time(extract, text, repeats)
+            ok = result == expected
+            totals[column] += micros
+            recovered[column] += ok
+            width = 12 if column == 0 else 15
+            row.append(f"{micros:>{width}.0f} {'yes' if ok else 'no':>3}")
+        print(" ".join(row))
+    print(
+        f"{'total':<28} {'':>7} {totals[0]:>12.0f} {recovered[0]:>3} "
+        f"{totals[1]:>15.0f} {recovered[1]:>3}   (of {len(samples)} recovered)"
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
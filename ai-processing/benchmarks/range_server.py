@@ -0,0 +1,175 @@
+"""
+Range-capable stand-in for Cloud Storage, serving <root>/<bucket>/<path> over HTTP.
+
+Supports HEAD and GET with single byte ranges (206 Partial Content), ETag and
+If-Range, and an optional per-connection bandwidth cap so that parallel slices
+behave like throttled object-store streams. Used by HTTPStorageBackend tests
+and the sliced download benchmark.
+
+Usage (from ai-processing/):
+    python -m benchmarks.range_server ROOT [PORT]
+"""
+
+import os
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+CHUNK_SIZE = 256 * 1024
+_RANGE_PATTERN = re.compile(r"bytes=(\d*)-(\d*)$")
+
+
+def _etag(stat: os.stat_result) -> str:
+    return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+
+class _RangeRequestHandler(BaseHTTPRequestHandler):
+    server: "RangeServer"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _resolve(self) -> Optional[Path]:
+        root = self.server.root
+        path = (root / unquote(urlsplit(self.path).path).lstrip("/")).resolve()
+        if not path.is_relative_to(root) or not path.is_file():
+            return None
+        return path
+
+    def _range(self, size: int, etag: str) -> Optional[Tuple[int, int]]:
+        header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if not header or (if_range and if_range != etag):
+            return None
+        match = _RANGE_PATTERN.match(header.strip())
+        if not match or not any(match.groups()):
+            return None
+        first, last = match.groups()
+        if not first:
+            # Suffix range: the last N bytes
+            return max(size - int(last), 0), size - 1
+        return int(first), min(int(last), size - 1) if last else size - 1
+
+    def _respond(self, send_body: bool) -> None:
+        path = self._resolve()
+        if path is None:
+            self.send_error(404)
+            return
+        stat = path.stat()
+        etag = _etag(stat)
+        byte_range = self._range(stat.st_size, etag)
+        if byte_range and byte_range[0] >= stat.st_size:
+            self.send_response(416)
+            self.send_header("Content-Range", f"bytes */{stat.st_size}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        start, end = byte_range or (0, stat.st_size - 1)
+        self.send_response(206 if byte_range else 200)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(end - start + 1))
+        if byte_range:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{stat.st_size}")
+        self.end_headers()
+        self.server.record(byte_range is not None)
+        if send_body:
+            self._send_file(path, start, end)
+
+    def _send_file(self, path: Path, start: int, end: int) -> None:
+        rate = self.server.bytes_per_second
+        began = time.monotonic()
+        sent = 0
+        with open(path, "rb") as f:
+            f.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                chunk = f.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+                sent += len(chunk)
+                remaining -= len(chunk)
+                if rate:
+                    delay = sent / rate - (time.monotonic() - began)
+                    if delay > 0:
+                        time.sleep(delay)
+
+    def do_HEAD(self):
+        self._respond(send_body=False)
+
+    def do_GET(self):
+        self._respond(send_body=True)
+
+
+class RangeServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server for a directory, usable as a context manager.
+
+    Example:
+        with RangeServer("/tmp/storage", bytes_per_second=20_000_000) as server:
+            backend = HTTPStorageBackend(server.url)
+    """
+
+    daemon_threads = True
+
+    def __init__(self, root: str, port: int = 0, bytes_per_second: Optional[float] = None):
+        """
+        Initialize server on localhost.
+
+        Args:
+            root: Directory holding <bucket>/<path> objects
+            port: Port to listen on (any free port if 0)
+            bytes_per_second: Bandwidth cap per connection, or None for unlimited
+        """
+        super().__init__(("127.0.0.1", port), _RangeRequestHandler)
+        self.root = Path(root).resolve()
+        self.bytes_per_second = bytes_per_second
+        self.full_requests = 0
+        self.range_requests = 0
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def record(self, ranged: bool) -> None:
+        with self._lock:
+            if ranged:
+                self.range_requests += 1
+            else:
+                self.full_requests += 1
+
+    def start(self) -> "RangeServer":
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> "RangeServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+if __name__ == "__main__":
+    server = RangeServer(sys.argv[1], port=int(sys.argv[2]) if len(sys.argv) > 2 else 8765)
+    print(f"Serving {server.root} at {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
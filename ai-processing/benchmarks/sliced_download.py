@@ -0,0 +1,71 @@
+"""
+Benchmark: single-stream vs sliced parallel download of large uploads.
+
+Serves generated files from a local range-capable stand-in server with a
+per-connection bandwidth cap (object stores throttle single streams well below
+the link rate), then downloads each one whole and in 2..N parallel slices.
+
+Usage (from ai-processing/):
+    python -m benchmarks.sliced_download [SIZE_MB ...] [--mbps PER_STREAM_MB_PER_SECOND]
+"""
+
+import argparse
+import hashlib
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from benchmarks.range_server import RangeServer
+from src.ingestion.storage_backend import HTTPStorageBackend, SpooledFile
+
+BUCKET = "uploads"
+SLICE_COUNTS = [2, 4, 8]
+
+
+def _timed(download: Callable[[], SpooledFile], expected_md5: str) -> float:
+    started = time.perf_counter()
+    spool = download()
+    elapsed = time.perf_counter() - started
+    try:
+        digest = hashlib.md5(Path(spool.path).read_bytes()).hexdigest()
+        if digest != expected_md5:
+            raise AssertionError("Downloaded file does not match the original")
+    finally:
+        spool.close()
+    return elapsed
+
+
+def main(sizes_mb: List[int], mb_per_second: float) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        (Path(root) / BUCKET).mkdir()
+        with RangeServer(root, bytes_per_second=mb_per_second * 1024 * 1024) as server:
+            backend = HTTPStorageBackend(server.url)
+            print(
+                f"{'size':>8} {'single':>9}" + "".join(f" {n:>2} slices    " for n in SLICE_COUNTS)
+            )
+            for size_mb in sizes_mb:
+                name = f"file-{size_mb}mb.bin"
+                data = os.urandom(size_mb * 1024 * 1024)
+                (Path(root) / BUCKET / name).write_bytes(data)
+                md5 = hashlib.md5(data).hexdigest()
+                info = backend.stat(BUCKET, name)
+
+                # max_memory_bytes=1 spools to disk like every large upload
+                single = _timed(lambda: backend.download(BUCKET, name, max_memory_bytes=1), md5)
+                row = f"{size_mb:>6}MB {single:>8.2f}s"
+                for slices in SLICE_COUNTS:
+                    sliced = _timed(
+                        lambda: backend.download_sliced(BUCKET, name, info, slices), md5
+                    )
+                    row += f" {sliced:>7.2f}s {single / sliced:>4.1f}x"
+                print(row)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("sizes_mb", nargs="*", type=int, default=[32, 64, 128])
+    parser.add_argument("--mbps", type=float, default=25.0)
+    args = parser.parse_args()
+    main(args.sizes_mb, args.mbps)
@@ -9,6 +9,7 @@ from src.config.env import load_env_config
 from src.models.audience import Audience
 from src.models.base import CitationDetail
 from src.utils.logger import get_logger
+from src.utils.tool_schemas import AUDIENCE_TOOL, tool_choice, tool_input
 
 logger = get_logger(__name__)
 env = load_env_config()
@@ -37,6 +38,8 @@ def identify_audiences(
             content_text += f"Homepage: {scraped['homepage'].get('text', '')}\n\n"
         if "about_page" in scraped:
             content_text += f"About Page: {scraped['about_page'].get('text', '')}\n\n"
+        for page in scraped.get("additional_pages") or []:
+            content_text += f"Page {page.get('url', '')}: {page.get('text', '')}\n\n"
 
     if "uploaded_content" in content:
         for file_content in content["uploaded_content"]:
@@ -63,14 +66,15 @@ def identify_audiences(
 4. Provide rationale for why this audience was identified
 5. Include citations (quotes) from the content that support this audience identification
 
-Return a JSON array of audiences with: id (UUID), description,
-specificity_score, source, rationale, citations (array with quote and source).
+Record the audiences with the record_audiences tool.
 """
 
     try:
         response = client.messages.create(
             model="claude-sonnet-4-5",
             max_tokens=2000,
+            tools=[AUDIENCE_TOOL],
+            tool_choice=tool_choice(AUDIENCE_TOOL),
             messages=[
                 {
                     "role": "user",
@@ -78,46 +82,21 @@ specificity_score, source, rationale, citations (array with quote and source).
                 }
             ],
         )
-
-        # Parse response (simplified - in production, use structured output)
-        response_text = response.content[0].text
-
-        # Extract JSON from response (simplified parsing)
-        import json
-        import re
-
-        # Try to find JSON array in response
-        json_match = re.search(r"\[.*\]", response_text, re.DOTALL)
-        if json_match:
-            audiences_data = json.loads(json_match.group())
-        else:
-            # Fallback: create default audience
-            audiences_data = [
-                {
-                    "description": user_provided_audience or "General audience",
-                    "specificity_score": 50,
-                    "source": "user_provided" if user_provided_audience else "content_analysis",
-                    "rationale": "Identified from content analysis",
-                }
-            ]
+        audiences_data = tool_input(response, AUDIENCE_TOOL)["audiences"]
 
         # Convert to Audience objects and format output
         audiences = []
         for aud_data in audiences_data:
             audience = Audience(
                 id=str(uuid.uuid4()),
-                description=aud_data.get("description", "Unknown audience"),
-                specificity_score=aud_data.get("specificity_score", 50),
-                source=aud_data.get("source", "content_analysis"),
+                description=aud_data["description"],
+                specificity_score=aud_data["specificity_score"],
+                source=aud_data["source"],
                 rationale=aud_data.get("rationale"),
-                citations=(
-                    [
-                        CitationDetail(quote=c["quote"], source=c.get("source", "content"))
-                        for c in aud_data.get("citations", [])
-                    ]
-                    if aud_data.get("citations")
-                    else []
-                ),
+                citations=[
+                    CitationDetail(quote=c["quote"], source=c["source"])
+                    for c in aud_data.get("citations", [])
+                ],
             )
             audiences.append(audience)
 
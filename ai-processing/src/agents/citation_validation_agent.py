@@ -1,30 +1,28 @@
 """Citation Validation Agent - Validates all citations against source material."""
 
 from datetime import datetime, UTC
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from difflib import SequenceMatcher
 
 from src.utils.logger import get_logger
+from src.utils.semantic_index import SentenceIndex
 
 logger = get_logger(__name__)
 
+FUZZY_SIMILARITY_THRESHOLD = 0.85
+# Share of a quote's word and n-gram weight that must appear in one source
+# sentence window that does not contradict it. A quote of five or more content
+# words still passes with one word reworded; shorter quotes must match closely.
+SEMANTIC_SIMILARITY_THRESHOLD = 0.75
+
 
 def similarity(a: str, b: str) -> float:
     """Calculate similarity ratio between two strings."""
     return SequenceMatcher(None, a.lower(), b.lower()).ratio()
 
 
-def validate_citation(quote: str, source_text: str) -> Dict[str, Any]:
-    """
-    Validate a single citation using multi-stage validation.
-
-    Args:
-        quote: The quote to validate
-        source_text: Source text to search in
-
-    Returns:
-        Dictionary with validation results
-    """
+def _match_exact_or_fuzzy(quote: str, source_text: str) -> Optional[Dict[str, Any]]:
+    """Run the exact and fuzzy stages. Returns None if neither validates the quote."""
     quote_clean = quote.strip()
     source_lower = source_text.lower()
 
@@ -34,7 +32,7 @@ def validate_citation(quote: str, source_text: str) -> Dict[str, Any]:
             "quote": quote,
             "validated": True,
             "method": "exact",
-            "location": source_text.lower().find(quote_clean.lower()),
+            "location": source_lower.find(quote_clean.lower()),
         }
 
     # Stage 2: Fuzzy match (85%+ similarity)
@@ -47,7 +45,7 @@ def validate_citation(quote: str, source_text: str) -> Dict[str, Any]:
         if sim > best_similarity:
             best_similarity = sim
 
-    if best_similarity >= 0.85:
+    if best_similarity >= FUZZY_SIMILARITY_THRESHOLD:
         return {
             "quote": quote,
             "validated": True,
@@ -55,41 +53,106 @@ def validate_citation(quote: str, source_text: str) -> Dict[str, Any]:
             "similarity": best_similarity,
         }
 
-    # Stage 3: Semantic validation would go here (using embeddings)
-    # For now, reject if exact and fuzzy both fail
-    return {
-        "quote": quote,
-        "validated": False,
-        "error": "Quote not found in source material",
-    }
+    return None
+
+
+def _semantic_results(
+    quotes: List[str], index: SentenceIndex, semantic_threshold: float
+) -> List[Dict[str, Any]]:
+    """Stage 3: score all quotes against the source index in one batch."""
+    results = []
+    for quote, (score, location) in zip(quotes, index.best_matches(quotes)):
+        if score >= semantic_threshold:
+            results.append(
+                {
+                    "quote": quote,
+                    "validated": True,
+                    "method": "semantic",
+                    "similarity": min(score, 1.0),
+                    "location": location,
+                }
+            )
+        else:
+            results.append(
+                {
+                    "quote": quote,
+                    "validated": False,
+                    "error": "Quote not found in source material",
+                }
+            )
+    return results
+
+
+def validate_citation(
+    quote: str,
+    source_text: str,
+    semantic_threshold: float = SEMANTIC_SIMILARITY_THRESHOLD,
+) -> Dict[str, Any]:
+    """
+    Validate a single citation using multi-stage validation.
+
+    Args:
+        quote: The quote to validate
+        source_text: Source text to search in
+        semantic_threshold: Minimum similarity score for the semantic stage
+
+    Returns:
+        Dictionary with validation results
+    """
+    result = _match_exact_or_fuzzy(quote, source_text)
+    if result:
+        return result
+
+    # Stage 3: Semantic match against sentence windows (paraphrased quotes)
+    return _semantic_results([quote], SentenceIndex(source_text), semantic_threshold)[0]
+
+
+def extract_source_text(source_content: Dict[str, Any]) -> str:
+    """
+    Concatenate all scraped and uploaded text that citations are checked against.
+
+    Uploads are read as parsed, before near-duplicates were collapsed for the agents.
+    """
+    source_text = ""
+    scraped = source_content.get("scraped_content") or {}
+    if "homepage" in scraped:
+        source_text += scraped["homepage"].get("text", "")
+    if "about_page" in scraped:
+        source_text += scraped["about_page"].get("text", "")
+    for page in scraped.get("additional_pages") or []:
+        source_text += page.get("text", "")
+
+    uploads = source_content.get("original_uploaded_content") or source_content.get(
+        "uploaded_content"
+    )
+    for file_content in uploads or []:
+        source_text += file_content.get("text", "")
+
+    return source_text
 
 
 def validate_citations(
-    all_agent_outputs: Dict[str, Any], source_content: Dict[str, Any]
+    all_agent_outputs: Dict[str, Any],
+    source_content: Dict[str, Any],
+    semantic_threshold: float = SEMANTIC_SIMILARITY_THRESHOLD,
+    source_index: Optional[SentenceIndex] = None,
 ) -> Dict[str, Any]:
     """
     Validate all citations in agent outputs against source content.
 
+    Quotes that fail the exact and fuzzy stages are scored together by the
+    semantic stage, so the source sentence index is built only once.
+
     Args:
         all_agent_outputs: Dictionary of all agent outputs
         source_content: Source content dictionary
+        semantic_threshold: Minimum similarity score for the semantic stage
+        source_index: Prebuilt index of the source text, reused across calls
 
     Returns:
         Dictionary with validated citations
     """
-    # Extract all source text
-    source_text = ""
-    if "scraped_content" in source_content:
-        scraped = source_content["scraped_content"]
-        if "homepage" in scraped:
-            source_text += scraped["homepage"].get("text", "")
-        if "about_page" in scraped:
-            source_text += scraped["about_page"].get("text", "")
-
-    if "uploaded_content" in source_content:
-        for file_content in source_content["uploaded_content"]:
-            source_text += file_content.get("text", "")
-
+    source_text = extract_source_text(source_content)
     validated_citations = []
 
     # Extract citations from all agent outputs
@@ -108,18 +171,30 @@ def validate_citations(
 
     all_citations = extract_citations(all_agent_outputs)
 
-    # Validate each citation
+    # Validate each citation (exact and fuzzy stages)
+    unresolved = []
     for citation in all_citations:
         quote = citation.get("quote", "")
         if quote:
-            validation_result = validate_citation(quote, source_text)
+            validation_result = _match_exact_or_fuzzy(quote, source_text)
+            if validation_result is None:
+                unresolved.append(len(validated_citations))
             validated_citations.append(
                 {
                     **citation,
-                    **validation_result,
+                    **(validation_result or {}),
                 }
             )
 
+    # Stage 3: semantic validation of all remaining quotes in a single batch
+    if unresolved:
+        index = source_index or SentenceIndex(source_text)
+        quotes = [validated_citations[i]["quote"] for i in unresolved]
+        for i, semantic_result in zip(
+            unresolved, _semantic_results(quotes, index, semantic_threshold)
+        ):
+            validated_citations[i].update(semantic_result)
+
     return {
         "agent_name": "citation_validation_agent",
         "timestamp": datetime.now(UTC).isoformat(),
@@ -6,6 +6,7 @@ from anthropic import Anthropic
 
 from src.config.env import load_env_config
 from src.utils.logger import get_logger
+from src.utils.tool_schemas import CLARITY_TOOL, tool_choice, tool_input
 
 logger = get_logger(__name__)
 env = load_env_config()
@@ -32,6 +33,8 @@ def evaluate_clarity(audience: Dict[str, Any], content: Dict[str, Any]) -> Dict[
             content_text += f"Homepage: {scraped['homepage'].get('text', '')}\n\n"
         if "about_page" in scraped:
             content_text += f"About Page: {scraped['about_page'].get('text', '')}\n\n"
+        for page in scraped.get("additional_pages") or []:
+            content_text += f"Page {page.get('url', '')}: {page.get('text', '')}\n\n"
 
     if "uploaded_content" in content:
         for file_content in content["uploaded_content"]:
@@ -55,39 +58,18 @@ For each dimension, provide:
 - A textual assessment
 - Citations (quotes) from the content that support your assessment
 
-Return JSON with assessments object containing what_they_do,
-how_theyre_different, and who_uses_them, each with score, assessment,
-and citations array.
+Record your assessment with the record_clarity_assessment tool.
 """
 
     try:
         response = client.messages.create(
             model="claude-sonnet-4-5",
             max_tokens=2000,
+            tools=[CLARITY_TOOL],
+            tool_choice=tool_choice(CLARITY_TOOL),
             messages=[{"role": "user", "content": prompt}],
         )
-
-        response_text = response.content[0].text
-
-        # Parse response (simplified)
-        import json
-        import re
-
-        json_match = re.search(r"\{.*\}", response_text, re.DOTALL)
-        if json_match:
-            parsed_data = json.loads(json_match.group())
-            # Handle nested structure: if AI returns {"assessments": {...}}, extract it
-            if "assessments" in parsed_data and isinstance(parsed_data["assessments"], dict):
-                assessments_data = parsed_data["assessments"]
-            else:
-                assessments_data = parsed_data
-        else:
-            # Default assessments
-            assessments_data = {
-                "what_they_do": {"score": 50, "assessment": "Default assessment"},
-                "how_theyre_different": {"score": 50, "assessment": "Default assessment"},
-                "who_uses_them": {"score": 50, "assessment": "Default assessment"},
-            }
+        assessments_data = tool_input(response, CLARITY_TOOL)
 
         return {
             "agent_name": "clarity_agent",
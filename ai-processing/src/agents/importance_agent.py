@@ -6,6 +6,7 @@ from anthropic import Anthropic
 
 from src.config.env import load_env_config
 from src.utils.logger import get_logger
+from src.utils.tool_schemas import IMPORTANCE_TOOL, tool_choice, tool_input
 
 logger = get_logger(__name__)
 env = load_env_config()
@@ -28,32 +29,28 @@ def evaluate_importance(audience: Dict[str, Any], content: Dict[str, Any]) -> Di
 
 Content: {content_text[:10000]}
 
-Assess the importance and relevance. Provide score (0-100) and assessment.
+Assess the importance and relevance. Record your assessment with the
+record_importance_assessment tool, quoting the content as evidence for each stake.
 """
 
     try:
         response = client.messages.create(
             model="claude-sonnet-4-5",
             max_tokens=1500,
+            tools=[IMPORTANCE_TOOL],
+            tool_choice=tool_choice(IMPORTANCE_TOOL),
             messages=[{"role": "user", "content": prompt}],
         )
-
-        import json
-        import re
-
-        response_text = response.content[0].text
-        json_match = re.search(r"\{.*\}", response_text, re.DOTALL)
-        if json_match:
-            data = json.loads(json_match.group())
-        else:
-            data = {"score": 50, "assessment": "Default assessment"}
+        data = tool_input(response, IMPORTANCE_TOOL)
 
         return {
             "agent_name": "importance_agent",
             "audience_id": audience.get("id"),
             "timestamp": datetime.now(UTC).isoformat(),
-            "assessment": data.get("assessment", "Default"),
-            "score": data.get("score", 50),
+            "assessment": data["overall_assessment"],
+            "score": data["stakes_clarity_score"],
+            "stakes_identified": data.get("stakes_identified", []),
+            "weaknesses": data.get("weaknesses", []),
         }
     except Exception as e:
         logger.error(
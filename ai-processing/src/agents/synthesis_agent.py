@@ -79,7 +79,9 @@ def _transform_report_for_pdf(report_data: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def generate_report(
-    all_agent_outputs: Dict[str, Any], failed_agents: Optional[list[str]] = None
+    all_agent_outputs: Dict[str, Any],
+    failed_agents: Optional[list[str]] = None,
+    sampling_notes: Optional[list[str]] = None,
 ) -> Dict[str, Any]:
     """
     Generate final evaluation report from all agent outputs.
@@ -87,6 +89,7 @@ def generate_report(
     Args:
         all_agent_outputs: Dictionary of all agent outputs
         failed_agents: Optional list of agent names that failed (for noting limitations)
+        sampling_notes: Optional notes on uploads that were only partly parsed
 
     Returns:
         Dictionary with report content
@@ -116,6 +119,11 @@ Validated Citations: {validated_citations}
             f"Please note these limitations in the report and indicate which sections "
             f"may be incomplete or missing."
         )
+    if sampling_notes:
+        limitations_note += (
+            "\n\nNOTE: Some uploaded documents were too large to read in full and were "
+            f"sampled: {'; '.join(sampling_notes)}. Mention this in the report."
+        )
 
     prompt = f"""Generate a brutally honest evaluation report based on these agent assessments.
 
@@ -265,6 +273,11 @@ Return the report content as a structured text.
             result["limitations"]["failed_agents"] = failed_agents
             result["limitations"]["note"] = note
 
+        if sampling_notes:
+            if "limitations" not in result:
+                result["limitations"] = {}
+            result["limitations"]["sampled_documents"] = sampling_notes
+
         return result
     except Exception as e:
         logger.error(
@@ -6,6 +6,7 @@ from anthropic import Anthropic
 
 from src.config.env import load_env_config
 from src.utils.logger import get_logger
+from src.utils.tool_schemas import TECHNICAL_LEVEL_TOOL, tool_choice, tool_input
 
 logger = get_logger(__name__)
 env = load_env_config()
@@ -30,32 +31,29 @@ def evaluate_technical_level(audience: Dict[str, Any], content: Dict[str, Any])
 Content: {content_text[:10000]}
 
 Assess if content is: too technical, too vague, or appropriately matched for this audience.
-Provide score (0-100), assessment text, and citations.
+Record your assessment with the record_technical_level_assessment tool, quoting
+the content as evidence for each mismatch.
 """
 
     try:
         response = client.messages.create(
             model="claude-sonnet-4-5",
             max_tokens=1500,
+            tools=[TECHNICAL_LEVEL_TOOL],
+            tool_choice=tool_choice(TECHNICAL_LEVEL_TOOL),
             messages=[{"role": "user", "content": prompt}],
         )
-
-        import json
-        import re
-
-        response_text = response.content[0].text
-        json_match = re.search(r"\{.*\}", response_text, re.DOTALL)
-        if json_match:
-            data = json.loads(json_match.group())
-        else:
-            data = {"score": 50, "assessment": "Default assessment"}
+        data = tool_input(response, TECHNICAL_LEVEL_TOOL)
 
         return {
             "agent_name": "technical_level_agent",
             "audience_id": audience.get("id"),
             "timestamp": datetime.now(UTC).isoformat(),
-            "assessment": data.get("assessment", "Default"),
-            "score": data.get("score", 50),
+            "assessment": data["overall_assessment"],
+            "score": data["technical_alignment_score"],
+            "audience_technical_level": data["audience_technical_level"],
+            "content_technical_level": data["content_technical_level"],
+            "mismatches": data.get("mismatches", []),
         }
     except Exception as e:
         logger.error(
@@ -6,6 +6,7 @@ from anthropic import Anthropic
 
 from src.config.env import load_env_config
 from src.utils.logger import get_logger
+from src.utils.tool_schemas import VIVIDNESS_TOOL, tool_choice, tool_input
 
 logger = get_logger(__name__)
 env = load_env_config()
@@ -29,36 +30,28 @@ def evaluate_vividness(content: Dict[str, Any]) -> Dict[str, Any]:
 Content: {content_text[:10000]}
 
 Assess: vivid vs generic language, memorability, storytelling presence.
-Return: overall_assessment (vivid/generic/mixed), score (0-100), findings.
+Record your assessment with the record_vividness_assessment tool.
 """
 
     try:
         response = client.messages.create(
             model="claude-sonnet-4-5",
             max_tokens=1500,
+            tools=[VIVIDNESS_TOOL],
+            tool_choice=tool_choice(VIVIDNESS_TOOL),
             messages=[{"role": "user", "content": prompt}],
         )
-
-        import json
-        import re
-
-        response_text = response.content[0].text
-        json_match = re.search(r"\{.*\}", response_text, re.DOTALL)
-        if json_match:
-            data = json.loads(json_match.group())
-        else:
-            data = {
-                "overall_assessment": "mixed",
-                "score": 50,
-                "findings": {},
-            }
+        data = tool_input(response, VIVIDNESS_TOOL)
 
         return {
             "agent_name": "vividness_storytelling_assessment",
             "timestamp": datetime.now(UTC).isoformat(),
-            "overall_assessment": data.get("overall_assessment", "mixed"),
-            "score": data.get("score", 50),
-            "findings": data.get("findings", {}),
+            "overall_assessment": data["overall_assessment"],
+            "score": data["vividness_score"],
+            "findings": {
+                "vivid_elements": data.get("vivid_elements", []),
+                "missed_opportunities": data.get("missed_opportunities", []),
+            },
         }
     except Exception as e:
         logger.error(f"Error in vividness evaluation: {e}", exc_info=True)
@@ -6,6 +6,7 @@ from anthropic import Anthropic
 
 from src.config.env import load_env_config
 from src.utils.logger import get_logger
+from src.utils.tool_schemas import VOICE_TOOL, tool_choice, tool_input
 
 logger = get_logger(__name__)
 env = load_env_config()
@@ -31,36 +32,28 @@ def evaluate_voice(content: Dict[str, Any]) -> Dict[str, Any]:
 Content: {content_text[:10000]}
 
 Assess: distinct voice, personality indicators, values/principles, tone consistency.
-Return: overall_assessment (distinct/generic/mixed), score (0-100), and findings.
+Record your assessment with the record_voice_assessment tool.
 """
 
     try:
         response = client.messages.create(
             model="claude-sonnet-4-5",
             max_tokens=1500,
+            tools=[VOICE_TOOL],
+            tool_choice=tool_choice(VOICE_TOOL),
             messages=[{"role": "user", "content": prompt}],
         )
-
-        import json
-        import re
-
-        response_text = response.content[0].text
-        json_match = re.search(r"\{.*\}", response_text, re.DOTALL)
-        if json_match:
-            data = json.loads(json_match.group())
-        else:
-            data = {
-                "overall_assessment": "mixed",
-                "score": 50,
-                "findings": {},
-            }
+        data = tool_input(response, VOICE_TOOL)
 
         return {
             "agent_name": "voice_agent",
             "timestamp": datetime.now(UTC).isoformat(),
-            "overall_assessment": data.get("overall_assessment", "mixed"),
-            "score": data.get("score", 50),
-            "findings": data.get("findings", {}),
+            "overall_assessment": data["overall_assessment"],
+            "score": data["voice_consistency_score"],
+            "findings": {
+                "dominant_voice_characteristics": data["dominant_voice_characteristics"],
+                "voice_patterns": data.get("voice_patterns", []),
+            },
         }
     except Exception as e:
         logger.error(f"Error in voice evaluation: {e}", exc_info=True)
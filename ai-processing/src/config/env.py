@@ -2,7 +2,7 @@
 
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 from pydantic import BaseModel, Field, field_validator
 
 # Load .env file from project root (ai-processing directory) if it exists
@@ -32,6 +32,59 @@ class EnvConfig(BaseModel):
     cors_allowed_origins: Optional[str] = Field(
         None, description="Comma-separated list of allowed CORS origins (default: *)"
     )
+    local_storage_root: Optional[str] = Field(
+        None, description="Read uploads from <root>/<bucket>/<path> instead of Cloud Storage"
+    )
+    download_slice_threshold_mb: int = Field(
+        32, description="Uploads at least this large are downloaded in parallel byte ranges"
+    )
+    download_slices: int = Field(8, description="Parallel byte ranges per sliced download")
+    pdf_parallel_page_threshold: int = Field(
+        100, description="PDFs with at least this many pages are parsed in parallel page ranges"
+    )
+    pptx_parallel_slide_threshold: int = Field(
+        40, description="PPTX files with at least this many slides are parsed in parallel"
+    )
+    parse_budget_mode: Literal["sample", "stop", "off"] = Field(
+        "sample",
+        description='Oversized documents: "sample" pages, "stop" at the word budget, or "off"',
+    )
+    parse_word_budget: int = Field(30000, description="Words read before an early stop")
+    parse_sample_threshold: int = Field(
+        200, description="Pages or slides above which documents are sampled"
+    )
+    deduplicate_content: bool = Field(
+        True, description="Collapse uploads and paragraphs that repeat earlier content"
+    )
+    content_quality_gate: bool = Field(
+        True, description="Reject parked, placeholder and text-less content before the agents"
+    )
+    parse_cache_dir: Optional[str] = Field(
+        None, description="Directory for cached parsed uploads (disabled if unset)"
+    )
+    parse_cache_ttl_seconds: int = Field(
+        30 * 24 * 3600, description="Maximum age of a cached parsed upload"
+    )
+    parse_cache_max_mb: int = Field(512, description="Size limit of the parse cache in MB")
+    scrape_cache_dir: Optional[str] = Field(
+        None, description="Directory for the scrape cache (unset disables caching)"
+    )
+    scrape_cache_ttl_seconds: int = Field(
+        7 * 24 * 3600, description="Maximum age of a scrape cache entry in seconds"
+    )
+    scrape_cache_max_mb: int = Field(256, description="Size limit of the scrape cache in MB")
+    scrape_crawl_max_pages: int = Field(
+        0, description="Extra pages to crawl beyond homepage and About page (0 disables)"
+    )
+    scrape_worker_processes: int = Field(
+        0, description="Scraper worker processes (0 scrapes in the API process)"
+    )
+    scrape_worker_max_rss_mb: int = Field(
+        1024, description="Memory of a scraper worker and its browser before it is recycled"
+    )
+    scrape_job_timeout_seconds: float = Field(
+        90.0, description="Time limit for one scrape in a worker process"
+    )
 
     @field_validator("anthropic_api_key")
     @classmethod
@@ -40,6 +93,13 @@ class EnvConfig(BaseModel):
             raise ValueError("ANTHROPIC_API_KEY must be set to a valid API key")
         return v
 
+    @field_validator("scrape_job_timeout_seconds")
+    @classmethod
+    def validate_scrape_job_timeout(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError(f"SCRAPE_JOB_TIMEOUT_SECONDS must be positive, got: {v}")
+        return v
+
     @field_validator("firestore_project_id", "gcp_project_id")
     @classmethod
     def validate_project_id(cls, v: str) -> str:
@@ -58,6 +118,26 @@ def load_env_config() -> EnvConfig:
         cloud_storage_bucket=os.getenv("CLOUD_STORAGE_BUCKET", ""),
         gcp_project_id=os.getenv("GCP_PROJECT_ID", ""),
         cors_allowed_origins=os.getenv("CORS_ALLOWED_ORIGINS"),
+        local_storage_root=os.getenv("LOCAL_STORAGE_ROOT"),
+        download_slice_threshold_mb=int(os.getenv("DOWNLOAD_SLICE_THRESHOLD_MB", "32")),
+        download_slices=int(os.getenv("DOWNLOAD_SLICES", "8")),
+        pdf_parallel_page_threshold=int(os.getenv("PDF_PARALLEL_PAGE_THRESHOLD", "100")),
+        pptx_parallel_slide_threshold=int(os.getenv("PPTX_PARALLEL_SLIDE_THRESHOLD", "40")),
+        parse_budget_mode=os.getenv("PARSE_BUDGET_MODE", "sample").lower(),
+        parse_word_budget=int(os.getenv("PARSE_WORD_BUDGET", "30000")),
+        parse_sample_threshold=int(os.getenv("PARSE_SAMPLE_THRESHOLD", "200")),
+        deduplicate_content=os.getenv("DEDUPLICATE_CONTENT", "true").lower() == "true",
+        content_quality_gate=os.getenv("CONTENT_QUALITY_GATE", "true").lower() == "true",
+        parse_cache_dir=os.getenv("PARSE_CACHE_DIR"),
+        parse_cache_ttl_seconds=int(os.getenv("PARSE_CACHE_TTL_SECONDS", str(30 * 24 * 3600))),
+        parse_cache_max_mb=int(os.getenv("PARSE_CACHE_MAX_MB", "512")),
+        scrape_cache_dir=os.getenv("SCRAPE_CACHE_DIR"),
+        scrape_cache_ttl_seconds=int(os.getenv("SCRAPE_CACHE_TTL_SECONDS", str(7 * 24 * 3600))),
+        scrape_cache_max_mb=int(os.getenv("SCRAPE_CACHE_MAX_MB", "256")),
+        scrape_crawl_max_pages=int(os.getenv("SCRAPE_CRAWL_MAX_PAGES", "0")),
+        scrape_worker_processes=int(os.getenv("SCRAPE_WORKER_PROCESSES", "0")),
+        scrape_worker_max_rss_mb=int(os.getenv("SCRAPE_WORKER_MAX_RSS_MB", "1024")),
+        scrape_job_timeout_seconds=float(os.getenv("SCRAPE_JOB_TIMEOUT_SECONDS", "90")),
     )
 
 
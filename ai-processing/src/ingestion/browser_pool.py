@@ -0,0 +1,254 @@
+"""Long-lived pool of warm Chromium browsers for the web scraper."""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from playwright.sync_api import Browser, BrowserContext, Playwright, sync_playwright
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_POOL_SIZE = 2
+# Chromium slowly accumulates memory across contexts; relaunch after this many.
+DEFAULT_MAX_CONTEXTS_PER_BROWSER = 50
+
+
+class BrowserPoolClosedError(Exception):
+    """Exception raised when a job is submitted to a pool that has been shut down."""
+
+    pass
+
+
+class _BrowserSlot:
+    """One pooled browser, owned by a single worker thread."""
+
+    def __init__(self, pool: "BrowserPool", slot_id: int):
+        self.pool = pool
+        self.slot_id = slot_id
+        self.playwright: Optional[Playwright] = None
+        self.browser: Optional[Browser] = None
+        self.contexts_served = 0
+
+    def _launch(self) -> Browser:
+        if self.playwright is None:
+            self.playwright = sync_playwright().start()
+        self.browser = self.playwright.chromium.launch(**self.pool.launch_options)
+        self.contexts_served = 0
+        self.pool._increment("browsers_launched")
+        logger.info("Launched pooled browser", {"slot": self.slot_id})
+        return self.browser
+
+    def _close_browser(self) -> None:
+        if self.browser is not None:
+            try:
+                self.browser.close()
+            except Exception as e:
+                logger.warning(f"Error closing pooled browser: {e}", {"slot": self.slot_id})
+            self.browser = None
+
+    def acquire_browser(self) -> Browser:
+        """Return a healthy browser, relaunching or recycling as needed."""
+        if self.browser is not None and not self.browser.is_connected():
+            logger.warning("Pooled browser disconnected, relaunching", {"slot": self.slot_id})
+            self.pool._increment("health_check_failures")
+            self.browser = None
+        elif (
+            self.browser is not None and self.contexts_served >= self.pool.max_contexts_per_browser
+        ):
+            logger.info(
+                "Recycling pooled browser",
+                {"slot": self.slot_id, "contexts_served": self.contexts_served},
+            )
+            self.pool._increment("browsers_recycled")
+            self._close_browser()
+
+        return self.browser or self._launch()
+
+    def run_job(self, job: Callable[[BrowserContext], Any], deadline: Optional[float]) -> Any:
+        browser = self.acquire_browser()
+        context = browser.new_context()
+        self.contexts_served += 1
+        self.pool._increment("contexts_created")
+        self.pool._adjust("active_contexts", 1)
+        if deadline is not None:
+            # Playwright objects belong to this thread, so a job that outlives its
+            # caller's timeout cannot be closed from outside; instead every
+            # navigation and wait in the context fails once the deadline passes
+            # (at least 1 ms: Playwright reads 0 as no timeout).
+            context.set_default_timeout(max((deadline - time.monotonic()) * 1000, 1))
+        try:
+            return job(context)
+        finally:
+            self.pool._adjust("active_contexts", -1)
+            try:
+                context.close()
+            except Exception as e:
+                logger.warning(f"Error closing browser context: {e}", {"slot": self.slot_id})
+            if deadline is not None and time.monotonic() > deadline:
+                # The timed-out page may have left Chromium wedged; start fresh
+                logger.warning("Recycling pooled browser after job timeout", {"slot": self.slot_id})
+                self.pool._increment("browsers_recycled")
+                self._close_browser()
+
+    def close(self) -> None:
+        self._close_browser()
+        if self.playwright is not None:
+            try:
+                self.playwright.stop()
+            except Exception as e:
+                logger.warning(f"Error stopping Playwright: {e}", {"slot": self.slot_id})
+            self.playwright = None
+
+
+class BrowserPool:
+    """
+    Pool of warm headless Chromium browsers.
+
+    Playwright's sync API is bound to the thread that started it, so each browser
+    lives on its own worker thread and jobs are executed there. Every job gets a
+    fresh, isolated BrowserContext that is closed when the job returns.
+    """
+
+    def __init__(
+        self,
+        size: int = DEFAULT_POOL_SIZE,
+        max_contexts_per_browser: int = DEFAULT_MAX_CONTEXTS_PER_BROWSER,
+        launch_options: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Initialize browser pool. Browsers are launched lazily on first use.
+
+        Args:
+            size: Number of browsers (and worker threads)
+            max_contexts_per_browser: Contexts served before a browser is recycled
+            launch_options: Keyword arguments for chromium.launch()
+        """
+        if size < 1:
+            raise ValueError("Browser pool size must be at least 1")
+
+        self.size = size
+        self.max_contexts_per_browser = max_contexts_per_browser
+        self.launch_options = launch_options or {"headless": True}
+
+        self._jobs: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._threads: list[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._metrics: Dict[str, int] = {
+            "jobs_submitted": 0,
+            "jobs_completed": 0,
+            "jobs_failed": 0,
+            "jobs_timed_out": 0,
+            "browsers_launched": 0,
+            "browsers_recycled": 0,
+            "health_check_failures": 0,
+            "contexts_created": 0,
+            "active_contexts": 0,
+        }
+
+    def _increment(self, name: str) -> None:
+        self._adjust(name, 1)
+
+    def _adjust(self, name: str, delta: int) -> None:
+        with self._lock:
+            self._metrics[name] += delta
+
+    def _start_workers(self) -> None:
+        # Called with self._lock held
+        if self._threads:
+            return
+        for slot_id in range(self.size):
+            thread = threading.Thread(
+                target=self._worker,
+                args=(_BrowserSlot(self, slot_id),),
+                name=f"browser-pool-{slot_id}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def _worker(self, slot: _BrowserSlot) -> None:
+        try:
+            while True:
+                item = self._jobs.get()
+                if item is None:
+                    break
+                job, future, deadline = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(slot.run_job(job, deadline))
+                    self._increment("jobs_completed")
+                except BaseException as e:
+                    self._increment("jobs_failed")
+                    future.set_exception(e)
+        finally:
+            slot.close()
+
+    def submit(
+        self, job: Callable[[BrowserContext], T], timeout: Optional[float] = None
+    ) -> "Future[T]":
+        """
+        Queue a job that receives a fresh BrowserContext.
+
+        Args:
+            job: Callable run on a pool thread with the context
+            timeout: Seconds from now after which the context's Playwright calls fail
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        future: "Future[T]" = Future()
+        with self._lock:
+            if self._closed:
+                raise BrowserPoolClosedError("Browser pool has been shut down")
+            self._start_workers()
+            self._metrics["jobs_submitted"] += 1
+        self._jobs.put((job, future, deadline))
+        return future
+
+    def run(self, job: Callable[[BrowserContext], T], timeout: Optional[float] = None) -> T:
+        """
+        Run a job on a pooled browser and wait for its result.
+
+        On timeout a queued job is cancelled; a running one has its Playwright
+        calls fail at the same deadline, which frees its slot, and the slot's
+        browser is then recycled.
+
+        Raises:
+            concurrent.futures.TimeoutError: If no result within timeout seconds
+            Any exception raised by the job
+        """
+        future = self.submit(job, timeout)
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            future.cancel()
+            self._increment("jobs_timed_out")
+            raise
+
+    def metrics(self) -> Dict[str, int]:
+        """Return a snapshot of pool metrics."""
+        with self._lock:
+            snapshot = dict(self._metrics)
+            snapshot["pool_size"] = self.size
+            snapshot["queued_jobs"] = self._jobs.qsize()
+        return snapshot
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Close all browsers once queued jobs have finished."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            threads = list(self._threads)
+        for _ in threads:
+            self._jobs.put(None)
+        if wait:
+            for thread in threads:
+                thread.join()
+        logger.info("Browser pool shut down", self.metrics())
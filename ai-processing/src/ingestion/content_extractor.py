@@ -0,0 +1,227 @@
+"""Structure-aware main-content extraction for scraped HTML pages."""
+
+import re
+from typing import List, NamedTuple, Optional
+
+import lxml.html
+
+# Pages whose <main> yields fewer words than this are read from the whole body,
+# since some sites wrap only a hero banner in <main>.
+MIN_MAIN_CONTENT_WORDS = 50
+# Deeper subtrees are flattened to plain text instead of walked
+MAX_WALK_DEPTH = 200
+# Share of a page-level <header>'s words in links or <nav> at which it is site
+# chrome rather than a hero with the page's headline
+HEADER_LINK_SHARE = 0.5
+
+_HEADING_LEVELS = {"h1": 1, "h2": 2, "h3": 3, "h4": 4, "h5": 5, "h6": 6}
+_BLOCK_TAGS = {
+    "address",
+    "article",
+    "blockquote",
+    "br",
+    "dd",
+    "details",
+    "div",
+    "dl",
+    "dt",
+    "figcaption",
+    "figure",
+    "hr",
+    "li",
+    "main",
+    "ol",
+    "p",
+    "pre",
+    "section",
+    "summary",
+    "table",
+    "td",
+    "th",
+    "tr",
+    "ul",
+}
+# Never content
+_SKIPPED_TAGS = {
+    "button",
+    "canvas",
+    "iframe",
+    "input",
+    "noscript",
+    "object",
+    "script",
+    "select",
+    "style",
+    "svg",
+    "template",
+    "textarea",
+}
+# Site chrome
+_BOILERPLATE_TAGS = {"nav", "aside"}
+# Page-level footers are site chrome; inside these they belong to the content.
+# Page-level headers are chrome only if mostly links (see _is_link_header).
+_PAGE_CHROME_TAGS = {"footer"}
+_CONTENT_TAGS = {"article", "main", "section"}
+_BOILERPLATE_ROLES = {
+    "alertdialog",
+    "banner",
+    "complementary",
+    "contentinfo",
+    "dialog",
+    "navigation",
+    "search",
+}
+# Whole id/class words of consent banners, so 'trusted-by' is not 'truste'
+_CONSENT_WORDS = {
+    "cookie",
+    "cookies",
+    "consent",
+    "gdpr",
+    "onetrust",
+    "cookiebot",
+    "usercentrics",
+    "truste",
+    "osano",
+    "didomi",
+}
+# Splits ids and classes into words at spaces, '-', '_' and camelCase humps
+_NAME_SPLIT_PATTERN = re.compile(r"[\s_-]+|(?<=[a-z])(?=[A-Z])")
+_HIDDEN_STYLE_PATTERN = re.compile(r"display\s*:\s*none|visibility\s*:\s*hidden", re.IGNORECASE)
+
+
+class ExtractedContent(NamedTuple):
+    """Main-content text of a page and its heading outline."""
+
+    text: str
+    outline: List[str]
+
+
+class _TextBuilder:
+    """Collects text into lines, one per block, with headings as '## Heading' markers."""
+
+    def __init__(self):
+        self.lines: List[str] = []
+        self.outline: List[str] = []
+        self._fragments: List[str] = []
+
+    def add(self, text: Optional[str]) -> None:
+        if text:
+            self._fragments.append(text)
+
+    def end_block(self) -> None:
+        line = " ".join(" ".join(self._fragments).split())
+        if line:
+            self.lines.append(line)
+        self._fragments = []
+
+    def heading(self, level: int, text: str) -> None:
+        text = " ".join(text.split())
+        if not text:
+            return
+        self.end_block()
+        marker = f"{'#' * level} {text}"
+        self.lines.append(marker)
+        self.outline.append(marker)
+
+    def result(self) -> ExtractedContent:
+        self.end_block()
+        return ExtractedContent(text="\n".join(self.lines), outline=self.outline)
+
+
+def _is_consent_banner(element: lxml.html.HtmlElement) -> bool:
+    names = f"{element.get('id', '')} {element.get('class', '')}"
+    return any(word.lower() in _CONSENT_WORDS for word in _NAME_SPLIT_PATTERN.split(names))
+
+
+def _is_link_header(element: lxml.html.HtmlElement) -> bool:
+    """Whether a <header> is mostly navigation links rather than a hero."""
+    words = len(element.text_content().split())
+    link_words = sum(
+        len(link.text_content().split())
+        for link in element.xpath(".//nav | .//a[not(ancestor::nav)]")
+    )
+    return link_words >= words * HEADER_LINK_SHARE
+
+
+def is_boilerplate(element: lxml.html.HtmlElement, in_content: bool) -> bool:
+    """
+    Check whether an element is navigation, site chrome, a consent banner or hidden.
+
+    Args:
+        element: Element to check
+        in_content: Whether the element is inside article/main/section
+    """
+    tag = element.tag
+    if tag in _SKIPPED_TAGS or tag in _BOILERPLATE_TAGS:
+        return True
+    if not in_content and (
+        tag in _PAGE_CHROME_TAGS or (tag == "header" and _is_link_header(element))
+    ):
+        return True
+    if element.get("role", "").lower() in _BOILERPLATE_ROLES:
+        return True
+    if element.get("hidden") is not None or element.get("aria-hidden") == "true":
+        return True
+    if _HIDDEN_STYLE_PATTERN.search(element.get("style", "")):
+        return True
+    return _is_consent_banner(element)
+
+
+def _walk(
+    element: lxml.html.HtmlElement, builder: _TextBuilder, in_content: bool, depth: int
+) -> None:
+    tag = element.tag
+    if tag in _HEADING_LEVELS:
+        builder.heading(_HEADING_LEVELS[tag], element.text_content())
+        return
+    if depth > MAX_WALK_DEPTH:
+        builder.add(element.text_content())
+        return
+
+    block = tag in _BLOCK_TAGS
+    if block:
+        builder.end_block()
+    builder.add(element.text)
+    child_in_content = in_content or tag in _CONTENT_TAGS
+    for child in element:
+        # Comments and processing instructions have non-string tags
+        if isinstance(child.tag, str) and not is_boilerplate(child, child_in_content):
+            _walk(child, builder, child_in_content, depth + 1)
+        builder.add(child.tail)
+    if block:
+        builder.end_block()
+
+
+def _extract(roots: List[lxml.html.HtmlElement]) -> ExtractedContent:
+    builder = _TextBuilder()
+    for root in roots:
+        _walk(root, builder, root.tag in _CONTENT_TAGS or root.get("role") == "main", 0)
+        builder.end_block()
+    return builder.result()
+
+
+def extract_main_content(document: lxml.html.HtmlElement) -> ExtractedContent:
+    """
+    Extract main-content text without navigation, headers, footers and consent banners.
+
+    Text is returned one block per line. Headings become Markdown-style section
+    markers ('## Pricing') and are also collected, in order, as the outline.
+
+    Args:
+        document: Parsed HTML document
+
+    Returns:
+        ExtractedContent with text and heading outline
+    """
+    mains = [
+        main
+        for main in document.xpath("//main | //*[@role='main']")
+        if not main.xpath("ancestor::main | ancestor::*[@role='main']")
+    ]
+    if mains:
+        content = _extract(mains)
+        if len(content.text.split()) >= MIN_MAIN_CONTENT_WORDS:
+            return content
+
+    body = document.find("body")
+    return _extract([body if body is not None else document])
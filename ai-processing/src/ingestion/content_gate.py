@@ -0,0 +1,277 @@
+"""Local pre-flight checks that reject content not worth sending to the agents."""
+
+import re
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from src.ingestion.text_stats import count_words, text_stats
+from src.models.parsed_content import ParsedContent
+from src.models.text_stats import TextStats
+
+# Pages this short may be nothing but a parking, placeholder or JavaScript notice
+SHORT_TEXT_WORDS = 300
+# Pages this short are rejected for any such notice; longer ones only if the
+# sentences with a notice phrase make up NOTICE_SHARE of their words
+TINY_TEXT_WORDS = 50
+NOTICE_SHARE = 0.5
+# Share of a text's words in cookie or consent lines that makes it a cookie wall
+COOKIE_WALL_SHARE = 0.5
+# Words read from the start of a text for the repetition and language checks
+SAMPLE_WORDS = 500
+# Texts with fewer words are too short for the repetition and language checks
+MIN_SAMPLE_WORDS = 50
+# Distinct words per word in the sample below which a text is repeated filler
+MIN_DISTINCT_WORD_RATIO = 0.2
+# Share of common English words below which a text is flagged as not English prose
+MIN_STOPWORD_SHARE = 0.05
+# PDF pages with fewer words than this count as having no text layer
+MIN_PAGE_WORDS = 3
+# Share of pages without text at which a PDF is treated as scanned or image-only
+IMAGE_ONLY_PAGE_SHARE = 0.9
+
+_PARKED_PATTERN = re.compile(
+    r"\b(this|the) domain( name)? (is|may be|might be) (for sale|available)"
+    r"|\bbuy this domain\b|\bmake an offer on this domain\b|\bdomain (is )?parked\b"
+    r"|\bparked (free|domain)\b|\bthis domain has expired\b",
+    re.IGNORECASE,
+)
+_PLACEHOLDER_PATTERN = re.compile(
+    r"\b(coming soon|launching soon|under construction|lorem ipsum|welcome to nginx"
+    r"|apache2? (ubuntu |debian )?default page|default web ?page|account (has been )?suspended"
+    r"|site (is )?(currently )?(under maintenance|unavailable))\b",
+    re.IGNORECASE,
+)
+_JS_REQUIRED_PATTERN = re.compile(
+    r"(enable|requires?|turn on)\s+javascript|javascript\s+(is\s+)?(required|disabled)"
+    r"|browser (does not|doesn't) support javascript",
+    re.IGNORECASE,
+)
+_CONSENT_PATTERN = re.compile(
+    r"\b(we use cookies|(accept|allow|reject|decline) (all )?cookies"
+    r"|cookie (settings|preferences|policy|consent|banner)|(necessary|third[- ]party) cookies"
+    r"|manage (your )?(cookie|consent|privacy) (settings|preferences|choices)"
+    r"|privacy preferences)\b",
+    re.IGNORECASE,
+)
+_CONSENT_KEYWORDS = ("cookie", "consent", "privacy")
+_SENTENCE_ENDS = ".!?\n"
+_WORD_PATTERN = re.compile(r"\w+")
+_STOPWORDS = frozenset(
+    "a about after all also an and any are as at be because been but by can do for from "
+    "has have he how i if in into is it its more most not of on one or our out so than "
+    "that the their them there these they this to up us was we what when which who will "
+    "with you your".split()
+)
+
+
+class QualityIssue(NamedTuple):
+    """Something wrong with one scraped page or upload."""
+
+    source: str
+    reason: str
+    detail: str
+    # Rejected content is not worth evaluating; other issues are only flagged
+    reject: bool
+
+
+class ContentQualityError(Exception):
+    """Exception raised when none of the submitted content is worth evaluating."""
+
+    def __init__(self, issues: List[QualityIssue]):
+        self.issues = issues
+        super().__init__(
+            "No content worth evaluating: "
+            + "; ".join(f"{issue.source} {issue.detail}" for issue in issues)
+        )
+
+
+def _notice_words(text: str, matches: List[re.Match]) -> int:
+    """Words in the sentences or lines containing matches, each counted once."""
+    sentences = set()
+    for match in matches:
+        start = max(text.rfind(end, 0, match.start()) for end in _SENTENCE_ENDS) + 1
+        ends = [text.find(end, match.end()) for end in _SENTENCE_ENDS]
+        sentences.add((start, min((end for end in ends if end >= 0), default=len(text))))
+    return sum(count_words(text[start:end]) for start, end in sentences)
+
+
+def _match_issue(
+    text: str, stats: TextStats, source: str, pattern: re.Pattern, reason: str, detail: str
+) -> Optional[QualityIssue]:
+    """An issue if the page is tiny and has the phrase, or is mostly sentences with it."""
+    matches = list(pattern.finditer(text))
+    if not matches:
+        return None
+    if stats.words >= TINY_TEXT_WORDS and _notice_words(text, matches) < (
+        stats.words * NOTICE_SHARE
+    ):
+        return None
+    return QualityIssue(source, reason, f"{detail} ({matches[0].group()!r})", reject=True)
+
+
+def _consent_line_words(text: str) -> int:
+    """Words in the lines that contain a cookie or consent phrase, each line counted once."""
+    # Every consent phrase contains one of these words; finding them with
+    # str.find and matching only their lines is far faster than a regex scan
+    lowered = text.lower()
+    lines = set()
+    for keyword in _CONSENT_KEYWORDS:
+        position = lowered.find(keyword)
+        while position >= 0:
+            line_start = lowered.rfind("\n", 0, position) + 1
+            line_end = lowered.find("\n", position)
+            if line_end < 0:
+                line_end = len(lowered)
+            lines.add((line_start, line_end))
+            position = lowered.find(keyword, line_end)
+    return sum(
+        count_words(text[start:end])
+        for start, end in lines
+        if _CONSENT_PATTERN.search(text, start, end)
+    )
+
+
+def assess_text(text: str, stats: TextStats, source: str) -> List[QualityIssue]:
+    """
+    Check one page or document's text with cheap heuristics.
+
+    Short texts are rejected when they read like a parked domain, a placeholder
+    ("coming soon", a web server default page) or a JavaScript-required
+    notice: under TINY_TEXT_WORDS words if the phrase appears at all, else
+    only if the sentences with it are most of the text. Any text whose words
+    are mostly in cookie or consent lines is rejected as a cookie wall. A
+    sample of the first SAMPLE_WORDS words is rejected if it is mostly the
+    same few words, and flagged if it has almost no common English words
+    (another language, or keyword lists).
+
+    Args:
+        text: Extracted text
+        stats: Its text statistics
+        source: URL or filename, for messages
+
+    Returns:
+        Issues found, most specific first; empty if the text looks usable
+    """
+    if not stats.words:
+        return [QualityIssue(source, "no_text", "contains no text", reject=True)]
+
+    if stats.words < SHORT_TEXT_WORDS:
+        for pattern, reason, detail in (
+            (_PARKED_PATTERN, "parked_domain", "looks like a parked or for-sale domain"),
+            (_PLACEHOLDER_PATTERN, "placeholder_page", "looks like a placeholder page"),
+            (_JS_REQUIRED_PATTERN, "javascript_required", "only asks to enable JavaScript"),
+        ):
+            issue = _match_issue(text, stats, source, pattern, reason, detail)
+            if issue:
+                return [issue]
+
+    consent_words = _consent_line_words(text)
+    if consent_words >= stats.words * COOKIE_WALL_SHARE:
+        return [
+            QualityIssue(
+                source,
+                "cookie_wall",
+                f"is mostly a cookie or consent notice ({consent_words} of {stats.words} words)",
+                reject=True,
+            )
+        ]
+
+    words = []
+    for match in _WORD_PATTERN.finditer(text):
+        words.append(match.group().lower())
+        if len(words) == SAMPLE_WORDS:
+            break
+    if len(words) < MIN_SAMPLE_WORDS:
+        return []
+    distinct = len(set(words)) / len(words)
+    if distinct < MIN_DISTINCT_WORD_RATIO:
+        return [
+            QualityIssue(
+                source,
+                "repetitive_text",
+                f"repeats the same few words ({distinct:.0%} distinct)",
+                reject=True,
+            )
+        ]
+    stopwords = sum(word in _STOPWORDS for word in words) / len(words)
+    if stopwords < MIN_STOPWORD_SHARE:
+        return [
+            QualityIssue(
+                source,
+                "unrecognised_language",
+                f"does not read as English prose ({stopwords:.0%} common English words)",
+                reject=False,
+            )
+        ]
+    return []
+
+
+def assess_upload(parsed: ParsedContent) -> List[QualityIssue]:
+    """
+    Check a parsed upload: a PDF without a text layer, then its text.
+
+    A PDF where at least IMAGE_ONLY_PAGE_SHARE of the pages have fewer than
+    MIN_PAGE_WORDS words is a scan or slide export that needs OCR.
+    """
+    if parsed.segment_type == "page" and parsed.segment_count:
+        textless = sum(
+            parsed.segment_stats(index).words < MIN_PAGE_WORDS
+            for index in range(parsed.segment_count)
+        )
+        if textless >= parsed.segment_count * IMAGE_ONLY_PAGE_SHARE:
+            return [
+                QualityIssue(
+                    parsed.filename,
+                    "image_only",
+                    f"has no extractable text on {textless} of {parsed.segment_count} pages "
+                    "(scanned or image-only PDF)",
+                    reject=True,
+                )
+            ]
+    return assess_text(parsed.text, parsed.stats, parsed.filename)
+
+
+def _page_issues(page: Dict[str, Any]) -> List[QualityIssue]:
+    text = page.get("text", "")
+    if page.get("stats"):
+        stats = TextStats(*(page["stats"][field] for field in TextStats._fields))
+    else:
+        stats = text_stats(text, line_paragraphs=True)
+    return assess_text(text, stats, page.get("url") or "website")
+
+
+def gate_content(content: Dict[str, Any]) -> List[QualityIssue]:
+    """
+    Decide whether an ingestion result is worth running the agents on.
+
+    The website counts as usable if any scraped page passes; each upload is
+    judged on the 'quality_issues' attached when it was ingested (see
+    assess_upload). Content with some usable source goes ahead with the
+    issues returned as flags.
+
+    Args:
+        content: Ingestion result with 'scraped_content' and 'uploaded_content'
+
+    Returns:
+        Issues found in all sources
+
+    Raises:
+        ContentQualityError: If no source is usable
+    """
+    issues: List[QualityIssue] = []
+    usable = False
+    scraped = content.get("scraped_content")
+    if scraped:
+        pages = [scraped.get("homepage"), scraped.get("about_page")]
+        pages += scraped.get("additional_pages") or []
+        for page in filter(None, pages):
+            page_issues = _page_issues(page)
+            issues += page_issues
+            usable = usable or not any(issue.reject for issue in page_issues)
+    for upload in content.get("uploaded_content") or []:
+        upload_issues = [QualityIssue(**issue) for issue in upload.get("quality_issues", [])]
+        issues += upload_issues
+        usable = usable or not any(issue.reject for issue in upload_issues)
+
+    if not usable and issues:
+        raise ContentQualityError([issue for issue in issues if issue.reject])
+    return issues
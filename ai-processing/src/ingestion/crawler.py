@@ -0,0 +1,238 @@
+"""Bounded crawl of the most informative pages of a site beyond the homepage."""
+
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+import lxml.etree
+import requests
+
+from src.ingestion.http_client import get_session
+from src.models.scraped_content import PageContent
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_CRAWL_PAGES = 4
+DEFAULT_CRAWL_TIME_BUDGET_SECONDS = 15.0
+DEFAULT_CRAWL_WORD_BUDGET = 6000
+MAX_CRAWL_WORKERS = 4
+
+SITEMAP_TIMEOUT_SECONDS = 5
+# Child sitemaps followed from a sitemap index, and URLs read in total
+MAX_SITEMAP_FILES = 3
+MAX_SITEMAP_URLS = 5000
+# Bonus for candidates the site lists in its sitemap
+SITEMAP_BONUS = 1
+
+# Path segments that usually lead to product and customer story pages, by weight
+CRAWL_PATH_KEYWORDS: Dict[str, int] = {
+    "customers": 3,
+    "customer-stories": 3,
+    "case-studies": 3,
+    "case-study": 3,
+    "product": 2,
+    "products": 2,
+    "solutions": 2,
+    "solution": 2,
+    "platform": 2,
+    "use-cases": 2,
+    "about": 1,
+    "about-us": 1,
+    "company": 1,
+}
+
+_SKIPPED_EXTENSIONS = re.compile(
+    r"\.(pdf|jpe?g|png|gif|svg|webp|mp4|mp3|zip|xml|json|css|js|ico|docx?|pptx?|xlsx?)$",
+    re.IGNORECASE,
+)
+
+
+class CrawlBudget(NamedTuple):
+    """Limits for crawling pages beyond the homepage and About page."""
+
+    max_pages: int = DEFAULT_MAX_CRAWL_PAGES
+    time_budget_seconds: float = DEFAULT_CRAWL_TIME_BUDGET_SECONDS
+    max_words: int = DEFAULT_CRAWL_WORD_BUDGET
+
+
+def _site_host(url: str) -> str:
+    host = (urlsplit(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def normalize_page_url(url: str) -> str:
+    """Reduce a URL to host (without www.) and path so links to one page compare equal."""
+    return _site_host(url) + urlsplit(url).path.rstrip("/")
+
+
+def score_path(url: str) -> int:
+    """
+    Score a URL by the keywords in its path segments.
+
+    Returns:
+        Sum of keyword weights minus one per segment beyond the second, so
+        section pages outrank deeply nested ones. 0 means not worth crawling.
+    """
+    segments = [segment for segment in urlsplit(url).path.lower().split("/") if segment]
+    score = sum(CRAWL_PATH_KEYWORDS.get(segment, 0) for segment in segments)
+    if score == 0:
+        return 0
+    return max(score - max(len(segments) - 2, 0), 1)
+
+
+def fetch_sitemap_urls(homepage_url: str, timeout: float = SITEMAP_TIMEOUT_SECONDS) -> List[str]:
+    """
+    Read page URLs from the site's /sitemap.xml, following a sitemap index one level.
+
+    Returns:
+        Page URLs, or an empty list if there is no usable sitemap
+    """
+    parts = urlsplit(homepage_url)
+    pending = [f"{parts.scheme}://{parts.netloc}/sitemap.xml"]
+    urls: List[str] = []
+    files_read = 0
+
+    while pending and files_read <= MAX_SITEMAP_FILES and len(urls) < MAX_SITEMAP_URLS:
+        sitemap_url = pending.pop(0)
+        files_read += 1
+        try:
+            response = get_session().get(sitemap_url, timeout=timeout)
+            if response.status_code >= 400:
+                continue
+            parser = lxml.etree.XMLParser(resolve_entities=False, no_network=True)
+            root = lxml.etree.fromstring(response.content, parser=parser)
+        except (requests.RequestException, lxml.etree.XMLSyntaxError, ValueError) as e:
+            logger.info(f"Could not read sitemap {sitemap_url}: {e}")
+            continue
+
+        locations = [loc.strip() for loc in root.xpath("//*[local-name()='loc']/text()")]
+        if lxml.etree.QName(root).localname == "sitemapindex":
+            # Page sitemaps first; post and product-feed sitemaps rarely help
+            pending.extend(sorted(locations, key=lambda loc: "page" not in loc.lower()))
+        else:
+            urls.extend(locations[: MAX_SITEMAP_URLS - len(urls)])
+
+    return urls
+
+
+def build_frontier(
+    homepage_url: str,
+    links: Iterable[str],
+    sitemap_urls: Iterable[str] = (),
+    exclude: Iterable[str] = (),
+) -> List[str]:
+    """
+    Rank same-site candidate pages for crawling.
+
+    Candidates are homepage links and sitemap entries whose path contains a crawl
+    keyword. Pages listed in the sitemap get a bonus; ties keep homepage order.
+
+    Args:
+        homepage_url: URL of the homepage
+        links: Links found on the homepage
+        sitemap_urls: Page URLs from the sitemap
+        exclude: Pages already scraped
+
+    Returns:
+        Candidate URLs, best first
+    """
+    site = _site_host(homepage_url)
+    seen = {normalize_page_url(url) for url in [homepage_url, *exclude]}
+    sitemap = {normalize_page_url(url) for url in sitemap_urls}
+
+    candidates: Dict[str, tuple] = {}
+    for order, link in enumerate([*links, *sitemap_urls]):
+        url = urljoin(homepage_url, link)
+        parts = urlsplit(url)
+        key = normalize_page_url(url)
+        if (
+            parts.scheme not in ("http", "https")
+            or _site_host(url) != site
+            or _SKIPPED_EXTENSIONS.search(parts.path)
+            or key in seen
+            or key in candidates
+        ):
+            continue
+        score = score_path(url)
+        if score == 0:
+            continue
+        if key in sitemap:
+            score += SITEMAP_BONUS
+        candidates[key] = (
+            -score,
+            order,
+            urlunsplit((parts.scheme, parts.netloc, parts.path, "", "")),
+        )
+
+    return [url for _, _, url in sorted(candidates.values())]
+
+
+def crawl_site(
+    homepage: PageContent,
+    fetch_page: Callable[[str], Optional[PageContent]],
+    budget: CrawlBudget,
+    exclude: Iterable[str] = (),
+    is_allowed: Callable[[str], bool] = lambda url: True,
+) -> List[PageContent]:
+    """
+    Fetch the top-ranked pages of a site in parallel within a time and word budget.
+
+    Args:
+        homepage: Scraped homepage, with its links
+        fetch_page: Fetches one page, returning None if it is unusable
+        budget: Page, time and word limits
+        exclude: Pages already scraped
+        is_allowed: robots.txt check for candidate URLs
+
+    Returns:
+        Crawled pages in frontier order. Pages that fail, arrive after the time
+        budget, duplicate an earlier page or would exceed the word budget are left out.
+    """
+    deadline = time.monotonic() + budget.time_budget_seconds
+    exclude = list(exclude)
+
+    sitemap_urls = fetch_sitemap_urls(
+        homepage.url, timeout=min(SITEMAP_TIMEOUT_SECONDS, budget.time_budget_seconds)
+    )
+    frontier = build_frontier(homepage.url, homepage.links, sitemap_urls, exclude)
+    targets = [url for url in frontier if is_allowed(url)][: budget.max_pages]
+    if not targets:
+        return []
+
+    results: List[Optional[PageContent]] = [None] * len(targets)
+    executor = ThreadPoolExecutor(
+        max_workers=min(MAX_CRAWL_WORKERS, len(targets)), thread_name_prefix="crawl"
+    )
+    try:
+        futures = {executor.submit(fetch_page, url): index for index, url in enumerate(targets)}
+        for future in as_completed(futures, timeout=max(deadline - time.monotonic(), 0)):
+            try:
+                results[futures[future]] = future.result()
+            except Exception as e:
+                logger.info(f"Crawl fetch failed for {targets[futures[future]]}: {e}")
+    except FuturesTimeoutError:
+        logger.info("Crawl time budget exhausted", {"url": homepage.url, "targets": len(targets)})
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    pages: List[PageContent] = []
+    seen = {normalize_page_url(url) for url in [homepage.url, *exclude]}
+    words = 0
+    for page in results:
+        if page is None or not page.word_count or normalize_page_url(page.url) in seen:
+            continue
+        if words + page.word_count > budget.max_words:
+            continue
+        seen.add(normalize_page_url(page.url))
+        words += page.word_count
+        pages.append(page)
+
+    logger.info(
+        "Crawl completed",
+        {"url": homepage.url, "candidates": len(frontier), "pages": len(pages), "words": words},
+    )
+    return pages
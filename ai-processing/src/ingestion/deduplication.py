@@ -0,0 +1,317 @@
+"""Near-duplicate detection across uploaded files and scraped pages."""
+
+import hashlib
+import re
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from src.ingestion.file_parser import LINE_PARAGRAPH_FILE_TYPES, get_file_type
+from src.ingestion.text_stats import text_stats
+
+# Words per shingle for document and paragraph fingerprints
+SHINGLE_SIZE = 3
+# MinHash permutations; the Jaccard estimate's standard error is about 1/sqrt(128)
+MINHASH_PERMUTATIONS = 128
+# Estimated Jaccard similarity of two documents' shingle sets at which one is a duplicate
+DOCUMENT_SIMILARITY_THRESHOLD = 0.8
+# Paragraphs whose 64-bit SimHashes differ in at most this many bits are duplicates
+PARAGRAPH_HAMMING_DISTANCE = 3
+# Shorter paragraphs (headings, "Thank you") are never collapsed
+MIN_PARAGRAPH_WORDS = 8
+# 16-bit blocks per SimHash in the paragraph index; must exceed PARAGRAPH_HAMMING_DISTANCE
+_INDEX_BLOCKS = 4
+# Shingles hashed per MinHash block, bounding the permutation matrix to a few MB
+_MINHASH_BLOCK = 4096
+
+_WORD_PATTERN = re.compile(r"\w+")
+# A paragraph is one line of extracted text (a page block, DOCX paragraph or
+# slide text line) with the newline that ends it
+_PARAGRAPH_PATTERN = re.compile(r"[^\n]+\n?")
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_SHINGLE_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+# Fixed seed so signatures are comparable across processes and runs
+_rng = np.random.default_rng(0x5EED)
+_MINHASH_A = _rng.integers(1, 1 << 29, MINHASH_PERMUTATIONS, dtype=np.uint64)[:, None]
+_MINHASH_B = _rng.integers(0, (1 << 61) - 1, MINHASH_PERMUTATIONS, dtype=np.uint64)[:, None]
+
+
+class DuplicateDocument(NamedTuple):
+    """An upload collapsed because it repeats an earlier document."""
+
+    filename: str
+    duplicate_of: str
+    similarity: float
+
+
+class TokenizedText(NamedTuple):
+    """Word hashes of a text and where its paragraphs are."""
+
+    words: np.ndarray
+    paragraph_spans: List[Tuple[int, int]]
+    paragraph_words: np.ndarray
+
+
+def tokenize(text: str, token_cache: Optional[Dict[str, int]] = None) -> TokenizedText:
+    """
+    Hash the lowercased words of a text, paragraph by paragraph.
+
+    Each distinct word is hashed once (blake2b, so hashes are stable across
+    processes); token_cache carries those hashes between texts.
+
+    Args:
+        text: Text to tokenize
+        token_cache: Word hashes shared between calls
+
+    Returns:
+        uint64 word hashes in text order, (start, end) character span of every
+        paragraph and the number of words in each
+    """
+    cache = {} if token_cache is None else token_cache
+    spans = []
+    counts = []
+    words: List[str] = []
+    for match in _PARAGRAPH_PATTERN.finditer(text):
+        paragraph_words = _WORD_PATTERN.findall(match.group().lower())
+        spans.append(match.span())
+        counts.append(len(paragraph_words))
+        words.extend(paragraph_words)
+    for word in set(words).difference(cache):
+        cache[word] = int.from_bytes(
+            hashlib.blake2b(word.encode("utf-8"), digest_size=8).digest(), "little"
+        )
+    return TokenizedText(
+        words=np.fromiter((cache[word] for word in words), dtype=np.uint64, count=len(words)),
+        paragraph_spans=spans,
+        paragraph_words=np.array(counts, dtype=np.int64),
+    )
+
+
+def _mix(values: np.ndarray) -> np.ndarray:
+    """splitmix64 finaliser, so every output bit depends on every input bit."""
+    values = values ^ (values >> np.uint64(30))
+    values = values * np.uint64(0xBF58476D1CE4E5B9)
+    values = values ^ (values >> np.uint64(27))
+    values = values * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+
+def shingle_hashes(words: np.ndarray) -> np.ndarray:
+    """
+    Hash every run of SHINGLE_SIZE consecutive words.
+
+    Returns:
+        uint64 array where element i covers words i..i+SHINGLE_SIZE-1; a text
+        shorter than a shingle hashes as one shingle, and an empty one as none
+    """
+    if not len(words):
+        return np.zeros(0, dtype=np.uint64)
+    size = min(SHINGLE_SIZE, len(words))
+    count = len(words) - size + 1
+    hashes = words[:count].copy()
+    for offset in range(1, size):
+        hashes = hashes * _SHINGLE_MULTIPLIER + words[offset : offset + count]
+    return _mix(hashes)
+
+
+def minhash(shingles: np.ndarray) -> Optional[np.ndarray]:
+    """MinHash signature of a set of shingle hashes, or None if it is empty."""
+    if not len(shingles):
+        return None
+    values = np.unique(shingles) >> np.uint64(32)
+    signature = np.full(MINHASH_PERMUTATIONS, np.iinfo(np.uint64).max, dtype=np.uint64)
+    for start in range(0, len(values), _MINHASH_BLOCK):
+        block = values[start : start + _MINHASH_BLOCK][None, :]
+        permuted = (_MINHASH_A * block + _MINHASH_B) % _MERSENNE_PRIME
+        np.minimum(signature, permuted.min(axis=1), out=signature)
+    return signature
+
+
+def estimated_jaccard(first: np.ndarray, second: np.ndarray) -> float:
+    """Share of MinHash positions two signatures agree on."""
+    return float(np.mean(first == second))
+
+
+def paragraph_simhashes(
+    tokens: TokenizedText, shingles: np.ndarray
+) -> Tuple[np.ndarray, List[int]]:
+    """
+    64-bit SimHash of every paragraph with at least MIN_PARAGRAPH_WORDS words.
+
+    Only shingles inside a paragraph count towards it. A bit is set when most
+    of the paragraph's shingle hashes have it set; all paragraphs are summed
+    at once, one bit position at a time.
+
+    Args:
+        tokens: Tokenized text
+        shingles: shingle_hashes(tokens.words)
+
+    Returns:
+        (indexes of the fingerprinted paragraphs, their SimHashes)
+    """
+    counts = tokens.paragraph_words
+    eligible = np.flatnonzero(counts >= MIN_PARAGRAPH_WORDS)
+    if not len(eligible):
+        return eligible, []
+
+    first_words = np.cumsum(counts) - counts
+    sizes = counts[eligible] - SHINGLE_SIZE + 1
+    offsets = np.cumsum(sizes) - sizes
+    # Shingle positions of all eligible paragraphs, back to back
+    positions = np.repeat(first_words[eligible] - offsets, sizes) + np.arange(sizes.sum())
+    selected = shingles[positions]
+
+    fingerprints = np.zeros(len(eligible), dtype=np.uint64)
+    for bit in range(64):
+        ones = np.add.reduceat((selected >> np.uint64(bit)) & np.uint64(1), offsets)
+        fingerprints |= (ones * 2 > sizes).astype(np.uint64) << np.uint64(bit)
+    return eligible, fingerprints.tolist()
+
+
+class _ParagraphIndex:
+    """
+    SimHashes of paragraphs seen so far, searched by Hamming distance.
+
+    Hashes are filed under each of their four 16-bit blocks. Two hashes at most
+    3 bits apart agree on at least one whole block, so only hashes sharing a
+    block with the query need their distance checked.
+    """
+
+    def __init__(self):
+        self._blocks: List[Dict[int, List[int]]] = [{} for _ in range(_INDEX_BLOCKS)]
+
+    @staticmethod
+    def _keys(value: int) -> List[int]:
+        return [(value >> (16 * block)) & 0xFFFF for block in range(_INDEX_BLOCKS)]
+
+    def contains(self, value: int) -> bool:
+        for table, key in zip(self._blocks, self._keys(value)):
+            for candidate in table.get(key, ()):
+                if (candidate ^ value).bit_count() <= PARAGRAPH_HAMMING_DISTANCE:
+                    return True
+        return False
+
+    def add(self, value: int) -> None:
+        for table, key in zip(self._blocks, self._keys(value)):
+            table.setdefault(key, []).append(value)
+
+
+def _remove_seen_paragraphs(
+    text: str, tokens: TokenizedText, shingles: np.ndarray, index: _ParagraphIndex
+) -> Tuple[str, int]:
+    """
+    Drop paragraphs already in the index and add the kept ones to it.
+
+    Returns:
+        (text without the dropped paragraphs, number dropped)
+    """
+    pieces = []
+    position = 0
+    removed = 0
+    for paragraph, fingerprint in zip(*paragraph_simhashes(tokens, shingles)):
+        if index.contains(fingerprint):
+            start, end = tokens.paragraph_spans[paragraph]
+            pieces.append(text[position:start])
+            position = end
+            removed += 1
+        else:
+            index.add(fingerprint)
+    if not removed:
+        return text, 0
+    pieces.append(text[position:])
+    return "".join(pieces), removed
+
+
+def _scraped_pages(scraped: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    if not scraped:
+        return []
+    pages = [scraped[key] for key in ("homepage", "about_page") if scraped.get(key)]
+    return pages + list(scraped.get("additional_pages") or [])
+
+
+def collapse_duplicates(content: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Collapse uploads that repeat earlier documents before the agents read them.
+
+    Scraped pages come first and are never changed; they only serve as
+    originals. Each upload is then compared, in order, with the scraped pages
+    and the uploads kept before it:
+
+    - An upload whose MinHash similarity to an earlier document reaches
+      DOCUMENT_SIMILARITY_THRESHOLD (e.g. the same deck as PPTX and PDF) is
+      removed from 'uploaded_content'. Document shingles run across line
+      breaks, so different line wrapping does not hide a duplicate.
+    - Otherwise, paragraphs whose SimHash is within PARAGRAPH_HAMMING_DISTANCE
+      bits of an earlier paragraph (a one-pager repeating the homepage, a
+      disclaimer on every page) are dropped from its text.
+
+    The uploads as parsed are kept in 'original_uploaded_content', so citations
+    can still be validated against text the agents no longer see, and what was
+    collapsed is listed in 'duplicates'. Trimmed uploads get their 'stats'
+    recomputed.
+
+    Args:
+        content: Ingestion result with 'scraped_content' and 'uploaded_content'
+
+    Returns:
+        New ingestion result, or content itself if nothing was collapsed; the
+        input dictionaries are never modified
+    """
+    uploads = content.get("uploaded_content") or []
+    if not uploads:
+        return content
+
+    token_cache: Dict[str, int] = {}
+    paragraphs = _ParagraphIndex()
+    documents = []
+    for page in _scraped_pages(content.get("scraped_content")):
+        text = page.get("text", "")
+        tokens = tokenize(text, token_cache)
+        shingles = shingle_hashes(tokens.words)
+        signature = minhash(shingles)
+        if signature is not None:
+            documents.append((page.get("url") or "website", signature))
+        _remove_seen_paragraphs(text, tokens, shingles, paragraphs)
+
+    kept_uploads = []
+    duplicate_documents: List[DuplicateDocument] = []
+    duplicate_paragraphs: List[Dict[str, Any]] = []
+    for upload in uploads:
+        filename = upload.get("filename", "unknown")
+        text = upload.get("text", "")
+        tokens = tokenize(text, token_cache)
+        shingles = shingle_hashes(tokens.words)
+        signature = minhash(shingles)
+        if signature is not None:
+            similarity, original = max(
+                ((estimated_jaccard(signature, other), label) for label, other in documents),
+                default=(0.0, ""),
+            )
+            if similarity >= DOCUMENT_SIMILARITY_THRESHOLD:
+                duplicate_documents.append(
+                    DuplicateDocument(filename, original, round(similarity, 2))
+                )
+                continue
+            documents.append((filename, signature))
+
+        text, removed = _remove_seen_paragraphs(text, tokens, shingles, paragraphs)
+        if removed:
+            duplicate_paragraphs.append({"filename": filename, "paragraphs_removed": removed})
+            upload = {**upload, "text": text}
+            if "stats" in upload:
+                line_paragraphs = get_file_type(filename) in LINE_PARAGRAPH_FILE_TYPES
+                upload["stats"] = text_stats(text, line_paragraphs).to_dict()
+        kept_uploads.append(upload)
+
+    if not duplicate_documents and not duplicate_paragraphs:
+        return content
+    return {
+        **content,
+        "uploaded_content": kept_uploads,
+        "original_uploaded_content": uploads,
+        "duplicates": {
+            "documents": [duplicate._asdict() for duplicate in duplicate_documents],
+            "paragraphs": duplicate_paragraphs,
+        },
+    }
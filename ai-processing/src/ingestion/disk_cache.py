@@ -0,0 +1,132 @@
+"""Shared storage for the on-disk caches: zstd JSON entries with a TTL and LRU eviction."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import zstandard
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+COMPRESSION_LEVEL = 10
+
+
+class DiskCache:
+    """
+    zstd-compressed JSON entries on local disk, one file per key.
+
+    Entries expire after ttl_seconds; entries not used for that long are swept
+    on every store. When the directory grows beyond max_bytes, the least
+    recently used entries (by file mtime, refreshed on every hit) are evicted.
+    Writes go to a per-process, per-thread temp file that is then renamed, so
+    worker processes sharing the directory never see a partial entry.
+
+    Subclasses turn their keys into a string for _entry_path() and their
+    content into the 'content' of an entry.
+    """
+
+    # Counters reported by metrics(); subclasses may add their own
+    METRICS: Tuple[str, ...] = ("hits", "misses", "expired", "stores", "evictions")
+
+    def __init__(self, directory: str, ttl_seconds: float, max_bytes: int):
+        """
+        Initialize cache.
+
+        Args:
+            directory: Directory to store entries in (created if missing)
+            ttl_seconds: Maximum age of an entry before it is discarded
+            max_bytes: Total size limit for all entries
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, int] = dict.fromkeys(self.METRICS, 0)
+
+    def _entry_path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json.zst"
+
+    def record(self, metric: str) -> None:
+        """Increment a metric counter."""
+        with self._lock:
+            self._metrics[metric] += 1
+
+    def metrics(self) -> Dict[str, int]:
+        """Return a snapshot of cache metrics."""
+        with self._lock:
+            return dict(self._metrics)
+
+    def _read(self, path: Path, description: str) -> Optional[Dict[str, Any]]:
+        """
+        Read an entry, or None if missing, expired or unreadable.
+
+        Records misses and expiries; hits are left to the caller.
+        """
+        try:
+            entry = json.loads(zstandard.ZstdDecompressor().decompress(path.read_bytes()))
+        except FileNotFoundError:
+            self.record("misses")
+            return None
+        except (OSError, ValueError, zstandard.ZstdError) as e:
+            logger.warning(f"Discarding unreadable cache entry for {description}: {e}")
+            path.unlink(missing_ok=True)
+            self.record("misses")
+            return None
+
+        if time.time() - entry["stored_at"] > self.ttl_seconds:
+            path.unlink(missing_ok=True)
+            self.record("expired")
+            return None
+        return entry
+
+    @staticmethod
+    def _touch(path: Path) -> None:
+        """Mark an entry as recently used."""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _write(self, path: Path, entry: Dict[str, Any]) -> None:
+        """Store an entry (stamped with stored_at) and evict old entries if over the size limit."""
+        data = zstandard.ZstdCompressor(level=COMPRESSION_LEVEL).compress(
+            json.dumps({**entry, "stored_at": time.time()}).encode("utf-8")
+        )
+        # Write then rename so concurrent readers never see a partial file
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+        self.record("stores")
+        self._evict(path)
+
+    def _evict(self, written: Path) -> None:
+        """Sweep entries unused for ttl_seconds (except written), then the LRU over max_bytes."""
+        entries = []
+        total = 0
+        oldest_allowed = time.time() - self.ttl_seconds
+        for path in self.directory.glob("*.json.zst"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if stat.st_mtime < oldest_allowed and path != written:
+                path.unlink(missing_ok=True)
+                self.record("evictions")
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            self.record("evictions")
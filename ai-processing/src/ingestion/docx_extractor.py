@@ -0,0 +1,198 @@
+"""Streaming text extraction from DOCX files straight from the zip's WordprocessingML."""
+
+import re
+import zipfile
+from io import BytesIO
+from typing import BinaryIO, Dict, Iterator, NamedTuple, Optional, Union
+
+import lxml.etree
+
+_W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_MC = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+
+_P = f"{{{_W}}}p"
+_T = f"{{{_W}}}t"
+_TAB = f"{{{_W}}}tab"
+_BR = f"{{{_W}}}br"
+_CR = f"{{{_W}}}cr"
+_TBL = f"{{{_W}}}tbl"
+_TR = f"{{{_W}}}tr"
+_TC = f"{{{_W}}}tc"
+_BODY = f"{{{_W}}}body"
+_VAL = f"{{{_W}}}val"
+# Legacy copy of drawings (text boxes) kept for old Word versions
+_FALLBACK = f"{{{_MC}}}Fallback"
+
+_HEADING_NAME_PATTERN = re.compile(r"^heading\s*(\d)$", re.IGNORECASE)
+# w:outlineLvl 9 means body text
+_BODY_OUTLINE_LEVEL = 9
+
+
+class DocxBlock(NamedTuple):
+    """A paragraph or table row of a DOCX document."""
+
+    text: str
+    heading_level: Optional[int] = None
+    is_table_row: bool = False
+
+
+def _outline_level(properties: Optional[lxml.etree._Element]) -> Optional[int]:
+    """Heading level (1-based) from a pPr/outlineLvl element, if any."""
+    if properties is None:
+        return None
+    outline = properties.find(f"{{{_W}}}outlineLvl")
+    if outline is None:
+        return None
+    value = int(outline.get(_VAL, _BODY_OUTLINE_LEVEL))
+    return value + 1 if value < _BODY_OUTLINE_LEVEL else None
+
+
+def read_heading_styles(archive: zipfile.ZipFile) -> Dict[str, int]:
+    """
+    Map paragraph style IDs to heading levels from word/styles.xml.
+
+    A style is a heading if its name is 'Heading N' or it (or a style it is
+    based on) sets an outline level, which also covers localised style names.
+    """
+    try:
+        data = archive.read("word/styles.xml")
+    except KeyError:
+        return {}
+    parser = lxml.etree.XMLParser(resolve_entities=False, no_network=True)
+    root = lxml.etree.fromstring(data, parser=parser)
+
+    levels: Dict[str, Optional[int]] = {}
+    based_on: Dict[str, str] = {}
+    for style in root.iterfind(f"{{{_W}}}style"):
+        if style.get(f"{{{_W}}}type") != "paragraph":
+            continue
+        style_id = style.get(f"{{{_W}}}styleId")
+        name = style.find(f"{{{_W}}}name")
+        match = _HEADING_NAME_PATTERN.match(name.get(_VAL, "") if name is not None else "")
+        levels[style_id] = (
+            int(match.group(1)) if match else _outline_level(style.find(f"{{{_W}}}pPr"))
+        )
+        parent = style.find(f"{{{_W}}}basedOn")
+        if parent is not None:
+            based_on[style_id] = parent.get(_VAL)
+
+    resolved: Dict[str, int] = {}
+    for style_id in levels:
+        current, seen = style_id, set()
+        while current and current not in seen:
+            seen.add(current)
+            if levels.get(current):
+                resolved[style_id] = levels[current]
+                break
+            current = based_on.get(current)
+    return resolved
+
+
+def _paragraph_text(paragraph: lxml.etree._Element) -> str:
+    parts = []
+    for element in paragraph.iter(_T, _TAB, _BR, _CR):
+        if element.tag == _T:
+            parts.append(element.text or "")
+        elif element.tag == _TAB:
+            parts.append("\t")
+        else:
+            parts.append("\n")
+    return "".join(parts).strip()
+
+
+def _paragraph_heading_level(
+    paragraph: lxml.etree._Element, heading_styles: Dict[str, int]
+) -> Optional[int]:
+    properties = paragraph.find(f"{{{_W}}}pPr")
+    if properties is None:
+        return None
+    level = _outline_level(properties)
+    if level:
+        return level
+    style = properties.find(f"{{{_W}}}pStyle")
+    return heading_styles.get(style.get(_VAL)) if style is not None else None
+
+
+def _release(element: lxml.etree._Element) -> None:
+    """Free a finished element and the siblings before it so memory stays flat."""
+    element.clear()
+    parent = element.getparent()
+    if parent is not None and parent.tag == _BODY:
+        while element.getprevious() is not None:
+            del parent[0]
+
+
+def iter_docx_blocks(file_content: Union[bytes, str, BinaryIO]) -> Iterator[DocxBlock]:
+    """
+    Stream paragraphs and table rows of a DOCX in document order.
+
+    word/document.xml is read with lxml.etree.iterparse and each element is
+    cleared once its text is taken, so memory does not grow with document
+    length. Text boxes are read once (their legacy fallback copy is skipped),
+    and each top-level table row becomes one block with cells separated by
+    ' | '; nested tables are flattened into their cell.
+
+    Args:
+        file_content: DOCX bytes, path, or binary file object
+
+    Yields:
+        DocxBlock for every non-empty paragraph or table row
+
+    Raises:
+        KeyError: If the archive has no word/document.xml
+        zipfile.BadZipFile, lxml.etree.XMLSyntaxError: If the file is malformed
+    """
+    source = BytesIO(file_content) if isinstance(file_content, bytes) else file_content
+    with zipfile.ZipFile(source) as archive:
+        heading_styles = read_heading_styles(archive)
+        with archive.open("word/document.xml") as document:
+            table_depth = 0
+            fallback_depth = 0
+            cell_parts = []
+            row_cells = []
+            for event, element in lxml.etree.iterparse(
+                document,
+                events=("start", "end"),
+                tag=(_P, _TBL, _TR, _TC, _FALLBACK),
+                resolve_entities=False,
+                no_network=True,
+            ):
+                tag = element.tag
+                if event == "start":
+                    if tag == _TBL:
+                        table_depth += 1
+                    elif tag == _FALLBACK:
+                        fallback_depth += 1
+                    continue
+
+                if tag == _FALLBACK:
+                    fallback_depth -= 1
+                    element.clear()
+                elif tag == _TBL:
+                    table_depth -= 1
+                    if not table_depth:
+                        _release(element)
+                elif fallback_depth:
+                    element.clear()
+                elif tag == _P:
+                    text = _paragraph_text(element)
+                    if table_depth:
+                        if text:
+                            cell_parts.append(text)
+                        element.clear()
+                    else:
+                        level = _paragraph_heading_level(element, heading_styles)
+                        _release(element)
+                        if text:
+                            yield DocxBlock(text=text, heading_level=level)
+                elif tag == _TC and table_depth == 1:
+                    row_cells.append(" ".join(cell_parts))
+                    cell_parts = []
+                elif tag == _TR and table_depth == 1:
+                    if any(row_cells):
+                        yield DocxBlock(
+                            text=" | ".join(cell for cell in row_cells if cell),
+                            is_table_row=True,
+                        )
+                    row_cells = []
+                    element.clear()
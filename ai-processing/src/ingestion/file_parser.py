@@ -1,13 +1,17 @@
 """File parser for PDF, PPTX, and DOCX files."""
 
-import re
+import os
+from array import array
+from io import BytesIO
+from typing import Callable, Dict, List, Literal, NamedTuple, Optional, Tuple, Union
+
 import fitz  # PyMuPDF
-from pptx import Presentation
-from docx import Document
+import numpy as np
 
-from src.models.parsed_content import ParsedContent
-from src.models.page import Page
-from src.models.section import Section
+from src.ingestion.docx_extractor import iter_docx_blocks
+from src.ingestion.pptx_extractor import SlideDeck, slide_count
+from src.ingestion.text_stats import measure_spans
+from src.models.parsed_content import SEGMENT_FIELDS, SEGMENT_SEPARATOR, ParsedContent
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -25,160 +29,381 @@ class FileParsingError(Exception):
     pass
 
 
-def count_words(text: str) -> int:
-    """Count words in text."""
-    return len(re.findall(r"\b\w+\b", text))
+# File content as bytes, or the path of a file on disk
+FileSource = Union[bytes, str, os.PathLike]
 
+# Agents read about 10,000 characters of content each; parsing well past that
+# only matters for citation checks, so budgets leave a wide margin.
+DEFAULT_PARSE_WORD_BUDGET = 30000
+# Pages or slides above which a document is sampled rather than read in full
+DEFAULT_SAMPLE_THRESHOLD = 200
+# File types with one paragraph per line of text; PDF pages also break lines
+# inside paragraphs, so their paragraphs are separated by blank lines
+LINE_PARAGRAPH_FILE_TYPES = ("pptx", "docx")
 
-def parse_pdf(file_content: bytes, filename: str) -> ParsedContent:
-    """Parse PDF file content."""
-    try:
-        # Open PDF from bytes
-        pdf_doc = fitz.open(stream=file_content, filetype="pdf")
-
-        text_parts = []
-        pages = []
-
-        for page_num in range(len(pdf_doc)):
-            page = pdf_doc[page_num]
-            page_text = page.get_text()
-            text_parts.append(page_text)
-
-            pages.append(
-                Page(
-                    page_number=page_num + 1,
-                    text=page_text,
-                    word_count=count_words(page_text),
-                )
-            )
 
-        full_text = "\n\n".join(text_parts)
-        total_words = count_words(full_text)
+def _open_source(file_content: FileSource):
+    """Return a path or file object that zipfile can open."""
+    if isinstance(file_content, bytes):
+        return BytesIO(file_content)
+    return os.fspath(file_content)
+
+
+def _open_pdf(file_content: FileSource) -> fitz.Document:
+    if isinstance(file_content, bytes):
+        return fitz.open(stream=file_content, filetype="pdf")
+    return fitz.open(os.fspath(file_content), filetype="pdf")
+
+
+def pdf_page_count(file_content: FileSource) -> int:
+    """Return the number of pages in a PDF without extracting any text."""
+    with _open_pdf(file_content) as pdf_doc:
+        return len(pdf_doc)
+
 
-        pdf_doc.close()
+def index_ranges(count: int, ranges: int) -> List[Tuple[int, int]]:
+    """Split indexes 0..count into up to `ranges` contiguous (start, stop) ranges."""
+    ranges = max(1, min(ranges, count))
+    step = -(-count // ranges) if count else 1
+    return [(start, min(start + step, count)) for start in range(0, count, step)]
 
+
+class ParseBudget(NamedTuple):
+    """
+    Limits for parsing oversized documents.
+
+    mode "sample" reads only the first `head`, `middle` evenly spaced and last
+    `tail` pages or slides of documents with more than `sample_threshold` of
+    them. mode "stop" reads in order until `max_words` words. DOCX has no
+    pages to sample, so it always stops at `max_words`.
+    """
+
+    mode: Literal["sample", "stop"] = "sample"
+    max_words: int = DEFAULT_PARSE_WORD_BUDGET
+    sample_threshold: int = DEFAULT_SAMPLE_THRESHOLD
+    head: int = 20
+    middle: int = 20
+    tail: int = 10
+
+
+def sample_indexes(count: int, budget: ParseBudget) -> List[int]:
+    """
+    Pick page indexes to read: the first head, the last tail, and one from the
+    centre of each of `middle` equal strata of the pages in between.
+    """
+    if count <= budget.sample_threshold:
+        return list(range(count))
+    head = min(budget.head, count)
+    tail_start = max(count - budget.tail, head)
+    interior = tail_start - head
+    strata = min(budget.middle, interior)
+    middle = [head + (2 * i + 1) * interior // (2 * strata) for i in range(strata)]
+    return [*range(head), *middle, *range(tail_start, count)]
+
+
+def _unit_indexes(
+    count: int, start: int, stop: Optional[int], budget: Optional[ParseBudget], unit: str
+) -> Tuple[List[int], Optional[str]]:
+    """Indexes to read from a range, and a sampling note if the budget samples them."""
+    stop = count if stop is None else min(stop, count)
+    if (
+        budget
+        and budget.mode == "sample"
+        and (start, stop) == (0, count)
+        and count > budget.sample_threshold
+    ):
+        indexes = sample_indexes(count, budget)
+        return indexes, (
+            f"Sampled {len(indexes)} of {count} {unit}s: the first {budget.head}, "
+            f"{len(indexes) - budget.head - budget.tail} spread across the middle and "
+            f"the last {budget.tail}"
+        )
+    return list(range(start, stop)), None
+
+
+def _word_budget_reached(builder: "ContentBuilder", budget: Optional[ParseBudget]) -> bool:
+    return bool(budget) and builder.has_words(budget.max_words)
+
+
+class ContentBuilder:
+    """
+    Collects page or section texts into one buffer with offset records.
+
+    Text statistics (words, sentences, paragraphs, syllables, tokens) are
+    filled into the records in one vectorised pass over the joined text when
+    it is built, so each character is scanned once. Word-budget checks only
+    measure the pending segments early when they could hold enough words.
+    """
+
+    def __init__(self, file_type: str, segment_type: str):
+        self.file_type = file_type
+        self.segment_type = segment_type
+        self.line_paragraphs = file_type in LINE_PARAGRAPH_FILE_TYPES
+        self._word_count = 0
+        self._parts: List[str] = []
+        self._length = 0
+        self._segments = array("q")
+        self._titles: Dict[int, str] = {}
+        # Segments, parts and characters already measured, and an upper bound
+        # on the words in the rest
+        self._measured_segments = 0
+        self._measured_parts = 0
+        self._measured_length = 0
+        self._pending_word_bound = 0
+        # How the document was sampled, if not read in full
+        self.sampling: Optional[str] = None
+
+    def add(
+        self,
+        text: str,
+        number: int,
+        page_number: Optional[int] = None,
+        level: Optional[int] = None,
+        title: Optional[str] = None,
+    ) -> None:
+        """Append a page (number = page number) or section (number = order)."""
+        if self._parts:
+            self._parts.append(SEGMENT_SEPARATOR)
+            self._length += len(SEGMENT_SEPARATOR)
+        start = self._length
+        self._parts.append(text)
+        self._length += len(text)
+        # Words need a separator between them, so n characters hold at most (n + 1) // 2
+        self._pending_word_bound += (len(text) + 1) // 2
+        if title:
+            self._titles[len(self._segments) // SEGMENT_FIELDS] = title
+        self._segments.extend((start, self._length, number, 0, page_number or 0, level or 0))
+        self._segments.extend((0,) * (SEGMENT_FIELDS - 6))
+
+    def _measure(self, text: Optional[str] = None) -> None:
+        """Fill in the statistics of segments added since the last measurement."""
+        first = self._measured_segments
+        count = len(self._segments) // SEGMENT_FIELDS
+        if first == count:
+            return
+        base = 0 if text is not None else self._measured_length
+        if text is None:
+            text = "".join(self._parts[self._measured_parts :])
+        # A view of the records, released before the array is extended again
+        records = np.frombuffer(self._segments, dtype=np.int64).reshape(-1, SEGMENT_FIELDS)
+        pending = records[first:]
+        counts = measure_spans(text, (pending[:, :2] - base).tolist(), self.line_paragraphs)
+        pending[:, 3] = counts[:, 0]
+        pending[:, 6:] = counts[:, 1:]
+        self._word_count += int(counts[:, 0].sum())
+        del records, pending
+        self._measured_segments = count
+        self._measured_parts = len(self._parts)
+        self._measured_length = self._length
+        self._pending_word_bound = 0
+
+    @property
+    def word_count(self) -> int:
+        """Words in all segments added so far."""
+        self._measure()
+        return self._word_count
+
+    def has_words(self, limit: int) -> bool:
+        """Whether the segments added so far hold at least limit words."""
+        if self._word_count + self._pending_word_bound < limit:
+            return False
+        return self.word_count >= limit
+
+    def build(self, filename: str) -> ParsedContent:
+        text = "".join(self._parts)
+        self._parts = []
+        self._measure(text)
         return ParsedContent(
             filename=filename,
-            file_type="pdf",
-            text=full_text,
-            word_count=total_words,
-            pages=pages,
+            file_type=self.file_type,
+            text=text,
+            word_count=self._word_count,
+            segment_type=self.segment_type,
+            segments=self._segments,
+            titles=self._titles,
+            sampling=self.sampling,
         )
-    except Exception as e:
-        raise FileParsingError(f"Error parsing PDF {filename}: {str(e)}")
 
 
-def parse_pptx(file_content: bytes, filename: str) -> ParsedContent:
-    """Parse PPTX file content."""
+def parse_pdf_pages(
+    file_content: FileSource,
+    start: int = 0,
+    stop: Optional[int] = None,
+    filename: str = "",
+    budget: Optional[ParseBudget] = None,
+) -> ParsedContent:
+    """
+    Extract pages start..stop-1 of a PDF with a document handle of its own.
+
+    Runs in parser worker processes, one call per page range; the results are
+    joined with ParsedContent.concatenate(). With a budget, huge documents are
+    sampled or read only up to the word budget.
+    """
+    builder = ContentBuilder("pdf", "page")
+    with _open_pdf(file_content) as pdf_doc:
+        count = len(pdf_doc)
+        indexes, builder.sampling = _unit_indexes(count, start, stop, budget, "page")
+        for position, page_num in enumerate(indexes):
+            if budget and budget.mode == "stop" and _word_budget_reached(builder, budget):
+                builder.sampling = (
+                    f"Stopped after {position} of {count} pages at the "
+                    f"{budget.max_words}-word budget"
+                )
+                break
+            builder.add(pdf_doc[page_num].get_text(), number=page_num + 1)
+    return builder.build(filename)
+
+
+def parse_pdf(
+    file_content: FileSource, filename: str, budget: Optional[ParseBudget] = None
+) -> ParsedContent:
+    """Parse PDF file content (bytes, or a path that MuPDF reads on demand)."""
     try:
-        from io import BytesIO
+        return parse_pdf_pages(file_content, filename=filename, budget=budget)
+    except Exception as e:
+        raise FileParsingError(f"Error parsing PDF {filename}: {str(e)}")
 
-        # Open PPTX from bytes
-        pptx_file = BytesIO(file_content)
-        presentation = Presentation(pptx_file)
 
-        text_parts = []
-        sections = []
+def pptx_slide_count(file_content: FileSource) -> int:
+    """Return the number of slides in a PPTX without reading any slide."""
+    return slide_count(_open_source(file_content))
 
-        for slide_num, slide in enumerate(presentation.slides, 1):
-            slide_text_parts = []
-            for shape in slide.shapes:
-                if hasattr(shape, "text") and shape.text:
-                    slide_text_parts.append(shape.text.strip())
 
-            slide_text = "\n".join(slide_text_parts)
+def parse_pptx_slides(
+    file_content: FileSource,
+    start: int = 0,
+    stop: Optional[int] = None,
+    filename: str = "",
+    budget: Optional[ParseBudget] = None,
+) -> ParsedContent:
+    """
+    Extract slides start..stop-1 of a PPTX, with speaker notes, as sections.
+
+    Runs in parser worker processes, one call per slide range. Empty slides
+    are left out. With a budget, huge decks are sampled or read only up to
+    the word budget.
+    """
+    builder = ContentBuilder("pptx", "section")
+    with SlideDeck(_open_source(file_content)) as deck:
+        count = len(deck)
+        indexes, builder.sampling = _unit_indexes(count, start, stop, budget, "slide")
+        for position, index in enumerate(indexes):
+            if budget and budget.mode == "stop" and _word_budget_reached(builder, budget):
+                builder.sampling = (
+                    f"Stopped after {position} of {count} slides at the "
+                    f"{budget.max_words}-word budget"
+                )
+                break
+            slide = deck.slide(index)
+            slide_text = "\n\n".join(
+                part
+                for part in (slide.text, f"Speaker notes: {slide.notes}" if slide.notes else "")
+                if part
+            )
             if slide_text:
-                text_parts.append(slide_text)
-                sections.append(
-                    Section(
-                        title=f"Slide {slide_num}",
-                        text=slide_text,
-                        page_number=slide_num,
-                        order=slide_num,
-                    )
+                builder.add(
+                    slide_text,
+                    number=slide.slide_number,
+                    page_number=slide.slide_number,
+                    title=f"Slide {slide.slide_number}",
                 )
+    return builder.build(filename)
 
-        full_text = "\n\n".join(text_parts)
-        total_words = count_words(full_text)
 
-        return ParsedContent(
-            filename=filename,
-            file_type="pptx",
-            text=full_text,
-            word_count=total_words,
-            sections=sections,
-        )
+def parse_pptx(
+    file_content: FileSource, filename: str, budget: Optional[ParseBudget] = None
+) -> ParsedContent:
+    """Parse PPTX file content (bytes or path) from the slide and notes XML."""
+    try:
+        return parse_pptx_slides(file_content, filename=filename, budget=budget)
     except Exception as e:
         raise FileParsingError(f"Error parsing PPTX {filename}: {str(e)}")
 
 
-def parse_docx(file_content: bytes, filename: str) -> ParsedContent:
-    """Parse DOCX file content."""
+def parse_docx(
+    file_content: FileSource, filename: str, budget: Optional[ParseBudget] = None
+) -> ParsedContent:
+    """
+    Parse DOCX file content (bytes or path).
+
+    Paragraphs and table rows are streamed from word/document.xml (see
+    iter_docx_blocks); headings keep their level and become section titles.
+    With a budget, reading stops at the word budget.
+    """
     try:
-        from io import BytesIO
-
-        # Open DOCX from bytes
-        docx_file = BytesIO(file_content)
-        document = Document(docx_file)
-
-        text_parts = []
-        sections = []
-
-        for para_num, paragraph in enumerate(document.paragraphs, 1):
-            para_text = paragraph.text.strip()
-            if para_text:
-                text_parts.append(para_text)
-                # Use paragraph style as section title if available
-                section_title = None
-                if paragraph.style and paragraph.style.name.startswith("Heading"):
-                    section_title = para_text[:100]  # Use first part as title
-
-                sections.append(
-                    Section(
-                        title=section_title,
-                        text=para_text,
-                        order=para_num,
-                    )
+        builder = ContentBuilder("docx", "section")
+        for order, block in enumerate(iter_docx_blocks(_open_source(file_content)), 1):
+            if _word_budget_reached(builder, budget):
+                builder.sampling = (
+                    f"Stopped after {order - 1} sections at the {budget.max_words}-word budget"
                 )
-
-        full_text = "\n\n".join(text_parts)
-        total_words = count_words(full_text)
-
-        return ParsedContent(
-            filename=filename,
-            file_type="docx",
-            text=full_text,
-            word_count=total_words,
-            sections=sections,
-        )
+                break
+            builder.add(
+                block.text,
+                number=order,
+                level=block.heading_level,
+                title=block.text[:100] if block.heading_level else None,
+            )
+        return builder.build(filename)
     except Exception as e:
         raise FileParsingError(f"Error parsing DOCX {filename}: {str(e)}")
 
 
-def parse_file(file_content: bytes, filename: str) -> ParsedContent:
+class RangeParser(NamedTuple):
+    """Functions for parsing a file type as independent page or slide ranges."""
+
+    count: Callable[[FileSource], int]
+    # (file_content, start, stop) -> ParsedContent for ParsedContent.concatenate()
+    parse_range: Callable[[FileSource, int, Optional[int]], ParsedContent]
+
+
+# File types whose pages or slides can be parsed in separate processes and merged
+RANGE_PARSERS: Dict[str, RangeParser] = {
+    "pdf": RangeParser(pdf_page_count, parse_pdf_pages),
+    "pptx": RangeParser(pptx_slide_count, parse_pptx_slides),
+}
+
+
+def get_file_type(filename: str) -> str:
+    """
+    Return the file type ("pdf", "pptx" or "docx") for a filename.
+
+    Raises:
+        UnsupportedFileFormatError: If file format is not supported
+    """
+    filename_lower = filename.lower()
+    for file_type in ("pdf", "pptx", "docx"):
+        if filename_lower.endswith(f".{file_type}"):
+            return file_type
+    raise UnsupportedFileFormatError(
+        f"Unsupported file format: {filename}. Supported formats: PDF, PPTX, DOCX"
+    )
+
+
+def parse_file(
+    file_content: FileSource, filename: str, budget: Optional[ParseBudget] = None
+) -> ParsedContent:
     """
     Parse file content based on file extension.
 
     Args:
-        file_content: File content as bytes
+        file_content: File content as bytes, or the path of a file on disk
         filename: Name of the file
+        budget: Sampling or early-stop limits for oversized documents (None reads
+            everything)
 
     Returns:
-        ParsedContent object
+        ParsedContent object (with `sampling` set if the budget cut it short)
 
     Raises:
         UnsupportedFileFormatError: If file format is not supported
         FileParsingError: If parsing fails
     """
-    filename_lower = filename.lower()
+    file_type = get_file_type(filename)
 
-    if filename_lower.endswith(".pdf"):
-        return parse_pdf(file_content, filename)
-    elif filename_lower.endswith(".pptx"):
-        return parse_pptx(file_content, filename)
-    elif filename_lower.endswith(".docx"):
-        return parse_docx(file_content, filename)
+    if file_type == "pdf":
+        return parse_pdf(file_content, filename, budget)
+    elif file_type == "pptx":
+        return parse_pptx(file_content, filename, budget)
     else:
-        raise UnsupportedFileFormatError(
-            f"Unsupported file format: {filename}. Supported formats: PDF, PPTX, DOCX"
-        )
+        return parse_docx(file_content, filename, budget)
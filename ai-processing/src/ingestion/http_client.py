@@ -0,0 +1,83 @@
+"""Shared HTTP session for the ingestion layer."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Browser-like User-Agent: many corporate sites serve bot-blocking pages to
+# the default python-requests agent.
+USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/131.0 Safari/537.36 StoryAI-Evaluator"
+)
+POOL_CONNECTIONS = 20
+POOL_MAXSIZE = 20
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide pooled HTTP session (created on first use)."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update({"User-Agent": USER_AGENT})
+                _session = session
+    return _session
+
+
+class TTLCache:
+    """Small thread-safe in-memory cache with per-entry expiry and LRU eviction."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 1024):
+        """
+        Initialize cache.
+
+        Args:
+            ttl_seconds: Seconds an entry stays valid
+            max_entries: Least recently used entries are evicted beyond this
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
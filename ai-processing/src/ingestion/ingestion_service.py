@@ -1,28 +1,310 @@
 """Content ingestion service that orchestrates scraping and file parsing."""
 
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Optional, List, Dict, Any
 from google.cloud import storage
 
+from src.config.env import env
+from src.ingestion.browser_pool import BrowserPool
+from src.ingestion.content_gate import ContentQualityError, assess_upload, gate_content
+from src.ingestion.crawler import CrawlBudget
+from src.ingestion.deduplication import collapse_duplicates
+from src.ingestion.parse_cache import ParseCache, content_fingerprint
+from src.ingestion.scrape_cache import ScrapeCache
 from src.ingestion.scraper import scrape_website, ScrapingError, InsufficientContentError
-from src.ingestion.file_parser import parse_file, UnsupportedFileFormatError, FileParsingError
+from src.ingestion.scraper_workers import ScraperWorkerPool
+from src.ingestion.text_stats import corpus_stats
+from src.ingestion.storage_backend import (
+    ObjectInfo,
+    SpooledFile,
+    StorageBackend,
+    create_storage_backend,
+)
+from src.ingestion.file_parser import (
+    RANGE_PARSERS,
+    FileSource,
+    get_file_type,
+    index_ranges,
+    ParseBudget,
+    parse_file,
+    UnsupportedFileFormatError,
+    FileParsingError,
+)
+from src.models.parsed_content import ParsedContent
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Threads for the scrape and storage downloads (I/O bound)
+DEFAULT_IO_WORKERS = 8
+# Processes for parsing (CPU bound)
+DEFAULT_PARSE_WORKERS = min(4, os.cpu_count() or 1)
+# Parser processes are replaced after this many files to return memory
+PARSE_TASKS_PER_PROCESS = 20
+
 
 class IngestionService:
     """Service for ingesting content from URLs and files."""
 
-    def __init__(self, storage_client: Optional[storage.Client] = None):
-        """Initialize ingestion service."""
-        self.storage_client = storage_client or storage.Client()
+    def __init__(
+        self,
+        storage_client: Optional[storage.Client] = None,
+        browser_pool: Optional[BrowserPool] = None,
+        scrape_cache: Optional[ScrapeCache] = None,
+        crawl_budget: Optional[CrawlBudget] = None,
+        scraper_workers: Optional[ScraperWorkerPool] = None,
+        io_workers: int = DEFAULT_IO_WORKERS,
+        parse_workers: int = DEFAULT_PARSE_WORKERS,
+        storage_backend: Optional[StorageBackend] = None,
+        sliced_download_threshold_bytes: Optional[int] = None,
+        download_slices: Optional[int] = None,
+        parse_cache: Optional[ParseCache] = None,
+        pdf_parallel_page_threshold: Optional[int] = None,
+        pptx_parallel_slide_threshold: Optional[int] = None,
+        parse_budget: Optional[ParseBudget] = None,
+        deduplicate: Optional[bool] = None,
+        quality_gate: Optional[bool] = None,
+    ):
+        """
+        Initialize ingestion service.
+
+        Args:
+            storage_client: Cloud Storage client
+            browser_pool: Pool of warm browsers shared by all scrapes. Created with
+                default sizing if omitted; browsers are launched on first use.
+            scrape_cache: Cache of scraped websites. Built from SCRAPE_CACHE_DIR if
+                omitted; caching is disabled when that is unset.
+            crawl_budget: Enables crawl mode with these limits. Built from
+                SCRAPE_CRAWL_MAX_PAGES if omitted; crawling is off when that is 0.
+            scraper_workers: Pool of scraper worker processes. Built from
+                SCRAPE_WORKER_PROCESSES if omitted; when that is 0, scrapes run in
+                this process on browser_pool.
+            io_workers: Threads shared by all requests for scraping and downloads
+            parse_workers: Processes shared by all requests for parsing files
+            storage_backend: Where uploaded files are read from. Defaults to Cloud
+                Storage through storage_client, or the local directory in
+                LOCAL_STORAGE_ROOT if that is set.
+            sliced_download_threshold_bytes: Files at least this large are downloaded
+                as parallel byte ranges (DOWNLOAD_SLICE_THRESHOLD_MB if omitted)
+            download_slices: Parallel ranges per sliced download; 1 disables slicing
+                (DOWNLOAD_SLICES if omitted)
+            parse_cache: Cache of parsed uploads keyed by content fingerprint. Built
+                from PARSE_CACHE_DIR if omitted; caching is disabled when that is unset.
+            pdf_parallel_page_threshold: PDFs with at least this many pages are split
+                into page ranges parsed in parallel (PDF_PARALLEL_PAGE_THRESHOLD if
+                omitted; 0 disables splitting)
+            pptx_parallel_slide_threshold: Likewise for PPTX slides
+                (PPTX_PARALLEL_SLIDE_THRESHOLD if omitted)
+            parse_budget: Sampling or early-stop limits for oversized documents.
+                Built from PARSE_BUDGET_MODE, PARSE_WORD_BUDGET and
+                PARSE_SAMPLE_THRESHOLD if omitted; mode "off" parses everything.
+            deduplicate: Collapse uploads and paragraphs that repeat earlier
+                content before returning it (DEDUPLICATE_CONTENT if omitted)
+            quality_gate: Reject parked, placeholder, cookie-wall and text-less
+                content before it reaches the agents (CONTENT_QUALITY_GATE if omitted)
+        """
+        if storage_backend is None:
+            local_root = None if storage_client else env.local_storage_root
+            if storage_client is None and not local_root:
+                storage_client = storage.Client()
+            storage_backend = create_storage_backend(storage_client, local_root)
+        self.storage_client = storage_client
+        self.storage_backend = storage_backend
+        self.sliced_download_threshold_bytes = (
+            env.download_slice_threshold_mb * 1024 * 1024
+            if sliced_download_threshold_bytes is None
+            else sliced_download_threshold_bytes
+        )
+        self.download_slices = env.download_slices if download_slices is None else download_slices
+        self.browser_pool = browser_pool or BrowserPool()
+        if scrape_cache is None and env.scrape_cache_dir:
+            scrape_cache = ScrapeCache(
+                directory=env.scrape_cache_dir,
+                ttl_seconds=env.scrape_cache_ttl_seconds,
+                max_bytes=env.scrape_cache_max_mb * 1024 * 1024,
+            )
+        self.scrape_cache = scrape_cache
+        if parse_cache is None and env.parse_cache_dir:
+            parse_cache = ParseCache(
+                directory=env.parse_cache_dir,
+                ttl_seconds=env.parse_cache_ttl_seconds,
+                max_bytes=env.parse_cache_max_mb * 1024 * 1024,
+            )
+        self.parse_cache = parse_cache
+        if crawl_budget is None and env.scrape_crawl_max_pages > 0:
+            crawl_budget = CrawlBudget(max_pages=env.scrape_crawl_max_pages)
+        self.crawl_budget = crawl_budget
+        if scraper_workers is None and env.scrape_worker_processes > 0:
+            scraper_workers = ScraperWorkerPool(
+                size=env.scrape_worker_processes,
+                job_timeout_seconds=env.scrape_job_timeout_seconds,
+                max_rss_bytes=env.scrape_worker_max_rss_mb * 1024 * 1024,
+                scrape_cache=scrape_cache,
+            )
+        self.scraper_workers = scraper_workers
+        self.parse_workers = parse_workers
+        self.parallel_parse_thresholds = {
+            "pdf": (
+                env.pdf_parallel_page_threshold
+                if pdf_parallel_page_threshold is None
+                else pdf_parallel_page_threshold
+            ),
+            "pptx": (
+                env.pptx_parallel_slide_threshold
+                if pptx_parallel_slide_threshold is None
+                else pptx_parallel_slide_threshold
+            ),
+        }
+        if parse_budget is None and env.parse_budget_mode != "off":
+            parse_budget = ParseBudget(
+                mode=env.parse_budget_mode,
+                max_words=env.parse_word_budget,
+                sample_threshold=env.parse_sample_threshold,
+            )
+        self.parse_budget = parse_budget
+        self.deduplicate = env.deduplicate_content if deduplicate is None else deduplicate
+        self.quality_gate = env.content_quality_gate if quality_gate is None else quality_gate
+        self._io_executor = ThreadPoolExecutor(
+            max_workers=io_workers, thread_name_prefix="ingestion-io"
+        )
+        self._parse_executor: Optional[ProcessPoolExecutor] = None
+        self._parse_executor_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Release long-lived resources (pooled browsers and worker processes)."""
+        self.browser_pool.shutdown()
+        if self.scraper_workers is not None:
+            self.scraper_workers.shutdown()
+        self._io_executor.shutdown(wait=False, cancel_futures=True)
+        with self._parse_executor_lock:
+            if self._parse_executor is not None:
+                self._parse_executor.shutdown(wait=False, cancel_futures=True)
+                self._parse_executor = None
+
+    def __enter__(self) -> "IngestionService":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _get_parse_executor(self) -> ProcessPoolExecutor:
+        with self._parse_executor_lock:
+            if self._parse_executor is None:
+                # spawn: forking a process that runs browser and I/O threads is unsafe
+                self._parse_executor = ProcessPoolExecutor(
+                    max_workers=self.parse_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    max_tasks_per_child=PARSE_TASKS_PER_PROCESS,
+                )
+            return self._parse_executor
+
+    def _reset_parse_executor(self, broken: ProcessPoolExecutor) -> None:
+        with self._parse_executor_lock:
+            if self._parse_executor is broken:
+                self._parse_executor = None
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def parse_in_process_pool(self, file_content: FileSource, filename: str) -> ParsedContent:
+        """
+        Parse a file in the parser process pool.
+
+        Raises:
+            UnsupportedFileFormatError: If file format is not supported
+            FileParsingError: If parsing fails or the parser process dies
+        """
+        executor = self._get_parse_executor()
+        try:
+            unit_count = self._unit_count_to_split(file_content, filename)
+            if unit_count:
+                return self._parse_ranges(executor, file_content, filename, unit_count)
+            return executor.submit(parse_file, file_content, filename, self.parse_budget).result()
+        except BrokenProcessPool as e:
+            # A parser process was killed (e.g. out of memory); start a fresh pool
+            self._reset_parse_executor(executor)
+            raise FileParsingError(f"Parser process died while parsing {filename}") from e
+
+    def _parse_variant(self) -> str:
+        """Parse cache key part for settings that change parser output."""
+        return "" if self.parse_budget is None else repr(tuple(self.parse_budget))
 
-    def download_file_from_storage(self, bucket_name: str, file_path: str) -> bytes:
-        """Download file from Cloud Storage."""
+    def _unit_count_to_split(self, file_content: FileSource, filename: str) -> int:
+        """Page or slide count of a file large enough to parse in ranges, else 0."""
+        file_type = get_file_type(filename)
+        threshold = self.parallel_parse_thresholds.get(file_type)
+        if self.parse_workers < 2 or not threshold:
+            return 0
         try:
-            bucket = self.storage_client.bucket(bucket_name)
-            blob = bucket.blob(file_path)
-            return blob.download_as_bytes()
+            count = RANGE_PARSERS[file_type].count(file_content)
+        except Exception:
+            # Unreadable; parse_file reports it as a FileParsingError
+            return 0
+        budget = self.parse_budget
+        if budget and (budget.mode == "stop" or count > budget.sample_threshold):
+            # Early stop reads in order; a sample is small enough for one process
+            return 0
+        return count if count >= threshold else 0
+
+    def _parse_ranges(
+        self,
+        executor: ProcessPoolExecutor,
+        file_content: FileSource,
+        filename: str,
+        unit_count: int,
+    ) -> ParsedContent:
+        """Parse page or slide ranges in separate parser processes and merge them in order."""
+        file_type = get_file_type(filename)
+        parser = RANGE_PARSERS[file_type]
+        ranges = index_ranges(unit_count, self.parse_workers)
+        logger.info(
+            "Parsing file in ranges",
+            {"file_name": filename, "units": unit_count, "ranges": len(ranges)},
+        )
+        futures = [
+            executor.submit(parser.parse_range, file_content, start, stop) for start, stop in ranges
+        ]
+        try:
+            parts = [future.result() for future in futures]
+        except BrokenProcessPool:
+            raise
+        except Exception as e:
+            raise FileParsingError(f"Error parsing {file_type.upper()} {filename}: {e}") from e
+        finally:
+            for future in futures:
+                future.cancel()
+        return ParsedContent.concatenate(filename, file_type, parts)
+
+    def download_file_from_storage(
+        self, bucket_name: str, file_path: str, info: Optional[ObjectInfo] = None
+    ) -> SpooledFile:
+        """
+        Stream a file from storage into a SpooledFile (caller closes it).
+
+        Small files stay in memory; larger ones are spooled to a temporary file
+        that the parsers open by path. Files above the slicing threshold are
+        fetched as parallel byte ranges straight into a pre-allocated file.
+
+        Args:
+            bucket_name: Bucket name
+            file_path: Object path within the bucket
+            info: Object metadata, if already known
+        """
+        try:
+            if self.download_slices > 1:
+                info = info or self.storage_backend.stat(bucket_name, file_path)
+                # An empty object has no byte ranges to fetch
+                if info.size and info.size >= self.sliced_download_threshold_bytes:
+                    logger.info(
+                        "Sliced download",
+                        {"file_path": file_path, "size": info.size, "slices": self.download_slices},
+                    )
+                    return self.storage_backend.download_sliced(
+                        bucket_name, file_path, info, self.download_slices
+                    )
+            return self.storage_backend.download(bucket_name, file_path)
         except Exception as e:
             logger.error(
                 f"Error downloading file from storage: {e}",
@@ -40,66 +322,141 @@ class IngestionService:
         """
         Ingest content from URL and/or files.
 
+        The scrape and all downloads run concurrently on I/O threads, and parsing
+        runs in a process pool. Uploaded content keeps the order of file_paths.
+
         Args:
             url: Website URL to scrape
             file_paths: List of dicts with 'bucket', 'path', 'filename' for files
             bucket_name: Cloud Storage bucket name
 
         Returns:
-            Dictionary with 'scraped_content' and/or 'uploaded_content'
+            Dictionary with 'scraped_content' and/or 'uploaded_content', and 'stats'
+            totalled over both (each page and upload also has its own 'stats'). When
+            near-duplicates were collapsed, also 'original_uploaded_content' and
+            'duplicates' (see collapse_duplicates). Issues found by the quality gate
+            in usable content are listed in 'quality_flags'
+
+        Raises:
+            ContentQualityError: If the quality gate finds nothing worth evaluating
         """
         result: Dict[str, Any] = {
             "scraped_content": None,
             "uploaded_content": [],
         }
 
-        # Scrape URL if provided
+        # Scrape, download and parse everything at once; results are collected in
+        # input order, so the first failure (scrape first, then files) is raised.
+        futures: List[Future] = []
         if url:
+            futures.append(self._io_executor.submit(self._scrape, url))
+        for file_info in file_paths or []:
+            futures.append(self._io_executor.submit(self._ingest_file, file_info, bucket_name))
+
+        try:
+            results = [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+        if url:
+            result["scraped_content"] = results.pop(0)
+        result["uploaded_content"] = results
+        if self.deduplicate:
+            result = collapse_duplicates(result)
+            if "duplicates" in result:
+                logger.info("Collapsed duplicate content", result["duplicates"])
+        result["stats"] = corpus_stats(result).to_dict()
+        if self.quality_gate:
             try:
-                scraped = scrape_website(url)
-                result["scraped_content"] = scraped.to_dict()
-            except InsufficientContentError as e:
+                issues = gate_content(result)
+            except ContentQualityError as e:
                 logger.error(
-                    f"Insufficient content from {url}: {e}",
-                    exc_info=True,
-                    extra={"url": url},
+                    f"Content rejected by quality gate: {e}",
+                    extra={"url": url, "reasons": [issue.reason for issue in e.issues]},
                 )
                 raise
-            except ScrapingError as e:
-                logger.error(
-                    f"Error scraping {url}: {e}",
-                    exc_info=True,
-                    extra={"url": url},
+            if issues:
+                result["quality_flags"] = [issue._asdict() for issue in issues]
+                logger.info("Content quality flags", {"flags": result["quality_flags"]})
+        return result
+
+    def _scrape(self, url: str) -> Dict[str, Any]:
+        """Scrape a URL and return its content for agent inputs."""
+        try:
+            if self.scraper_workers is not None:
+                scraped = self.scraper_workers.scrape(url, crawl=self.crawl_budget)
+            else:
+                scraped = scrape_website(
+                    url,
+                    browser_pool=self.browser_pool,
+                    cache=self.scrape_cache,
+                    crawl=self.crawl_budget,
                 )
-                raise
+            return scraped.to_dict()
+        except InsufficientContentError as e:
+            logger.error(
+                f"Insufficient content from {url}: {e}",
+                exc_info=True,
+                extra={"url": url},
+            )
+            raise
+        except ScrapingError as e:
+            logger.error(
+                f"Error scraping {url}: {e}",
+                exc_info=True,
+                extra={"url": url},
+            )
+            raise
 
-        # Parse files if provided
-        if file_paths:
-            for file_info in file_paths:
-                file_bucket = file_info.get("bucket", bucket_name)
-                file_path = file_info["path"]
-                filename = file_info.get("filename", file_path.split("/")[-1])
-
-                try:
-                    # Download file from storage
-                    file_content = self.download_file_from_storage(file_bucket, file_path)
-
-                    # Parse file
-                    parsed = parse_file(file_content, filename)
-                    result["uploaded_content"].append(parsed.to_dict())
-                except UnsupportedFileFormatError as e:
-                    logger.error(
-                        f"Unsupported file format: {e}",
-                        exc_info=True,
-                        extra={"filename": filename, "file_path": file_path, "bucket": file_bucket},
-                    )
-                    raise
-                except FileParsingError as e:
-                    logger.error(
-                        f"Error parsing file {filename}: {e}",
-                        exc_info=True,
-                        extra={"filename": filename, "file_path": file_path, "bucket": file_bucket},
+    def _ingest_file(self, file_info: Dict[str, str], bucket_name: Optional[str]) -> Dict[str, Any]:
+        """Download and parse one uploaded file and return its content for agent inputs."""
+        file_bucket = file_info.get("bucket", bucket_name)
+        file_path = file_info["path"]
+        filename = file_info.get("filename", file_path.split("/")[-1])
+
+        try:
+            # Reject unsupported formats before downloading
+            file_type = get_file_type(filename)
+
+            # Metadata first: a fingerprint hit skips both download and parse
+            info = self.storage_backend.stat(file_bucket, file_path)
+            fingerprint = content_fingerprint(info, file_bucket, file_path)
+            if self.parse_cache is not None and fingerprint:
+                cached = self.parse_cache.get(fingerprint, file_type, self._parse_variant())
+                if cached is not None:
+                    logger.info(
+                        "Parse cache hit", {"file_path": file_path, "fingerprint": fingerprint}
                     )
-                    raise
+                    return self._upload_content(cached.model_copy(update={"filename": filename}))
 
-        return result
+            # Download file from storage, then parse it by path (or bytes if small)
+            with self.download_file_from_storage(file_bucket, file_path, info) as download:
+                parsed = self.parse_in_process_pool(download.source, filename)
+            if self.parse_cache is not None and fingerprint:
+                self.parse_cache.put(fingerprint, file_type, parsed, self._parse_variant())
+            return self._upload_content(parsed)
+        except UnsupportedFileFormatError as e:
+            logger.error(
+                f"Unsupported file format: {e}",
+                exc_info=True,
+                extra={"file_name": filename, "file_path": file_path, "bucket": file_bucket},
+            )
+            raise
+        except FileParsingError as e:
+            logger.error(
+                f"Error parsing file {filename}: {e}",
+                exc_info=True,
+                extra={"file_name": filename, "file_path": file_path, "bucket": file_bucket},
+            )
+            raise
+
+    def _upload_content(self, parsed: ParsedContent) -> Dict[str, Any]:
+        """Agent input for a parsed upload, with 'quality_issues' if the gate found any."""
+        content = parsed.to_dict()
+        if self.quality_gate:
+            issues = assess_upload(parsed)
+            if issues:
+                content["quality_issues"] = [issue._asdict() for issue in issues]
+        return content
@@ -0,0 +1,88 @@
+"""Disk-backed cache of parsed uploads keyed by the stored object's content fingerprint."""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from src.ingestion.disk_cache import DiskCache
+from src.ingestion.storage_backend import ObjectInfo
+from src.models.parsed_content import ParsedContent
+
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "storyai-parse-cache")
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+# Bump when parser output changes so stale entries are never served
+PARSER_VERSION = 6
+
+
+def content_fingerprint(info: ObjectInfo, bucket_name: str, file_path: str) -> Optional[str]:
+    """
+    Identify an object's content from its metadata, without downloading it.
+
+    MD5 (or CRC32C and size) identify the bytes wherever they are stored, so a
+    deck re-uploaded under a new path still matches. Without a checksum the
+    generation only identifies one version of one object path.
+
+    Returns:
+        Fingerprint string, or None if the metadata cannot identify the content
+    """
+    if info.md5_hash:
+        return f"md5:{info.md5_hash}"
+    if info.crc32c:
+        return f"crc32c:{info.crc32c}:{info.size}"
+    if info.generation:
+        return f"generation:{bucket_name}/{file_path}#{info.generation}:{info.size}"
+    return None
+
+
+class ParseCache(DiskCache):
+    """
+    zstd-compressed ParsedContent entries on local disk, one file per fingerprint and type.
+
+    Entries expire after ttl_seconds and the least recently used are evicted
+    beyond max_bytes (see DiskCache).
+    """
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_CACHE_DIR,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            directory: Directory to store entries in (created if missing)
+            ttl_seconds: Maximum age of an entry before it is discarded
+            max_bytes: Total size limit for all entries
+        """
+        super().__init__(directory, ttl_seconds, max_bytes)
+
+    def _path(self, fingerprint: str, file_type: str, variant: str) -> Path:
+        return self._entry_path(f"{PARSER_VERSION}:{file_type}:{variant}:{fingerprint}")
+
+    def get(self, fingerprint: str, file_type: str, variant: str = "") -> Optional[ParsedContent]:
+        """
+        Return the cached content, or None if missing, expired or unreadable.
+
+        variant identifies parse settings (such as a sampling budget) that
+        change the output for the same file.
+        """
+        path = self._path(fingerprint, file_type, variant)
+        entry = self._read(path, f"{file_type} {fingerprint}")
+        if entry is None:
+            return None
+        self._touch(path)
+        self.record("hits")
+        return ParsedContent.model_validate(entry["content"])
+
+    def put(
+        self, fingerprint: str, file_type: str, content: ParsedContent, variant: str = ""
+    ) -> None:
+        """Store parsed content and evict old entries if over the size limit."""
+        self._write(
+            self._path(fingerprint, file_type, variant),
+            {"fingerprint": fingerprint, "content": content.model_dump()},
+        )
@@ -0,0 +1,189 @@
+"""Text extraction from PPTX files straight from the zip's slide and notes XML."""
+
+import posixpath
+import zipfile
+from io import BytesIO
+from typing import BinaryIO, Dict, List, NamedTuple, Optional, Tuple, Union
+
+import lxml.etree
+
+_P = "http://schemas.openxmlformats.org/presentationml/2006/main"
+_A = "http://schemas.openxmlformats.org/drawingml/2006/main"
+_R = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+_MC = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+
+_NOTES_SLIDE_REL = f"{_R}/notesSlide"
+_SLIDE_REL = f"{_R}/slide"
+
+_A_P = f"{{{_A}}}p"
+_A_T = f"{{{_A}}}t"
+_A_BR = f"{{{_A}}}br"
+
+
+class SlideText(NamedTuple):
+    """Text of one slide and its speaker notes."""
+
+    slide_number: int
+    text: str
+    notes: str = ""
+
+
+def _read_xml(archive: zipfile.ZipFile, part: str) -> lxml.etree._Element:
+    parser = lxml.etree.XMLParser(resolve_entities=False, no_network=True)
+    return lxml.etree.fromstring(archive.read(part), parser=parser)
+
+
+def _relationships(archive: zipfile.ZipFile, part: str) -> Dict[str, Tuple[str, str]]:
+    """Map relationship IDs of a part to (type, target part name)."""
+    directory, name = posixpath.split(part)
+    try:
+        root = _read_xml(archive, posixpath.join(directory, "_rels", f"{name}.rels"))
+    except KeyError:
+        return {}
+    relationships = {}
+    for relationship in root.iterfind(f"{{{_REL}}}Relationship"):
+        if relationship.get("TargetMode") == "External":
+            continue
+        target = posixpath.normpath(posixpath.join(directory, relationship.get("Target", "")))
+        relationships[relationship.get("Id")] = (relationship.get("Type"), target.lstrip("/"))
+    return relationships
+
+
+def slide_parts(archive: zipfile.ZipFile) -> List[Tuple[str, Optional[str]]]:
+    """
+    List (slide part, notes part or None) in presentation order.
+
+    Order comes from p:sldIdLst in ppt/presentation.xml, not from file names,
+    which need not match the order slides are shown in.
+    """
+    presentation = "ppt/presentation.xml"
+    relationships = _relationships(archive, presentation)
+    parts = []
+    for slide_id in _read_xml(archive, presentation).iterfind(f"{{{_P}}}sldIdLst/{{{_P}}}sldId"):
+        rel_type, slide_part = relationships.get(slide_id.get(f"{{{_R}}}id"), (None, None))
+        if rel_type != _SLIDE_REL:
+            continue
+        notes_part = next(
+            (
+                target
+                for rel_type, target in _relationships(archive, slide_part).values()
+                if rel_type == _NOTES_SLIDE_REL
+            ),
+            None,
+        )
+        parts.append((slide_part, notes_part))
+    return parts
+
+
+def _text_body(body: lxml.etree._Element, paragraph_separator: str = "\n") -> str:
+    paragraphs = []
+    for paragraph in body.iter(_A_P):
+        paragraphs.append(
+            "".join(
+                (element.text or "") if element.tag == _A_T else "\n"
+                for element in paragraph.iter(_A_T, _A_BR)
+            )
+        )
+    return paragraph_separator.join(paragraphs).strip()
+
+
+def _table_rows(table: lxml.etree._Element) -> List[str]:
+    rows = []
+    for row in table.iterfind(f"{{{_A}}}tr"):
+        cells = [_text_body(cell, " ") for cell in row.iterfind(f"{{{_A}}}tc")]
+        if any(cells):
+            rows.append(" | ".join(cell for cell in cells if cell))
+    return rows
+
+
+def _is_notes_body(shape: lxml.etree._Element) -> bool:
+    placeholder = shape.find(f"{{{_P}}}nvSpPr/{{{_P}}}nvPr/{{{_P}}}ph")
+    return placeholder is not None and placeholder.get("type") == "body"
+
+
+def shape_texts(container: lxml.etree._Element, notes: bool = False) -> List[str]:
+    """
+    Text of each shape in a shape tree, in z-order, descending into groups.
+
+    Tables become one ' | '-joined line per row. For notes slides only the
+    notes body placeholder is read (not the slide number or slide image).
+    """
+    texts = []
+    for child in container:
+        tag = lxml.etree.QName(child).localname if isinstance(child.tag, str) else None
+        if tag == "sp":
+            body = child.find(f"{{{_P}}}txBody")
+            if body is not None and (not notes or _is_notes_body(child)):
+                text = _text_body(body)
+                if text:
+                    texts.append(text)
+        elif tag == "grpSp":
+            texts.extend(shape_texts(child, notes))
+        elif tag == "graphicFrame" and not notes:
+            for table in child.iter(f"{{{_A}}}tbl"):
+                rows = _table_rows(table)
+                if rows:
+                    texts.append("\n".join(rows))
+        elif tag == "AlternateContent":
+            choice = child.find(f"{{{_MC}}}Choice")
+            if choice is not None:
+                texts.extend(shape_texts(choice, notes))
+    return texts
+
+
+def _part_text(archive: zipfile.ZipFile, part: str, notes: bool = False) -> str:
+    tree = _read_xml(archive, part).find(f"{{{_P}}}cSld/{{{_P}}}spTree")
+    return "\n".join(shape_texts(tree, notes)) if tree is not None else ""
+
+
+def _open_archive(file_content: Union[bytes, str, BinaryIO]) -> zipfile.ZipFile:
+    return zipfile.ZipFile(
+        BytesIO(file_content) if isinstance(file_content, bytes) else file_content
+    )
+
+
+class SlideDeck:
+    """Open PPTX archive whose slides are read individually by index."""
+
+    def __init__(self, file_content: Union[bytes, str, BinaryIO]):
+        """
+        Open a deck and read its slide order (no slide is read yet).
+
+        Raises:
+            KeyError: If the archive has no ppt/presentation.xml
+            zipfile.BadZipFile, lxml.etree.XMLSyntaxError: If the file is malformed
+        """
+        self._archive = _open_archive(file_content)
+        try:
+            self._parts = slide_parts(self._archive)
+        except BaseException:
+            self._archive.close()
+            raise
+
+    def __len__(self) -> int:
+        return len(self._parts)
+
+    def slide(self, index: int) -> SlideText:
+        """Text and speaker notes of the slide at a 0-based presentation index."""
+        slide_part, notes_part = self._parts[index]
+        return SlideText(
+            slide_number=index + 1,
+            text=_part_text(self._archive, slide_part),
+            notes=_part_text(self._archive, notes_part, notes=True) if notes_part else "",
+        )
+
+    def close(self) -> None:
+        self._archive.close()
+
+    def __enter__(self) -> "SlideDeck":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def slide_count(file_content: Union[bytes, str, BinaryIO]) -> int:
+    """Return the number of slides without reading any slide."""
+    with SlideDeck(file_content) as deck:
+        return len(deck)
@@ -0,0 +1,99 @@
+"""Disk-backed cache of scraped website content with conditional revalidation."""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from src.ingestion.disk_cache import DiskCache
+from src.models.scraped_content import PageContent, ScrapedContent
+
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "storyai-scrape-cache")
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Query parameters that never change page content
+_TRACKING_PARAM_PREFIXES = ("utm_", "gclid", "fbclid", "mc_", "_hs")
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalise a URL so equivalent spellings share a cache entry.
+
+    Lowercases scheme and host, drops default ports, fragments and tracking
+    parameters, sorts the query and gives empty paths a trailing slash.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.lower().startswith(_TRACKING_PARAM_PREFIXES)
+        )
+    )
+    return urlunsplit((scheme, host, parts.path or "/", query, ""))
+
+
+class ScrapeCache(DiskCache):
+    """
+    zstd-compressed ScrapedContent entries on local disk, one file per canonical URL.
+
+    Entries expire after ttl_seconds and the least recently used are evicted
+    beyond max_bytes (see DiskCache).
+    """
+
+    METRICS = DiskCache.METRICS + ("stale",)
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_CACHE_DIR,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            directory: Directory to store entries in (created if missing)
+            ttl_seconds: Maximum age of an entry before it is discarded
+            max_bytes: Total size limit for all entries
+        """
+        super().__init__(directory, ttl_seconds, max_bytes)
+
+    def _path(self, url: str) -> Path:
+        return self._entry_path(canonicalize_url(url))
+
+    def get(self, url: str) -> Optional[ScrapedContent]:
+        """
+        Return the cached content for url, or None if missing, expired or unreadable.
+
+        Does not record hit/stale metrics; the caller does that after revalidating.
+        """
+        entry = self._read(self._path(url), url)
+        return ScrapedContent.model_validate(entry["content"]) if entry else None
+
+    def touch(self, url: str) -> None:
+        """Mark an entry as recently used."""
+        self._touch(self._path(url))
+
+    def put(self, url: str, content: ScrapedContent) -> None:
+        """Store content for url and evict old entries if over the size limit."""
+        self._write(
+            self._path(url), {"url": canonicalize_url(url), "content": content.model_dump()}
+        )
+
+
+def page_validators(page: PageContent) -> Dict[str, str]:
+    """Conditional request headers for revalidating a cached page."""
+    headers = {}
+    if page.etag:
+        headers["If-None-Match"] = page.etag
+    if page.last_modified:
+        headers["If-Modified-Since"] = page.last_modified
+    return headers
@@ -1,24 +1,111 @@
 """Web scraper for extracting content from websites."""
 
 import re
-from typing import Optional
+import time
+from typing import Iterable, List, NamedTuple, Optional
 from urllib.parse import urljoin, urlparse
 from urllib.robotparser import RobotFileParser
 
+import lxml.html
 import requests
 
 from playwright.sync_api import (
     sync_playwright,
+    BrowserContext,
     Page,
+    Route,
     TimeoutError as PlaywrightTimeoutError,
     Error as PlaywrightError,
 )
 
+from src.ingestion.browser_pool import BrowserPool, BrowserPoolClosedError
+from src.ingestion.content_extractor import ExtractedContent, extract_main_content
+from src.ingestion.crawler import CrawlBudget, crawl_site
+from src.ingestion.http_client import TTLCache, get_session
+from src.ingestion.scrape_cache import ScrapeCache, page_validators
+from src.ingestion.text_stats import count_words, text_stats
 from src.models.scraped_content import ScrapedContent, PageContent
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Minimum words across homepage and About page for an evaluation
+MIN_CONTENT_WORDS = 200
+
+# Common About page patterns
+ABOUT_PAGE_PATTERNS = [
+    r"/about",
+    r"/about-us",
+    r"/about/",
+    r"/company",
+    r"/who-we-are",
+]
+
+# Static HTML fetches give up quickly; the browser path is the fallback.
+STATIC_FETCH_TIMEOUT_SECONDS = 10
+ROBOTS_TIMEOUT_SECONDS = 5
+REDIRECT_PROBE_TIMEOUT_SECONDS = 5
+# A pooled browser job may wait `timeout` for the homepage and again for the
+# About page, plus this margin for context setup and text extraction
+BROWSER_JOB_MARGIN_SECONDS = 10
+
+# Parsed robots.txt rules per host and resolved redirect chains per URL, so
+# repeat submissions for the same site skip those round trips
+ROBOTS_CACHE_TTL_SECONDS = 3600
+REDIRECT_CACHE_TTL_SECONDS = 3600
+_robots_cache = TTLCache(ttl_seconds=ROBOTS_CACHE_TTL_SECONDS)
+_redirect_cache = TTLCache(ttl_seconds=REDIRECT_CACHE_TTL_SECONDS)
+
+# Fast page-load mode: resources that are never needed to read page text
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+TRACKER_DOMAINS = [
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "facebook.net",
+    "hotjar.com",
+    "segment.com",
+    "segment.io",
+    "mixpanel.com",
+    "clarity.ms",
+    "fullstory.com",
+    "optimizely.com",
+    "hs-analytics.net",
+    "hs-scripts.com",
+    "hsadspixel.net",
+    "snap.licdn.com",
+    "ads-twitter.com",
+    "intercom.io",
+    "intercomcdn.com",
+    "drift.com",
+    "driftt.com",
+    "zdassets.com",
+    "livechatinc.com",
+    "youtube.com",
+    "vimeo.com",
+]
+# After domcontentloaded, wait until body text length stops changing
+TEXT_STABILITY_TIMEOUT_MS = 5000
+TEXT_STABILITY_INTERVAL_MS = 250
+TEXT_STABILITY_CHECKS = 2
+
+_BODY_TEXT_LENGTH_SCRIPT = "() => document.body ? document.body.innerText.length : 0"
+_LINKS_SCRIPT = (
+    "() => Array.from(document.querySelectorAll('a[href]'), a => a.getAttribute('href'))"
+)
+
+# Client-side app mount points that are empty until JavaScript runs
+_SPA_ROOT_IDS = {"root", "app", "__next", "__nuxt", "___gatsby", "svelte"}
+_VISIBLE_TEXT_XPATH = (
+    "//body//text()[not(ancestor::script or ancestor::style or ancestor::noscript"
+    " or ancestor::template or ancestor::svg)]"
+)
+_JS_REQUIRED_PATTERN = re.compile(
+    r"(enable|requires?|turn on)\s+javascript|javascript\s+(is\s+)?(required|disabled)",
+    re.IGNORECASE,
+)
+
 
 class ScrapingError(Exception):
     """Exception raised for scraping errors."""
@@ -32,20 +119,31 @@ class InsufficientContentError(ScrapingError):
     pass
 
 
-def count_words(text: str) -> int:
-    """Count words in text."""
-    return len(re.findall(r"\b\w+\b", text))
+def fetch_robots_rules(robots_url: str) -> RobotFileParser:
+    """Fetch and parse robots.txt over the shared session, with a short timeout."""
+    rp = RobotFileParser()
+    rp.set_url(robots_url)
+    response = get_session().get(robots_url, timeout=ROBOTS_TIMEOUT_SECONDS)
+    # Same status handling as RobotFileParser.read()
+    if response.status_code in (401, 403):
+        rp.disallow_all = True
+    elif response.status_code >= 400:
+        rp.allow_all = True
+    else:
+        rp.parse(response.text.splitlines())
+    return rp
 
 
 def check_robots_txt(url: str) -> bool:
-    """Check if URL is allowed by robots.txt."""
+    """Check if URL is allowed by robots.txt (rules are cached per host)."""
     try:
         parsed = urlparse(url)
-        robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
+        host = f"{parsed.scheme}://{parsed.netloc}"
 
-        rp = RobotFileParser()
-        rp.set_url(robots_url)
-        rp.read()
+        rp = _robots_cache.get(host)
+        if rp is None:
+            rp = fetch_robots_rules(f"{host}/robots.txt")
+            _robots_cache.set(host, rp)
 
         return rp.can_fetch("*", url)
     except Exception as e:
@@ -54,69 +152,519 @@ def check_robots_txt(url: str) -> bool:
         return True
 
 
+def match_about_page_url(homepage_url: str, hrefs: Iterable[Optional[str]]) -> Optional[str]:
+    """Return the first link (made absolute) whose path looks like an About page."""
+    for href in hrefs:
+        if not href:
+            continue
+
+        # Make absolute URL
+        absolute_url = urljoin(homepage_url, href)
+        parsed = urlparse(absolute_url)
+
+        # Check if it matches About page patterns
+        for pattern in ABOUT_PAGE_PATTERNS:
+            if re.search(pattern, parsed.path, re.IGNORECASE):
+                return absolute_url
+
+    return None
+
+
+def absolute_links(page_url: str, hrefs: Iterable[Optional[str]]) -> List[str]:
+    """Resolve hrefs against the page URL, dropping empties and duplicates."""
+    return list(dict.fromkeys(urljoin(page_url, href) for href in hrefs if href))
+
+
 def find_about_page_url(homepage_url: str, page: Page) -> Optional[str]:
     """Find About page URL from homepage."""
     try:
-        # Common About page patterns
-        about_patterns = [
-            r"/about",
-            r"/about-us",
-            r"/about/",
-            r"/company",
-            r"/who-we-are",
-        ]
-
-        # Get all links
-        links = page.query_selector_all("a[href]")
-        for link in links:
-            href = link.get_attribute("href")
-            if not href:
-                continue
-
-            # Make absolute URL
-            absolute_url = urljoin(homepage_url, href)
-            parsed = urlparse(absolute_url)
-
-            # Check if it matches About page patterns
-            for pattern in about_patterns:
-                if re.search(pattern, parsed.path, re.IGNORECASE):
-                    return absolute_url
-
-        return None
+        # Get all links in a single round trip
+        return match_about_page_url(homepage_url, page.evaluate(_LINKS_SCRIPT))
     except Exception as e:
         logger.warning(f"Error finding About page: {e}")
         return None
 
 
-def scrape_page(page: Page, url: str, timeout: int = 30000) -> PageContent:
+def extract_text_from_html(document: lxml.html.HtmlElement) -> str:
+    """Extract all visible body text, boilerplate included, from a parsed HTML document."""
+    text = " ".join(document.xpath(_VISIBLE_TEXT_XPATH))
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def looks_like_spa_shell(document: lxml.html.HtmlElement, text: str) -> bool:
+    """
+    Heuristically detect a client-rendered page whose static HTML has no real content.
+
+    Args:
+        document: Parsed static HTML
+        text: Visible text extracted from the document
+    """
+    # Empty client-side app mount point
+    for element in document.xpath("//body//*[@id]"):
+        if element.get("id") in _SPA_ROOT_IDS and not element.text_content().strip():
+            return True
+
+    # The remaining signals also appear on server-rendered pages, so only trust
+    # them when there is little static text
+    if count_words(text) >= 2 * MIN_CONTENT_WORDS:
+        return False
+
+    # "Please enable JavaScript" notices
+    if _JS_REQUIRED_PATTERN.search(" ".join(document.xpath("//noscript//text()"))):
+        return True
+
+    # Mostly script payload with hardly any text
+    script_chars = sum(len(script.text or "") for script in document.xpath("//script"))
+    return script_chars > 20 * max(len(text), 1)
+
+
+def fetch_static_page(url: str, timeout: int = 30000) -> Optional[tuple]:
+    """
+    Fetch a page over plain HTTP and extract its text without a browser.
+
+    Returns:
+        Tuple of (PageContent, parsed document, spa_shell flag), or None if the
+        page could not be fetched as HTML
+    """
+    try:
+        response = get_session().get(url, timeout=min(timeout / 1000, STATIC_FETCH_TIMEOUT_SECONDS))
+    except requests.RequestException as e:
+        logger.info(f"Static fetch failed for {url}: {e}")
+        return None
+
+    content_type = response.headers.get("Content-Type", "")
+    if response.status_code >= 400 or "html" not in content_type.lower():
+        logger.info(
+            f"Static fetch unusable for {url}",
+            {"status": response.status_code, "content_type": content_type},
+        )
+        return None
+
+    try:
+        document = lxml.html.document_fromstring(response.content)
+    except (lxml.etree.ParserError, ValueError) as e:
+        logger.info(f"Could not parse static HTML for {url}: {e}")
+        return None
+
+    spa_shell = looks_like_spa_shell(document, extract_text_from_html(document))
+    content = extract_main_content(document)
+    stats = text_stats(content.text, line_paragraphs=True)
+    page = PageContent(
+        text=content.text,
+        url=response.url,
+        word_count=stats.words,
+        stats=stats,
+        outline=content.outline,
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+    )
+    return page, document, spa_shell
+
+
+def scrape_static(url: str, timeout: int = 30000) -> Optional[ScrapedContent]:
+    """
+    Scrape homepage and About page over plain HTTP.
+
+    Returns:
+        ScrapedContent, or None if the site needs a real browser (fetch failed,
+        too little static text, or the page looks like an empty SPA shell)
+    """
+    fetched = fetch_static_page(url, timeout)
+    if fetched is None:
+        return None
+    homepage, document, spa_shell = fetched
+    if spa_shell:
+        logger.info("Static homepage looks like a SPA shell", {"url": url})
+        return None
+
+    about_page = None
+    homepage.links = absolute_links(homepage.url, document.xpath("//a/@href"))
+    about_url = match_about_page_url(homepage.url, homepage.links)
+    if about_url:
+        fetched_about = fetch_static_page(about_url, timeout)
+        # A failed About page falls back to homepage only, as in the browser path
+        if fetched_about is not None and not fetched_about[2]:
+            about_page = fetched_about[0]
+
+    total_words = homepage.word_count + (about_page.word_count if about_page else 0)
+    if total_words < MIN_CONTENT_WORDS:
+        logger.info(
+            "Static text below word threshold",
+            {"url": url, "word_count": total_words, "threshold": MIN_CONTENT_WORDS},
+        )
+        return None
+
+    return ScrapedContent(
+        homepage=homepage,
+        about_page=about_page,
+        total_word_count=total_words,
+    )
+
+
+def is_tracker_url(url: str) -> bool:
+    """Check whether a request URL belongs to a known analytics/chat/video domain."""
+    host = urlparse(url).hostname or ""
+    return any(host == domain or host.endswith("." + domain) for domain in TRACKER_DOMAINS)
+
+
+def block_heavy_resources(context: BrowserContext) -> None:
+    """Abort image, media, font and tracker requests for every page in the context."""
+
+    def handle(route: Route) -> None:
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or is_tracker_url(request.url):
+            route.abort()
+        else:
+            route.continue_()
+
+    context.route("**/*", handle)
+
+
+def wait_for_text_stable(page: Page, timeout: int = TEXT_STABILITY_TIMEOUT_MS) -> None:
+    """
+    Wait until the body text length stops changing, or the timeout passes.
+
+    Replaces networkidle, which never settles on pages with beacons or chat widgets.
+    """
+    deadline = time.monotonic() + timeout / 1000
+    last_length = -1
+    stable_checks = 0
+    while time.monotonic() < deadline:
+        length = page.evaluate(_BODY_TEXT_LENGTH_SCRIPT)
+        if length == last_length and length > 0:
+            stable_checks += 1
+            if stable_checks >= TEXT_STABILITY_CHECKS:
+                return
+        else:
+            stable_checks = 0
+            last_length = length
+        page.wait_for_timeout(TEXT_STABILITY_INTERVAL_MS)
+
+
+def start_navigation(page: Page, url: str, timeout: int = 30000):
+    """
+    Start loading url and return as soon as the response is committed.
+
+    The browser keeps loading the page in the background, so other work can
+    overlap with it until wait_until_ready() is called.
+
+    Returns:
+        Playwright Response (or None)
+    """
+    return page.goto(url, wait_until="commit", timeout=timeout)
+
+
+def wait_until_ready(page: Page, timeout: int = 30000, fast_mode: bool = True) -> None:
+    """
+    Wait until the current page's text is ready to read.
+
+    Fast mode waits for domcontentloaded plus text stability instead of networkidle.
+    """
+    page.wait_for_load_state("domcontentloaded" if fast_mode else "networkidle", timeout=timeout)
+    if fast_mode:
+        wait_for_text_stable(page, min(timeout, TEXT_STABILITY_TIMEOUT_MS))
+
+
+def navigate(page: Page, url: str, timeout: int = 30000, fast_mode: bool = True):
+    """
+    Navigate to url and wait until its text is ready.
+
+    Returns:
+        Playwright Response (or None)
+    """
+    response = start_navigation(page, url, timeout)
+    wait_until_ready(page, timeout, fast_mode)
+    return response
+
+
+def extract_page_content(page: Page, url: str, response=None) -> PageContent:
+    """
+    Extract main-content text and heading outline from the currently loaded page.
+
+    The rendered DOM is parsed with the same extractor as the static path, so
+    navigation, headers, footers and consent banners are left out.
+
+    Args:
+        page: Loaded Playwright page
+        url: URL to record for the page
+        response: Navigation response, used to record ETag/Last-Modified
+    """
+    try:
+        content = extract_main_content(lxml.html.document_fromstring(page.content()))
+    except (lxml.etree.ParserError, ValueError):
+        # Empty or unparseable document
+        content = ExtractedContent(text="", outline=[])
+    headers = response.headers if response else {}
+    stats = text_stats(content.text, line_paragraphs=True)
+    return PageContent(
+        text=content.text,
+        url=url,
+        word_count=stats.words,
+        stats=stats,
+        outline=content.outline,
+        etag=headers.get("etag"),
+        last_modified=headers.get("last-modified"),
+    )
+
+
+def scrape_page(page: Page, url: str, timeout: int = 30000, fast_mode: bool = True) -> PageContent:
     """Scrape content from a single page."""
     try:
-        response = page.goto(url, wait_until="networkidle", timeout=timeout)
+        response = navigate(page, url, timeout, fast_mode)
         if response and response.status >= 400:
             raise ScrapingError(f"HTTP {response.status} error for {url}")
 
-        # Extract text content
-        text = page.inner_text("body")
-        # Clean up text
-        text = re.sub(r"\s+", " ", text).strip()
-
-        word_count = count_words(text)
-
-        return PageContent(text=text, url=url, word_count=word_count)
+        return extract_page_content(page, url, response)
     except PlaywrightTimeoutError:
         raise ScrapingError(f"Timeout while scraping {url}")
     except Exception as e:
         raise ScrapingError(f"Error scraping {url}: {str(e)}")
 
 
-def scrape_website(url: str, timeout: int = 30000, max_redirects: int = 5) -> ScrapedContent:
+class RedirectChain(NamedTuple):
+    """Result of following a URL's redirects."""
+
+    urls: List[str]  # Requested URL followed by each redirect target
+    loop_url: Optional[str]  # URL that was visited twice, if the chain loops
+    complete: bool  # False if probing stopped at the redirect limit
+
+
+def follow_redirects(url: str, max_redirects: int = 5) -> RedirectChain:
+    """
+    Follow up to max_redirects + 1 redirects with the shared session.
+
+    Raises:
+        requests.RequestException: If a probe request fails
+    """
+    # Count redirects by following them manually
+    urls = [url]
+    visited_urls = {url}
+
+    # Follow redirects manually to count them
+    while len(urls) - 1 < max_redirects + 1:  # Check one more than max to detect excess
+        # Use GET instead of HEAD as some servers don't support HEAD for redirects
+        check_response = get_session().get(
+            urls[-1], allow_redirects=False, timeout=REDIRECT_PROBE_TIMEOUT_SECONDS, stream=True
+        )
+        # Close the connection immediately to avoid downloading content
+        check_response.close()
+
+        # Check if it's a redirect (3xx status)
+        if check_response.status_code not in (301, 302, 303, 307, 308):
+            # Not a redirect, we're done
+            return RedirectChain(urls, None, True)
+
+        redirect_location = check_response.headers.get("Location")
+        if not redirect_location:
+            return RedirectChain(urls, None, True)
+
+        # Make absolute URL
+        redirect_url = urljoin(urls[-1], redirect_location)
+
+        # Check for redirect loops
+        if redirect_url in visited_urls:
+            return RedirectChain(urls, redirect_url, True)
+
+        visited_urls.add(redirect_url)
+        urls.append(redirect_url)
+
+    return RedirectChain(urls, None, False)
+
+
+def check_redirects(url: str, max_redirects: int = 5) -> None:
+    """
+    Follow the redirect chain for url and reject loops or excessive redirects.
+
+    Playwright follows redirects automatically, so the chain is checked with
+    requests before the browser is used. Fully resolved chains are cached per URL.
+
+    Raises:
+        ScrapingError: On a redirect loop or more than max_redirects redirects
+    """
+    chain = _redirect_cache.get(url)
+    if chain is None:
+        try:
+            chain = follow_redirects(url, max_redirects)
+        except requests.RequestException:
+            # If requests fails, proceed with Playwright and let it handle redirects
+            # This is a fallback for cases where requests can't access the URL
+            return
+        if chain.complete:
+            _redirect_cache.set(url, chain)
+
+    if chain.loop_url:
+        raise ScrapingError(f"Redirect loop detected: {chain.loop_url} already visited")
+
+    # If we've exceeded max redirects, raise error
+    redirect_count = len(chain.urls) - 1
+    if redirect_count > max_redirects:
+        raise ScrapingError(f"Too many redirects ({redirect_count} > {max_redirects}) for {url}")
+
+
+def _start_about_page(context: BrowserContext, about_url: str, timeout: int) -> Optional[tuple]:
+    """Open the About page in its own tab and start loading it. Returns (tab, response)."""
+    tab = context.new_page()
+    try:
+        return tab, start_navigation(tab, about_url, timeout)
+    except (PlaywrightTimeoutError, PlaywrightError) as e:
+        logger.warning(f"Could not load About page: {e}")
+        tab.close()
+        return None
+
+
+def _finish_about_page(
+    started: tuple, about_url: str, timeout: int, fast_mode: bool
+) -> Optional[PageContent]:
+    """Wait for a started About page load and extract it, or None if it failed."""
+    tab, response = started
+    try:
+        if response and response.status >= 400:
+            logger.warning(
+                f"Could not scrape About page: HTTP {response.status} error for {about_url}"
+            )
+            return None
+        wait_until_ready(tab, timeout, fast_mode)
+        return extract_page_content(tab, about_url, response)
+    except PlaywrightTimeoutError as e:
+        logger.warning(f"Timeout scraping About page: {e}")
+    except PlaywrightError as e:
+        logger.warning(f"Error scraping About page: {e}")
+    finally:
+        tab.close()
+    # Continue without About page
+    return None
+
+
+def scrape_with_context(
+    context: BrowserContext, url: str, timeout: int = 30000, fast_mode: bool = True
+) -> ScrapedContent:
+    """
+    Scrape homepage and About page using an existing browser context.
+
+    The About link is read from the homepage DOM as soon as it is parsed, and the
+    About page loads in a second tab while the homepage finishes loading and its
+    text is extracted.
+
+    Args:
+        context: Isolated browser context (closed by the caller)
+        url: URL to scrape
+        timeout: Timeout in milliseconds
+        fast_mode: Block heavy resources and trackers, and wait for text stability
+            instead of network idle
+
+    Returns:
+        ScrapedContent object with homepage and optionally About page
+
+    Raises:
+        ScrapingError: If scraping fails
+        InsufficientContentError: If content is less than 200 words
+    """
+    if fast_mode:
+        block_heavy_resources(context)
+    page = context.new_page()
+
+    try:
+        # Now use Playwright to actually scrape the content
+        # Playwright will follow redirects automatically
+        try:
+            response = start_navigation(page, url, timeout)
+            if response and response.status >= 400:
+                raise ScrapingError(f"HTTP {response.status} error for {url}")
+            page.wait_for_load_state("domcontentloaded", timeout=timeout)
+        except PlaywrightTimeoutError as e:
+            raise ScrapingError(f"Timeout while accessing {url}: {str(e)}") from e
+        except PlaywrightError as e:
+            raise ScrapingError(f"Error accessing {url}: {str(e)}") from e
+
+        final_url = page.url
+
+        # Start the About page load now so it overlaps with the homepage
+        about_url = find_about_page_url(final_url, page)
+        about_started = _start_about_page(context, about_url, timeout) if about_url else None
+
+        # Scrape homepage
+        try:
+            wait_until_ready(page, timeout, fast_mode)
+            homepage = extract_page_content(page, final_url, response)
+        except PlaywrightTimeoutError as e:
+            raise ScrapingError(f"Timeout while scraping {final_url}: {str(e)}") from e
+        except PlaywrightError as e:
+            raise ScrapingError(f"Error scraping {final_url}: {str(e)}") from e
+
+        # Client-rendered navigation may only exist once the page has rendered,
+        # so read links again for the About fallback and the crawl frontier
+        try:
+            homepage.links = absolute_links(final_url, page.evaluate(_LINKS_SCRIPT))
+        except PlaywrightError as e:
+            logger.warning(f"Error reading homepage links: {e}")
+        if about_url is None:
+            about_url = match_about_page_url(final_url, homepage.links)
+            if about_url:
+                about_started = _start_about_page(context, about_url, timeout)
+
+        about_page = None
+        if about_started:
+            about_page = _finish_about_page(about_started, about_url, timeout, fast_mode)
+
+        # Calculate total word count
+        total_words = homepage.word_count
+        if about_page:
+            total_words += about_page.word_count
+
+        # Check minimum content requirement
+        if total_words < MIN_CONTENT_WORDS:
+            raise InsufficientContentError(
+                f"Insufficient content: {total_words} words (minimum 200 required)"
+            )
+
+        return ScrapedContent(
+            homepage=homepage,
+            about_page=about_page,
+            total_word_count=total_words,
+        )
+
+    except (ScrapingError, InsufficientContentError):
+        # Re-raise our custom errors
+        raise
+    except PlaywrightTimeoutError as e:
+        # Wrap Playwright timeout errors
+        raise ScrapingError(f"Timeout while scraping {url}: {str(e)}") from e
+    except PlaywrightError as e:
+        # Wrap other Playwright errors
+        raise ScrapingError(f"Error scraping {url}: {str(e)}") from e
+
+
+def scrape_website(
+    url: str,
+    timeout: int = 30000,
+    max_redirects: int = 5,
+    browser_pool: Optional[BrowserPool] = None,
+    static_first: bool = True,
+    fast_mode: bool = True,
+    cache: Optional[ScrapeCache] = None,
+    crawl: Optional[CrawlBudget] = None,
+) -> ScrapedContent:
     """
     Scrape website content (homepage and About page).
 
+    Server-rendered sites are fetched over plain HTTP first. The headless browser
+    is only used when the static text is below the word threshold or the page
+    looks like an empty client-side app shell.
+
     Args:
         url: URL to scrape
         timeout: Timeout in milliseconds
         max_redirects: Maximum number of redirects to follow
+        browser_pool: Pool of warm browsers to scrape with. If omitted, a browser
+            is launched for this call only.
+        static_first: Try a plain HTTP fetch before the browser
+        fast_mode: In the browser, block images, media, fonts and trackers, and wait
+            for text stability instead of network idle
+        cache: Scrape cache. A cached result is reused when every page revalidates
+            with a 304 Not Modified response, skipping the fetch and browser.
+        crawl: Crawl mode budget. When set, the top-ranked product, solution,
+            customer and About pages linked from the homepage or listed in
+            sitemap.xml are fetched in parallel as additional pages.
 
     Returns:
         ScrapedContent object with homepage and optionally About page
@@ -129,127 +677,136 @@ def scrape_website(url: str, timeout: int = 30000, max_redirects: int = 5) -> Sc
     if not check_robots_txt(url):
         raise ScrapingError(f"robots.txt disallows scraping of {url}")
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context()
-        page = context.new_page()
-
-        try:
-            # Check redirect count using requests (Playwright follows redirects automatically)
-            # This allows us to detect redirect chains before using Playwright
-            try:
-                # Count redirects by following them manually
-                redirect_count = 0
-                current_check_url = url
-                visited_urls = {current_check_url}
-
-                # Follow redirects manually to count them
-                while (
-                    redirect_count < max_redirects + 1
-                ):  # Check one more than max to detect excess
-                    # Use GET instead of HEAD as some servers don't support HEAD for redirects
-                    check_response = requests.get(
-                        current_check_url, allow_redirects=False, timeout=10, stream=True
-                    )
-                    # Close the connection immediately to avoid downloading content
-                    check_response.close()
-
-                    # Check if it's a redirect (3xx status)
-                    if check_response.status_code in (301, 302, 303, 307, 308):
-                        redirect_location = check_response.headers.get("Location")
-                        if not redirect_location:
-                            break
-
-                        # Make absolute URL
-                        redirect_url = urljoin(current_check_url, redirect_location)
-
-                        # Check for redirect loops
-                        if redirect_url in visited_urls:
-                            raise ScrapingError(
-                                f"Redirect loop detected: {redirect_url} already visited"
-                            )
-
-                        visited_urls.add(redirect_url)
-                        redirect_count += 1
-                        current_check_url = redirect_url
-
-                        # If we've exceeded max redirects, raise error
-                        if redirect_count > max_redirects:
-                            raise ScrapingError(
-                                f"Too many redirects ({redirect_count} > {max_redirects}) for {url}"
-                            )
-                    else:
-                        # Not a redirect, we're done
-                        break
-            except requests.RequestException:
-                # If requests fails, proceed with Playwright and let it handle redirects
-                # This is a fallback for cases where requests can't access the URL
-                pass
-
-            # Now use Playwright to actually scrape the content
-            # Playwright will follow redirects automatically
-            try:
-                response = page.goto(url, wait_until="networkidle", timeout=timeout)
-            except PlaywrightTimeoutError as e:
-                raise ScrapingError(f"Timeout while accessing {url}: {str(e)}") from e
-            except PlaywrightError as e:
-                raise ScrapingError(f"Error accessing {url}: {str(e)}") from e
+    check_redirects(url, max_redirects)
+
+    started = time.monotonic()
+    scraped = None
+    path = "cache"
+    if cache is not None:
+        cached = cache.get(url)
+        if cached is not None:
+            if revalidate(cached):
+                cache.record("hits")
+                cache.touch(url)
+                scraped = cached
+            else:
+                cache.record("stale")
+
+    if scraped is None:
+        path = "http"
+        if static_first:
+            scraped = scrape_static(url, timeout)
+        if scraped is None:
+            path = "browser"
+            scraped = scrape_with_browser(url, timeout, browser_pool, fast_mode)
+
+    crawled = False
+    if crawl is not None and not scraped.additional_pages:
+        scraped = add_crawled_pages(scraped, crawl, timeout)
+        crawled = bool(scraped.additional_pages)
+    _log_scrape_path(url, path, started, scraped)
+
+    if cache is not None and (path != "cache" or crawled):
+        cache.put(url, scraped)
+    return scraped
+
+
+def fetch_crawl_page(url: str, timeout: int = 30000) -> Optional[PageContent]:
+    """Fetch a crawled page over plain HTTP, or None if it is unusable or a SPA shell."""
+    fetched = fetch_static_page(url, timeout)
+    if fetched is None or fetched[2]:
+        return None
+    return fetched[0]
 
-            if response and response.status >= 400:
-                raise ScrapingError(f"HTTP {response.status} error for {url}")
 
-            final_url = page.url
+def add_crawled_pages(
+    scraped: ScrapedContent, budget: CrawlBudget, timeout: int = 30000
+) -> ScrapedContent:
+    """
+    Crawl the site's top-ranked pages and return scraped content including them.
 
-            # Scrape homepage
-            try:
-                homepage = scrape_page(page, final_url, timeout)
-            except PlaywrightTimeoutError as e:
-                raise ScrapingError(f"Timeout while scraping {final_url}: {str(e)}") from e
-            except PlaywrightError as e:
-                raise ScrapingError(f"Error scraping {final_url}: {str(e)}") from e
+    Pages are fetched over plain HTTP in parallel; pages that only render in a
+    browser are skipped rather than holding up the scrape.
+    """
+    exclude = [scraped.about_page.url] if scraped.about_page else []
+    additional_pages = crawl_site(
+        scraped.homepage,
+        lambda page_url: fetch_crawl_page(page_url, timeout),
+        budget,
+        exclude=exclude,
+        is_allowed=check_robots_txt,
+    )
+    return scraped.model_copy(
+        update={
+            "additional_pages": additional_pages,
+            "total_word_count": scraped.total_word_count
+            + sum(page.word_count for page in additional_pages),
+        }
+    )
+
+
+def revalidate(content: ScrapedContent) -> bool:
+    """
+    Check with conditional requests whether every cached page is unchanged.
 
-            # Find and scrape About page
-            about_page = None
-            about_url = find_about_page_url(final_url, page)
-            if about_url:
-                try:
-                    about_page = scrape_page(page, about_url, timeout)
-                except ScrapingError as e:
-                    logger.warning(f"Could not scrape About page: {e}")
-                    # Continue without About page
-                except PlaywrightTimeoutError as e:
-                    logger.warning(f"Timeout scraping About page: {e}")
-                    # Continue without About page
-                except PlaywrightError as e:
-                    logger.warning(f"Error scraping About page: {e}")
-                    # Continue without About page
-
-            # Calculate total word count
-            total_words = homepage.word_count
-            if about_page:
-                total_words += about_page.word_count
-
-            # Check minimum content requirement
-            if total_words < 200:
-                raise InsufficientContentError(
-                    f"Insufficient content: {total_words} words (minimum 200 required)"
-                )
-
-            return ScrapedContent(
-                homepage=homepage,
-                about_page=about_page,
-                total_word_count=total_words,
+    Returns:
+        True only if all pages have validators and the server answers 304
+    """
+    for page in content.pages():
+        headers = page_validators(page)
+        if not headers:
+            return False
+        try:
+            response = get_session().get(
+                page.url, headers=headers, timeout=STATIC_FETCH_TIMEOUT_SECONDS, stream=True
             )
-
-        except (ScrapingError, InsufficientContentError):
-            # Re-raise our custom errors
-            raise
-        except PlaywrightTimeoutError as e:
-            # Wrap Playwright timeout errors
-            raise ScrapingError(f"Timeout while scraping {url}: {str(e)}") from e
-        except PlaywrightError as e:
-            # Wrap other Playwright errors
+            response.close()
+        except requests.RequestException as e:
+            logger.info(f"Revalidation failed for {page.url}: {e}")
+            return False
+        if response.status_code != 304:
+            return False
+    return True
+
+
+def _log_scrape_path(url: str, path: str, started: float, scraped: ScrapedContent) -> None:
+    logger.info(
+        "Scrape completed",
+        {
+            "url": url,
+            "path": path,
+            "duration_ms": round((time.monotonic() - started) * 1000),
+            "word_count": scraped.total_word_count,
+        },
+    )
+
+
+def scrape_with_browser(
+    url: str,
+    timeout: int = 30000,
+    browser_pool: Optional[BrowserPool] = None,
+    fast_mode: bool = True,
+) -> ScrapedContent:
+    """Scrape with headless Chromium, from the pool if given or a one-off launch."""
+    if browser_pool is not None:
+        job_timeout = 2 * timeout / 1000 + BROWSER_JOB_MARGIN_SECONDS
+        try:
+            return browser_pool.run(
+                lambda context: scrape_with_context(context, url, timeout, fast_mode),
+                timeout=job_timeout,
+            )
+        except TimeoutError as e:
+            # Raised by the pool; the job's slot is freed at the same deadline
+            raise ScrapingError(f"Timeout while scraping {url}: no result in {job_timeout}s") from e
+        except (PlaywrightError, BrowserPoolClosedError) as e:
+            # Browser launch or context creation failed in the pool
             raise ScrapingError(f"Error scraping {url}: {str(e)}") from e
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        context = browser.new_context()
+        try:
+            return scrape_with_context(context, url, timeout, fast_mode)
         finally:
             context.close()
             browser.close()
@@ -0,0 +1,385 @@
+"""Fixed pool of separate worker processes that run website scrapes."""
+
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+from multiprocessing.connection import Connection
+from typing import Any, Dict, List, Optional
+
+from src.ingestion.browser_pool import BrowserPool
+from src.ingestion.crawler import CrawlBudget
+from src.ingestion.scrape_cache import ScrapeCache
+from src.ingestion.scraper import InsufficientContentError, ScrapingError, scrape_website
+from src.models.scraped_content import ScrapedContent
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_WORKER_COUNT = 2
+# Upper bound for one scrape, including robots/redirect checks and the crawl
+DEFAULT_JOB_TIMEOUT_SECONDS = 90.0
+# Resident memory of a worker and its Chromium processes before it is recycled
+DEFAULT_MAX_WORKER_RSS_BYTES = 1024 * 1024 * 1024
+DEFAULT_MAX_JOBS_PER_WORKER = 200
+WORKER_STOP_TIMEOUT_SECONDS = 10.0
+# Idle-queue entry for a slot whose worker could not be started; the next job
+# that takes the slot starts the worker
+_RESPAWN = object()
+
+
+class ScraperWorkerPoolClosedError(Exception):
+    """Exception raised when a scrape is requested from a pool that has been shut down."""
+
+    pass
+
+
+def _read_proc_stat(pid: str) -> Optional[List[str]]:
+    """Return the /proc/<pid>/stat fields after the command name, or None."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            stat = f.read()
+    except OSError:
+        return None
+    return stat[stat.rfind(")") + 2 :].split()
+
+
+def session_pids(session_id: int) -> List[int]:
+    """
+    List processes in a session (Linux only).
+
+    Workers start their own session, so this covers the worker, the Playwright
+    driver and every Chromium process it launched.
+    """
+    if not os.path.isdir("/proc"):
+        return []
+    pids = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        fields = _read_proc_stat(entry)
+        if fields and int(fields[3]) == session_id:
+            pids.append(int(entry))
+    return pids
+
+
+def session_rss_bytes(session_id: int) -> int:
+    """Total resident memory of all processes in a session, or 0 if unknown."""
+    page_size = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+    total = 0
+    for pid in session_pids(session_id):
+        fields = _read_proc_stat(str(pid))
+        if fields:
+            total += int(fields[21]) * page_size
+    return total
+
+
+def _worker_main(conn: Connection, cache_settings: Optional[Dict[str, Any]]) -> None:
+    """
+    Worker process loop: receive (url, options) requests and send back results.
+
+    Responses are ("ok", ScrapedContent dict), ("insufficient", message),
+    ("scraping", message) or ("error", message).
+    """
+    if hasattr(os, "setsid"):
+        # Own session, so the parent can find and kill Chromium along with the worker
+        os.setsid()
+    browser_pool = BrowserPool(size=1)
+    cache = ScrapeCache(**cache_settings) if cache_settings else None
+    try:
+        while True:
+            try:
+                request = conn.recv()
+            except EOFError:
+                break
+            if request is None:
+                break
+
+            url, options = request
+            try:
+                scraped = scrape_website(url, browser_pool=browser_pool, cache=cache, **options)
+                response = ("ok", scraped.model_dump())
+            except InsufficientContentError as e:
+                response = ("insufficient", str(e))
+            except ScrapingError as e:
+                response = ("scraping", str(e))
+            except Exception as e:
+                response = ("error", f"{type(e).__name__}: {e}")
+            conn.send(response)
+    finally:
+        browser_pool.shutdown(wait=False)
+
+
+class _Worker:
+    """Parent-side handle for one worker process."""
+
+    def __init__(self, process: multiprocessing.Process, conn: Connection):
+        self.process = process
+        self.conn = conn
+        self.jobs_served = 0
+
+
+class ScraperWorkerPool:
+    """
+    Runs scrape_website() in a fixed pool of separate worker processes.
+
+    Each worker owns a single warm browser, so a hung or crashed Chromium never
+    blocks or bloats the API process. Jobs that exceed their timeout get the
+    whole worker session (driver and Chromium included) killed and a fresh
+    worker started in its place. Workers whose resident memory grows beyond
+    max_rss_bytes, or that have served max_jobs_per_worker jobs, are recycled.
+    """
+
+    def __init__(
+        self,
+        size: int = DEFAULT_WORKER_COUNT,
+        job_timeout_seconds: float = DEFAULT_JOB_TIMEOUT_SECONDS,
+        max_rss_bytes: int = DEFAULT_MAX_WORKER_RSS_BYTES,
+        max_jobs_per_worker: int = DEFAULT_MAX_JOBS_PER_WORKER,
+        scrape_cache: Optional[ScrapeCache] = None,
+    ):
+        """
+        Initialize worker pool. Worker processes are started on first use.
+
+        Args:
+            size: Number of worker processes
+            job_timeout_seconds: Default time limit for one scrape
+            max_rss_bytes: Memory limit of a worker and its browser processes
+            max_jobs_per_worker: Jobs served before a worker is recycled
+            scrape_cache: Cache whose directory and limits the workers share
+        """
+        if size < 1:
+            raise ValueError("Scraper worker pool size must be at least 1")
+        if job_timeout_seconds <= 0:
+            raise ValueError("Scraper job timeout must be positive")
+
+        self.size = size
+        self.job_timeout_seconds = job_timeout_seconds
+        self.max_rss_bytes = max_rss_bytes
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self._cache_settings = (
+            {
+                "directory": str(scrape_cache.directory),
+                "ttl_seconds": scrape_cache.ttl_seconds,
+                "max_bytes": scrape_cache.max_bytes,
+            }
+            if scrape_cache
+            else None
+        )
+
+        # spawn: forking a process that already runs threads (or Playwright) is unsafe
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: "queue.Queue[Any]" = queue.Queue()
+        self._workers: List[_Worker] = []
+        self._lock = threading.Lock()
+        self._started = False
+        self._closed = False
+        self._metrics: Dict[str, int] = {
+            "jobs_submitted": 0,
+            "jobs_completed": 0,
+            "jobs_failed": 0,
+            "jobs_timed_out": 0,
+            "workers_started": 0,
+            "workers_killed": 0,
+            "workers_recycled": 0,
+            "worker_crashes": 0,
+        }
+
+    def _increment(self, name: str) -> None:
+        with self._lock:
+            self._metrics[name] += 1
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self._cache_settings),
+            name="scraper-worker",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        worker = _Worker(process, parent_conn)
+        with self._lock:
+            self._workers.append(worker)
+            self._metrics["workers_started"] += 1
+        logger.info("Started scraper worker", {"pid": process.pid})
+        return worker
+
+    def _forget(self, worker: _Worker) -> None:
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+        worker.conn.close()
+
+    def _kill(self, worker: _Worker) -> None:
+        """Kill a worker and every process in its session."""
+        pid = worker.process.pid
+        session = [session_pid for session_pid in session_pids(pid) if session_pid != pid]
+        if worker.process.is_alive():
+            worker.process.kill()
+        for session_pid in session:
+            try:
+                os.kill(session_pid, signal.SIGKILL)
+            except (ProcessLookupError, PermissionError):
+                pass
+        worker.process.join(timeout=WORKER_STOP_TIMEOUT_SECONDS)
+        self._forget(worker)
+        self._increment("workers_killed")
+
+    def _stop(self, worker: _Worker) -> None:
+        """Ask a worker to exit cleanly, killing it if it does not."""
+        try:
+            worker.conn.send(None)
+        except OSError:
+            pass
+        worker.process.join(timeout=WORKER_STOP_TIMEOUT_SECONDS)
+        if worker.process.is_alive() or session_pids(worker.process.pid):
+            self._kill(worker)
+        else:
+            self._forget(worker)
+
+    def _acquire(self) -> _Worker:
+        with self._lock:
+            if self._closed:
+                raise ScraperWorkerPoolClosedError("Scraper worker pool has been shut down")
+            start = not self._started
+            self._started = True
+        if start:
+            for _ in range(self.size):
+                self._idle.put(self._spawn())
+
+        worker = self._idle.get()
+        if worker is None:
+            # Shutdown sentinel; pass it on to the next waiter
+            self._idle.put(None)
+            raise ScraperWorkerPoolClosedError("Scraper worker pool has been shut down")
+        if worker is _RESPAWN:
+            try:
+                return self._spawn()
+            except Exception as e:
+                self._idle.put(_RESPAWN)
+                raise ScrapingError(f"Could not start scraper worker: {e}") from e
+        return worker
+
+    def _respawn(self) -> None:
+        """Start a replacement worker, or leave its slot to be started by the next job."""
+        try:
+            self._idle.put(self._spawn())
+        except Exception as e:
+            logger.error(f"Could not start replacement scraper worker: {e}", exc_info=True)
+            self._idle.put(_RESPAWN)
+
+    def _release(self, worker: _Worker, healthy: bool) -> None:
+        with self._lock:
+            closed = self._closed
+
+        if not healthy:
+            self._kill(worker)
+        elif closed:
+            self._stop(worker)
+        else:
+            rss = session_rss_bytes(worker.process.pid)
+            if rss > self.max_rss_bytes or worker.jobs_served >= self.max_jobs_per_worker:
+                logger.info(
+                    "Recycling scraper worker",
+                    {"pid": worker.process.pid, "rss_bytes": rss, "jobs": worker.jobs_served},
+                )
+                self._increment("workers_recycled")
+                self._stop(worker)
+            else:
+                self._idle.put(worker)
+                return
+
+        if not closed:
+            self._respawn()
+
+    def scrape(
+        self,
+        url: str,
+        timeout: int = 30000,
+        max_redirects: int = 5,
+        crawl: Optional[CrawlBudget] = None,
+        job_timeout_seconds: Optional[float] = None,
+    ) -> ScrapedContent:
+        """
+        Scrape a website in a worker process.
+
+        Args:
+            url: URL to scrape
+            timeout: Page timeout in milliseconds, as for scrape_website()
+            max_redirects: Maximum number of redirects to follow
+            crawl: Crawl mode budget, as for scrape_website()
+            job_timeout_seconds: Time limit for the whole job (pool default if omitted)
+
+        Returns:
+            ScrapedContent object with homepage and optionally About page
+
+        Raises:
+            ScrapingError: If scraping fails, times out or the worker crashes
+            InsufficientContentError: If content is less than 200 words
+            ScraperWorkerPoolClosedError: If the pool has been shut down
+            ValueError: If job_timeout_seconds is not positive
+        """
+        job_timeout = (
+            self.job_timeout_seconds if job_timeout_seconds is None else job_timeout_seconds
+        )
+        if job_timeout <= 0:
+            raise ValueError("Scraper job timeout must be positive")
+        options = {"timeout": timeout, "max_redirects": max_redirects, "crawl": crawl}
+        worker = self._acquire()
+        self._increment("jobs_submitted")
+        healthy = False
+        try:
+            worker.conn.send((url, options))
+            if not worker.conn.poll(job_timeout):
+                self._increment("jobs_timed_out")
+                logger.warning(
+                    "Scraper worker timed out, killing it",
+                    {"url": url, "pid": worker.process.pid, "timeout_seconds": job_timeout},
+                )
+                raise ScrapingError(f"Timeout while scraping {url}: no result in {job_timeout}s")
+            status, payload = worker.conn.recv()
+            healthy = True
+        except (EOFError, OSError) as e:
+            self._increment("worker_crashes")
+            raise ScrapingError(f"Scraper worker crashed while scraping {url}") from e
+        finally:
+            worker.jobs_served += 1
+            if not healthy:
+                self._increment("jobs_failed")
+            self._release(worker, healthy)
+
+        if status == "ok":
+            self._increment("jobs_completed")
+            return ScrapedContent.model_validate(payload)
+        self._increment("jobs_failed")
+        if status == "insufficient":
+            raise InsufficientContentError(payload)
+        raise ScrapingError(payload)
+
+    def metrics(self) -> Dict[str, int]:
+        """Return a snapshot of pool metrics."""
+        with self._lock:
+            snapshot = dict(self._metrics)
+            snapshot["pool_size"] = self.size
+            snapshot["live_workers"] = len(self._workers)
+        return snapshot
+
+    def shutdown(self) -> None:
+        """Stop idle workers now; busy workers are stopped when their job returns."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(worker, _Worker):
+                self._stop(worker)
+        self._idle.put(None)
+        logger.info("Scraper worker pool shut down", self.metrics())
@@ -0,0 +1,382 @@
+"""Storage backends that stream uploaded files into spooled temporary files."""
+
+import io
+import os
+import shutil
+import tempfile
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, List, NamedTuple, Optional, Tuple, Union
+from urllib.parse import quote
+
+import requests
+from google.cloud import storage
+
+from src.ingestion.http_client import get_session
+
+DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+# Downloads up to this size stay in memory; larger ones roll over to disk
+SPOOL_MAX_MEMORY_BYTES = 2 * 1024 * 1024
+# Objects at least this large are downloaded as parallel byte-range slices
+DEFAULT_SLICED_DOWNLOAD_THRESHOLD_BYTES = 32 * 1024 * 1024
+DEFAULT_DOWNLOAD_SLICES = 8
+HTTP_TIMEOUT_SECONDS = 60
+
+
+class ObjectInfo(NamedTuple):
+    """Size and version metadata of a stored object."""
+
+    size: int
+    generation: Optional[str] = None
+    md5_hash: Optional[str] = None
+    crc32c: Optional[str] = None
+
+
+class SpooledFile(io.RawIOBase):
+    """
+    Write-only buffer that keeps small files in memory and rolls larger ones to disk.
+
+    Unlike tempfile.SpooledTemporaryFile, the on-disk file is named, so parsers
+    (and parser processes) can open it by path instead of receiving a copy of
+    the bytes. The file is deleted on close().
+    """
+
+    def __init__(
+        self, max_memory_bytes: int = SPOOL_MAX_MEMORY_BYTES, directory: Optional[str] = None
+    ):
+        super().__init__()
+        self.max_memory_bytes = max_memory_bytes
+        self.directory = directory
+        self._buffer: Optional[io.BytesIO] = io.BytesIO()
+        self._file: Optional[BinaryIO] = None
+        self.size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        if self._buffer is not None and self.size + len(data) > self.max_memory_bytes:
+            self._roll_over()
+        (self._file or self._buffer).write(data)
+        self.size += len(data)
+        return len(data)
+
+    def _roll_over(self) -> None:
+        self._file = tempfile.NamedTemporaryFile(prefix="upload-", dir=self.directory, delete=False)
+        self._file.write(self._buffer.getbuffer())
+        self._buffer = None
+
+    def preallocate(self, size: int) -> int:
+        """
+        Move to disk and reserve size bytes, for positional writes from several threads.
+
+        Returns:
+            File descriptor to pass to os.pwrite()
+        """
+        if self._file is None:
+            self._roll_over()
+        self._file.flush()
+        fd = self._file.fileno()
+        if hasattr(os, "posix_fallocate") and size:
+            os.posix_fallocate(fd, 0, size)
+        else:
+            os.ftruncate(fd, size)
+        self.size = size
+        return fd
+
+    @property
+    def path(self) -> Optional[str]:
+        """Path of the on-disk file, or None while the content is in memory."""
+        return self._file.name if self._file else None
+
+    @property
+    def source(self) -> Union[bytes, str]:
+        """Content for the parsers: a file path if on disk, else the bytes."""
+        if self._file is not None:
+            self._file.flush()
+            return self._file.name
+        return self._buffer.getvalue()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            Path(self._file.name).unlink(missing_ok=True)
+            self._file = None
+        self._buffer = None
+        super().close()
+
+
+class _PositionalWriter(io.RawIOBase):
+    """Writes one byte range into a shared file descriptor with pwrite()."""
+
+    def __init__(self, fd: int, offset: int):
+        super().__init__()
+        self.fd = fd
+        self.offset = offset
+        self.written = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        view = memoryview(data)
+        while view:
+            count = os.pwrite(self.fd, view, self.offset + self.written)
+            self.written += count
+            view = view[count:]
+        return len(data)
+
+
+def slice_ranges(size: int, slices: int) -> List[Tuple[int, int]]:
+    """Split size bytes into up to `slices` contiguous inclusive (start, end) ranges."""
+    if size <= 0:
+        return []
+    slices = max(1, min(slices, size))
+    step = -(-size // slices)
+    return [(start, min(start + step, size) - 1) for start in range(0, size, step)]
+
+
+class StorageBackend(ABC):
+    """Source of uploaded files."""
+
+    @abstractmethod
+    def stat(self, bucket_name: str, file_path: str) -> ObjectInfo:
+        """Return size and version metadata of an object."""
+
+    @abstractmethod
+    def download_to(
+        self,
+        bucket_name: str,
+        file_path: str,
+        destination: BinaryIO,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        generation: Optional[str] = None,
+    ) -> None:
+        """
+        Stream an object, or the inclusive byte range start..end of it, into a file.
+
+        Args:
+            bucket_name: Bucket name
+            file_path: Object path within the bucket
+            destination: Writable binary file
+            start: First byte of the range
+            end: Last byte of the range
+            generation: Object generation to read, so all slices see one version
+        """
+
+    def download(
+        self, bucket_name: str, file_path: str, max_memory_bytes: Optional[int] = None
+    ) -> SpooledFile:
+        """
+        Download an object into a SpooledFile (caller closes it).
+
+        Args:
+            bucket_name: Bucket name
+            file_path: Object path within the bucket
+            max_memory_bytes: Size above which the download is spooled to disk
+                (SPOOL_MAX_MEMORY_BYTES if omitted)
+        """
+        spool = SpooledFile(
+            max_memory_bytes=(
+                SPOOL_MAX_MEMORY_BYTES if max_memory_bytes is None else max_memory_bytes
+            )
+        )
+        try:
+            self.download_to(bucket_name, file_path, spool)
+        except BaseException:
+            spool.close()
+            raise
+        return spool
+
+    def download_sliced(
+        self, bucket_name: str, file_path: str, info: ObjectInfo, slices: int
+    ) -> SpooledFile:
+        """
+        Download an object as parallel byte-range requests into a pre-allocated file.
+
+        Args:
+            bucket_name: Bucket name
+            file_path: Object path within the bucket
+            info: Object metadata from stat()
+            slices: Number of ranges fetched in parallel
+
+        Returns:
+            SpooledFile on disk (caller closes it)
+
+        Raises:
+            IOError: If a slice returned fewer bytes than requested
+        """
+        spool = SpooledFile()
+        try:
+            fd = spool.preallocate(info.size)
+            ranges = slice_ranges(info.size, slices)
+            writers = [_PositionalWriter(fd, start) for start, _ in ranges]
+            with ThreadPoolExecutor(max_workers=len(ranges), thread_name_prefix="slice") as pool:
+                futures = [
+                    pool.submit(
+                        self.download_to,
+                        bucket_name,
+                        file_path,
+                        writer,
+                        start,
+                        end,
+                        info.generation,
+                    )
+                    for writer, (start, end) in zip(writers, ranges)
+                ]
+                for future in futures:
+                    future.result()
+            for writer, (start, end) in zip(writers, ranges):
+                if writer.written != end - start + 1:
+                    raise IOError(
+                        f"Short read for {file_path} bytes {start}-{end}: got {writer.written}"
+                    )
+        except BaseException:
+            spool.close()
+            raise
+        return spool
+
+
+class GCSStorageBackend(StorageBackend):
+    """Google Cloud Storage."""
+
+    def __init__(self, client: Optional[storage.Client] = None):
+        """Initialize backend with a Cloud Storage client (created if omitted)."""
+        self.client = client or storage.Client()
+
+    def stat(self, bucket_name: str, file_path: str) -> ObjectInfo:
+        blob = self.client.bucket(bucket_name).get_blob(file_path)
+        if blob is None:
+            raise FileNotFoundError(f"gs://{bucket_name}/{file_path} does not exist")
+        return ObjectInfo(
+            size=blob.size,
+            generation=str(blob.generation),
+            md5_hash=blob.md5_hash,
+            crc32c=blob.crc32c,
+        )
+
+    def download_to(
+        self,
+        bucket_name: str,
+        file_path: str,
+        destination: BinaryIO,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        generation: Optional[str] = None,
+    ) -> None:
+        blob = self.client.bucket(bucket_name).blob(
+            file_path,
+            chunk_size=DOWNLOAD_CHUNK_SIZE,
+            generation=int(generation) if generation else None,
+        )
+        # Whole-object checksums cannot be verified for a range
+        checksum = "auto" if start is None and end is None else None
+        blob.download_to_file(destination, start=start, end=end, checksum=checksum)
+
+
+class LocalStorageBackend(StorageBackend):
+    """Directory tree laid out as <root>/<bucket>/<path>, for local runs and benchmarks."""
+
+    def __init__(self, root: str):
+        """Initialize backend rooted at a local directory."""
+        self.root = Path(root)
+
+    def resolve(self, bucket_name: str, file_path: str) -> Path:
+        """Return the local path of an object, refusing paths outside the bucket."""
+        bucket_root = (self.root / bucket_name).resolve()
+        path = (bucket_root / file_path).resolve()
+        if not path.is_relative_to(bucket_root):
+            raise ValueError(f"Object path escapes bucket: {file_path}")
+        return path
+
+    def stat(self, bucket_name: str, file_path: str) -> ObjectInfo:
+        stat = self.resolve(bucket_name, file_path).stat()
+        return ObjectInfo(size=stat.st_size, generation=str(stat.st_mtime_ns))
+
+    def download_to(
+        self,
+        bucket_name: str,
+        file_path: str,
+        destination: BinaryIO,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        generation: Optional[str] = None,
+    ) -> None:
+        with open(self.resolve(bucket_name, file_path), "rb") as source:
+            if start is None and end is None:
+                shutil.copyfileobj(source, destination, DOWNLOAD_CHUNK_SIZE)
+                return
+            source.seek(start or 0)
+            remaining = float("inf") if end is None else end - (start or 0) + 1
+            while remaining > 0:
+                chunk = source.read(int(min(DOWNLOAD_CHUNK_SIZE, remaining)))
+                if not chunk:
+                    break
+                destination.write(chunk)
+                remaining -= len(chunk)
+
+
+class HTTPStorageBackend(StorageBackend):
+    """
+    Objects served at <base_url>/<bucket>/<path> by any server that honours Range.
+
+    Used with the range-capable stand-in server in benchmarks/range_server.py to
+    test and benchmark sliced downloads without Cloud Storage.
+    """
+
+    def __init__(self, base_url: str):
+        """Initialize backend for a base URL."""
+        self.base_url = base_url.rstrip("/")
+
+    def _url(self, bucket_name: str, file_path: str) -> str:
+        return f"{self.base_url}/{quote(bucket_name)}/{quote(file_path)}"
+
+    def stat(self, bucket_name: str, file_path: str) -> ObjectInfo:
+        response = get_session().head(
+            self._url(bucket_name, file_path), timeout=HTTP_TIMEOUT_SECONDS
+        )
+        response.raise_for_status()
+        return ObjectInfo(
+            size=int(response.headers["Content-Length"]),
+            generation=response.headers.get("ETag"),
+        )
+
+    def download_to(
+        self,
+        bucket_name: str,
+        file_path: str,
+        destination: BinaryIO,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        generation: Optional[str] = None,
+    ) -> None:
+        headers = {}
+        if start is not None or end is not None:
+            headers["Range"] = f"bytes={start or 0}-{'' if end is None else end}"
+            if generation:
+                # Full object instead of a mixed-version slice if it changed
+                headers["If-Range"] = generation
+        with get_session().get(
+            self._url(bucket_name, file_path),
+            headers=headers,
+            stream=True,
+            timeout=HTTP_TIMEOUT_SECONDS,
+        ) as response:
+            response.raise_for_status()
+            if "Range" in headers and response.status_code != 206:
+                raise requests.HTTPError(
+                    f"Range request not honoured for {file_path}: HTTP {response.status_code}"
+                )
+            for chunk in response.iter_content(chunk_size=1024 * 1024):
+                destination.write(chunk)
+
+
+def create_storage_backend(
+    storage_client: Optional[storage.Client] = None, local_root: Optional[str] = None
+) -> StorageBackend:
+    """Local backend if local_root is set, otherwise Cloud Storage."""
+    if local_root:
+        return LocalStorageBackend(os.path.expanduser(local_root))
+    return GCSStorageBackend(storage_client)
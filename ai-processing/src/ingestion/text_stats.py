@@ -0,0 +1,224 @@
+"""Single-pass text statistics over a text's code points, for whole texts or many spans at once."""
+
+import re
+import sys
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from src.models.text_stats import TextStats
+
+# Columns of measure_spans() output
+SPAN_STAT_FIELDS = ("words", "sentences", "paragraphs", "syllables", "tokens")
+# Rough characters per LLM token for English prose
+CHARACTERS_PER_TOKEN = 4
+# Characters measured at once; bounds the per-character arrays to a few MB
+CHUNK_CHARACTERS = 1 << 17
+
+# Character classes; everything from _VOWEL up is part of a word (regex \w)
+_OTHER, _SPACE, _NEWLINE, _TERMINAL, _VOWEL, _CONSONANT, _NUMERIC = range(7)
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def _class_table() -> np.ndarray:
+    """
+    Class of every code point.
+
+    Word characters are exactly those regex \\w matches, so word counts agree
+    with count_words(): symbols, emoji and private-use glyphs (PDF bullets)
+    are not words.
+    """
+    table = np.full(sys.maxunicode + 1, _OTHER, dtype=np.uint8)
+    # Mark \w runs over all code points at once; much faster than testing each
+    for match in _WORD_PATTERN.finditer("".join(map(chr, range(sys.maxunicode + 1)))):
+        table[match.start() : match.end()] = _CONSONANT
+    for character in " \t\r\x0b\x0c\xa0\u202f\u205f\u3000":
+        table[ord(character)] = _SPACE
+    table[0x2000:0x200B] = _SPACE
+    for character in "\n\u2028\u2029":
+        table[ord(character)] = _NEWLINE
+    for character in ".!?\u2026":
+        table[ord(character)] = _TERMINAL
+    for character in "aeiouyAEIOUYàáâãäåæèéêëìíîïòóôõöøùúûüýÿÀÁÂÃÄÅÆÈÉÊËÌÍÎÏÒÓÔÕÖØÙÚÛÜÝ":
+        table[ord(character)] = _VOWEL
+    for character in "0123456789_":
+        table[ord(character)] = _NUMERIC
+    return table
+
+
+_CLASSES = _class_table()
+
+
+def count_words(text: str) -> int:
+    """Count words in text without building a list of them."""
+    return _WORD_PATTERN.subn("", text)[1]
+
+
+def _shifted(values: np.ndarray, fill: bool, offset: int) -> np.ndarray:
+    """values moved by offset places (1 = previous element, -1 = next), padded with fill."""
+    shifted = np.full(len(values), fill, dtype=bool)
+    if offset > 0:
+        shifted[offset:] = values[:-offset]
+    else:
+        shifted[:offset] = values[-offset:]
+    return shifted
+
+
+def _paragraph_breaks(classes: np.ndarray, line_paragraphs: bool) -> np.ndarray:
+    """Newlines that end a paragraph: every one, or only those ending a blank line."""
+    newlines = classes == _NEWLINE
+    if line_paragraphs:
+        return newlines
+    positions = np.flatnonzero(newlines)
+    visible = np.concatenate(([0], np.cumsum(classes > _NEWLINE)))
+    breaks = np.zeros(len(classes), dtype=bool)
+    # A newline ends a blank line if nothing visible came since the previous one
+    breaks[positions[1:][visible[positions[1:]] == visible[positions[:-1]]]] = True
+    return breaks
+
+
+def _per_word(word_starts: np.ndarray, positions: np.ndarray, word_count: int) -> np.ndarray:
+    """Number of positions falling in each word (positions are inside words)."""
+    words = np.searchsorted(word_starts, positions, side="right") - 1
+    return np.bincount(words[words >= 0], minlength=word_count)[:word_count]
+
+
+def measure_spans(
+    text: str, spans: Sequence[Tuple[int, int]], line_paragraphs: bool = False
+) -> np.ndarray:
+    """
+    Count words, sentences, paragraphs, syllables and tokens of many spans of a text.
+
+    The text is scanned once as an array of code points and every count is
+    a vectorised reduction over it, so no string or match object is created
+    per word. Sentences end at '.', '!', '?' or '…' followed by whitespace, and
+    at paragraph ends. Paragraphs are separated by blank lines, or by every
+    line break if line_paragraphs is set (scraped blocks, slide text). Each
+    span starts a new paragraph. Syllables are vowel groups less a silent
+    final 'e', at least one per word.
+
+    Args:
+        text: Text containing the spans
+        spans: (start, end) character offsets, in order and not overlapping
+        line_paragraphs: Treat every line as a paragraph
+
+    Returns:
+        int64 array of shape (len(spans), 5), columns as in SPAN_STAT_FIELDS
+    """
+    span_bounds = np.array(spans, dtype=np.int64).reshape(-1, 2)
+    result = np.zeros((len(span_bounds), len(SPAN_STAT_FIELDS)), dtype=np.int64)
+    # Measure runs of whole spans of about CHUNK_CHARACTERS at a time, so the
+    # per-character arrays stay small however long the text is
+    first = 0
+    while first < len(span_bounds):
+        chunk_start = span_bounds[first, 0]
+        last = max(
+            int(np.searchsorted(span_bounds[:, 1], chunk_start + CHUNK_CHARACTERS, "right")),
+            first + 1,
+        )
+        chunk_end = span_bounds[last - 1, 1]
+        result[first:last] = _measure_chunk(
+            text[chunk_start:chunk_end], span_bounds[first:last] - chunk_start, line_paragraphs
+        )
+        first = last
+    return result
+
+
+def _measure_chunk(text: str, span_bounds: np.ndarray, line_paragraphs: bool) -> np.ndarray:
+    result = np.zeros((len(span_bounds), len(SPAN_STAT_FIELDS)), dtype=np.int64)
+    lengths = span_bounds[:, 1] - span_bounds[:, 0]
+    result[:, 4] = (lengths + CHARACTERS_PER_TOKEN - 1) // CHARACTERS_PER_TOKEN
+
+    codes = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    classes = _CLASSES[codes]
+    is_word = classes >= _VOWEL
+    word_starts = np.flatnonzero(is_word & ~_shifted(is_word, False, 1))
+    if not len(word_starts):
+        return result
+    word_ends = np.flatnonzero(is_word & ~_shifted(is_word, False, -1)) + 1
+    # Span of every word; words outside all spans get -1 and are dropped
+    word_spans = np.searchsorted(span_bounds[:, 0], word_starts, side="right") - 1
+    inside = (word_spans >= 0) & (word_ends <= span_bounds[np.maximum(word_spans, 0), 1])
+    word_starts, word_ends, word_spans = word_starts[inside], word_ends[inside], word_spans[inside]
+    if not len(word_starts):
+        return result
+
+    # Syllables: vowel groups, less a final 'e' after a consonant other than 'l'
+    is_vowel = classes == _VOWEL
+    vowel_groups = np.flatnonzero(is_vowel & ~_shifted(is_vowel, False, 1))
+    lower = codes | 0x20
+    previous_class = np.concatenate(([_OTHER], classes[:-1]))
+    previous_code = np.concatenate(([0], lower[:-1]))
+    silent_e = np.flatnonzero(
+        (lower == ord("e"))
+        & ~_shifted(is_word, False, -1)
+        & (previous_class == _CONSONANT)
+        & (previous_code != ord("l"))
+    )
+    word_count = len(word_starts)
+    syllables = _per_word(word_starts, vowel_groups, word_count)
+    syllables -= _per_word(word_starts, silent_e, word_count)
+    np.maximum(syllables, 1, out=syllables)
+
+    # Sentence and paragraph starts: a break between the previous word and this one
+    paragraph_breaks = _paragraph_breaks(classes, line_paragraphs)
+    sentence_breaks = paragraph_breaks | (
+        (classes == _TERMINAL) & (_shifted(classes <= _NEWLINE, True, -1))
+    )
+    first_in_span = np.ones(word_count, dtype=bool)
+    first_in_span[1:] = word_spans[1:] != word_spans[:-1]
+    previous_ends = np.concatenate(([0], word_ends[:-1]))
+
+    def starts(breaks: np.ndarray) -> np.ndarray:
+        seen = np.concatenate(([0], np.cumsum(breaks)))
+        return first_in_span | (seen[word_starts] > seen[previous_ends])
+
+    span_count = len(span_bounds)
+    result[:, 0] = np.bincount(word_spans, minlength=span_count)
+    result[:, 1] = np.bincount(word_spans, weights=starts(sentence_breaks), minlength=span_count)
+    result[:, 2] = np.bincount(word_spans, weights=starts(paragraph_breaks), minlength=span_count)
+    result[:, 3] = np.bincount(word_spans, weights=syllables, minlength=span_count)
+    np.maximum(result[:, 4], result[:, 0], out=result[:, 4])
+    return result
+
+
+def span_stats(
+    text: str, spans: Sequence[Tuple[int, int]], line_paragraphs: bool = False
+) -> List[TextStats]:
+    """TextStats for each span of a text (see measure_spans)."""
+    counts = measure_spans(text, spans, line_paragraphs)
+    return [
+        TextStats(
+            words=int(words),
+            sentences=int(sentences),
+            paragraphs=int(paragraphs),
+            syllables=int(syllables),
+            characters=end - start,
+            tokens=int(tokens),
+        )
+        for (start, end), (words, sentences, paragraphs, syllables, tokens) in zip(spans, counts)
+    ]
+
+
+def text_stats(text: str, line_paragraphs: bool = False) -> TextStats:
+    """TextStats of a whole text (see measure_spans)."""
+    return span_stats(text, [(0, len(text))], line_paragraphs)[0]
+
+
+def corpus_stats(content: Dict[str, Any]) -> TextStats:
+    """
+    Total text statistics of an ingestion result, from its pages' and uploads' 'stats'.
+
+    Pages and uploads without statistics (e.g. from an older cache entry) are
+    left out.
+    """
+    scraped = content.get("scraped_content") or {}
+    items = [scraped.get("homepage"), scraped.get("about_page")]
+    items += scraped.get("additional_pages") or []
+    items += content.get("uploaded_content") or []
+    return TextStats.total(
+        TextStats(*(item["stats"][field] for field in TextStats._fields))
+        for item in items
+        if item and item.get("stats")
+    )
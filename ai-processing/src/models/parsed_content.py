@@ -1,24 +1,173 @@
 """ParsedContent model for file parsing results."""
 
-from typing import Optional
-from pydantic import BaseModel, Field
+from array import array
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
+
+from src.models.page import Page
+from src.models.section import Section
+from src.models.text_stats import TextStats
+
+# Values per segment record: start, end, number, word_count, page_number, level,
+# then the remaining text statistics: sentences, paragraphs, syllables, tokens
+SEGMENT_FIELDS = 10
+# Separator between segments in the text buffer
+SEGMENT_SEPARATOR = "\n\n"
+
+
+def _segment_array(values: Sequence[int] = ()) -> array:
+    return array("q", values)
 
 
 class ParsedContent(BaseModel):
-    """Model for parsed file content."""
+    """
+    Model for parsed file content.
+
+    The text is held once. Pages (PDF) or sections (PPTX, DOCX) are kept as
+    array-backed offset records into it, and Page/Section objects are only
+    built when `pages`, `sections` or `segment()` are used.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
     filename: str = Field(..., description="Name of the file")
     file_type: str = Field(..., description="File type: pdf, pptx, or docx")
     text: str = Field(..., description="Extracted text content")
     word_count: int = Field(..., description="Number of words in the text")
-    sections: Optional[list] = Field(
-        None, description="Document sections (for structured documents)"
+    segment_type: Optional[str] = Field(
+        None, description='What the segments are: "page", "section", or None'
+    )
+    segments: array = Field(
+        default_factory=_segment_array,
+        description=(
+            "Flat records of (start, end, number, word_count, page_number, level, "
+            "sentences, paragraphs, syllables, tokens) per page or section; start/end "
+            "are offsets into text, 0 means unset"
+        ),
+    )
+    titles: Dict[int, str] = Field(
+        default_factory=dict, description="Section titles by segment index"
     )
-    pages: Optional[list] = Field(None, description="Page information (for multi-page documents)")
+    sampling: Optional[str] = Field(
+        None, description="How the document was sampled, if it was not parsed in full"
+    )
+
+    @field_validator("segments", mode="before")
+    @classmethod
+    def _to_array(cls, value):
+        return value if isinstance(value, array) else _segment_array(value)
+
+    @field_serializer("segments")
+    def _serialize_segments(self, segments: array) -> List[int]:
+        return segments.tolist()
+
+    @property
+    def segment_count(self) -> int:
+        """Number of pages or sections."""
+        return len(self.segments) // SEGMENT_FIELDS
+
+    def boundaries(self) -> List[Tuple[int, int, int]]:
+        """(start, end, page number or section order) of every segment, without copying text."""
+        records = self.segments
+        return [
+            (records[i], records[i + 1], records[i + 2])
+            for i in range(0, len(records), SEGMENT_FIELDS)
+        ]
+
+    def segment_text(self, index: int) -> str:
+        """Text of one page or section."""
+        offset = index * SEGMENT_FIELDS
+        return self.text[self.segments[offset] : self.segments[offset + 1]]
+
+    def segment(self, index: int):
+        """Materialise one segment as a Page or Section."""
+        offset = index * SEGMENT_FIELDS
+        _, _, number, word_count, page_number, level, *_ = self.segments[
+            offset : offset + SEGMENT_FIELDS
+        ]
+        text = self.segment_text(index)
+        if self.segment_type == "page":
+            return Page(page_number=number, text=text, word_count=word_count)
+        return Section(
+            title=self.titles.get(index),
+            text=text,
+            page_number=page_number or None,
+            order=number,
+            level=level or None,
+        )
+
+    def segment_stats(self, index: int) -> TextStats:
+        """Text statistics of one page or section, computed when it was parsed."""
+        offset = index * SEGMENT_FIELDS
+        start, end, _, words, _, _, sentences, paragraphs, syllables, tokens = self.segments[
+            offset : offset + SEGMENT_FIELDS
+        ]
+        return TextStats(words, sentences, paragraphs, syllables, end - start, tokens)
+
+    @property
+    def stats(self) -> TextStats:
+        """Text statistics of the whole document: the sum over its pages or sections."""
+        columns = [sum(self.segments[field::SEGMENT_FIELDS]) for field in range(SEGMENT_FIELDS)]
+        start, end, _, words, _, _, sentences, paragraphs, syllables, tokens = columns
+        return TextStats(words, sentences, paragraphs, syllables, end - start, tokens)
+
+    def iter_segments(self) -> Iterator:
+        """Yield Page or Section views one at a time."""
+        for index in range(self.segment_count):
+            yield self.segment(index)
+
+    @property
+    def pages(self) -> Optional[List[Page]]:
+        """Page information (for multi-page documents), built on demand."""
+        return list(self.iter_segments()) if self.segment_type == "page" else None
+
+    @property
+    def sections(self) -> Optional[List[Section]]:
+        """Document sections (for structured documents), built on demand."""
+        return list(self.iter_segments()) if self.segment_type == "section" else None
+
+    @classmethod
+    def concatenate(
+        cls, filename: str, file_type: str, parts: Sequence["ParsedContent"]
+    ) -> "ParsedContent":
+        """
+        Join contents parsed from consecutive page or slide ranges of one file.
+
+        Parts without segments (e.g. a range of empty slides) are skipped.
+        """
+        segment_type = next((part.segment_type for part in parts), None)
+        parts = [part for part in parts if part.segment_count]
+        segments = _segment_array()
+        titles: Dict[int, str] = {}
+        shift = 0
+        for part in parts:
+            for index, title in part.titles.items():
+                titles[len(segments) // SEGMENT_FIELDS + index] = title
+            for i in range(0, len(part.segments), SEGMENT_FIELDS):
+                record = part.segments[i : i + SEGMENT_FIELDS]
+                record[0] += shift
+                record[1] += shift
+                segments.extend(record)
+            shift += len(part.text) + len(SEGMENT_SEPARATOR)
+
+        return cls(
+            filename=filename,
+            file_type=file_type,
+            text=SEGMENT_SEPARATOR.join(part.text for part in parts),
+            word_count=sum(part.word_count for part in parts),
+            segment_type=segment_type,
+            segments=segments,
+            titles=titles,
+        )
 
     def to_dict(self) -> dict:
         """Convert to dictionary format for agent inputs."""
-        return {
+        result = {
             "filename": self.filename,
             "text": self.text,
+            "stats": self.stats.to_dict(),
         }
+        if self.sampling:
+            result["sampling"] = self.sampling
+        return result
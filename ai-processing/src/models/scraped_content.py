@@ -1,15 +1,39 @@
 """ScrapedContent model for web scraping results."""
 
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
+from src.models.text_stats import TextStats
+
 
 class PageContent(BaseModel):
     """Content from a single page."""
 
-    text: str = Field(..., description="Extracted text content from the page")
+    text: str = Field(
+        ..., description="Main-content text, one block per line, headings as '## ' markers"
+    )
     url: str = Field(..., description="URL of the page")
     word_count: int = Field(..., description="Number of words in the text")
+    stats: Optional[TextStats] = Field(
+        None, description="Text statistics, one paragraph per block (line)"
+    )
+    outline: List[str] = Field(
+        default_factory=list, description="Heading markers in document order"
+    )
+    etag: Optional[str] = Field(None, description="ETag response header, for revalidation")
+    last_modified: Optional[str] = Field(
+        None, description="Last-Modified response header, for revalidation"
+    )
+    links: List[str] = Field(
+        default_factory=list, description="Absolute link URLs on the page (homepage only)"
+    )
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary format for agent inputs."""
+        result = {"text": self.text, "url": self.url}
+        if self.stats:
+            result["stats"] = self.stats.to_dict()
+        return result
 
 
 class ScrapedContent(BaseModel):
@@ -17,19 +41,23 @@ class ScrapedContent(BaseModel):
 
     homepage: PageContent = Field(..., description="Content from homepage")
     about_page: Optional[PageContent] = Field(None, description="Content from About page")
+    additional_pages: List[PageContent] = Field(
+        default_factory=list, description="Further pages fetched in crawl mode"
+    )
     total_word_count: int = Field(..., description="Total word count across all pages")
 
+    def pages(self) -> List[PageContent]:
+        """Return all scraped pages, homepage first."""
+        pages = [self.homepage]
+        if self.about_page:
+            pages.append(self.about_page)
+        return pages + self.additional_pages
+
     def to_dict(self) -> dict:
         """Convert to dictionary format for agent inputs."""
-        result = {
-            "homepage": {
-                "text": self.homepage.text,
-                "url": self.homepage.url,
-            }
-        }
+        result = {"homepage": self.homepage.to_dict()}
         if self.about_page:
-            result["about_page"] = {
-                "text": self.about_page.text,
-                "url": self.about_page.url,
-            }
+            result["about_page"] = self.about_page.to_dict()
+        if self.additional_pages:
+            result["additional_pages"] = [page.to_dict() for page in self.additional_pages]
         return result
@@ -11,3 +11,4 @@ class Section(BaseModel):
     text: str = Field(..., description="Text content of the section")
     page_number: Optional[int] = Field(None, description="Page number where section appears")
     order: int = Field(..., description="Order of section in document")
+    level: Optional[int] = Field(None, description="Heading level (1 = top) for headings")
@@ -0,0 +1,54 @@
+"""TextStats value type for per-page and per-document text statistics."""
+
+from typing import Iterable, NamedTuple
+
+
+class TextStats(NamedTuple):
+    """Counts from one pass over a text, and readability scores derived from them."""
+
+    words: int = 0
+    sentences: int = 0
+    paragraphs: int = 0
+    syllables: int = 0
+    characters: int = 0
+    # Approximate LLM tokens (about four characters per token)
+    tokens: int = 0
+
+    @classmethod
+    def total(cls, stats: Iterable["TextStats"]) -> "TextStats":
+        """Add up the statistics of several pages or documents."""
+        return cls(*(sum(column) for column in zip(cls(), *stats)))
+
+    @property
+    def average_sentence_length(self) -> float:
+        """Words per sentence."""
+        return self.words / self.sentences if self.sentences else 0.0
+
+    @property
+    def average_syllables_per_word(self) -> float:
+        return self.syllables / self.words if self.words else 0.0
+
+    @property
+    def flesch_reading_ease(self) -> float:
+        """Flesch reading ease: higher is easier, 60-70 is plain English."""
+        if not self.words:
+            return 0.0
+        return (
+            206.835 - 1.015 * self.average_sentence_length - 84.6 * self.average_syllables_per_word
+        )
+
+    @property
+    def flesch_kincaid_grade(self) -> float:
+        """Flesch-Kincaid grade level (US school years needed to follow the text)."""
+        if not self.words:
+            return 0.0
+        return 0.39 * self.average_sentence_length + 11.8 * self.average_syllables_per_word - 15.59
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary format for agent inputs."""
+        return {
+            **self._asdict(),
+            "average_sentence_length": round(self.average_sentence_length, 1),
+            "flesch_reading_ease": round(self.flesch_reading_ease, 1),
+            "flesch_kincaid_grade": round(self.flesch_kincaid_grade, 1),
+        }
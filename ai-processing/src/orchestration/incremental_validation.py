@@ -0,0 +1,108 @@
+"""Background citation validation that runs as each agent node finishes."""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, UTC
+from typing import Dict, Any, List, Optional
+
+from src.agents.citation_validation_agent import (
+    SEMANTIC_SIMILARITY_THRESHOLD,
+    extract_source_text,
+    validate_citations,
+)
+from src.utils.semantic_index import SentenceIndex
+
+
+class IncrementalCitationValidator:
+    """
+    Validates each agent's citations on a background worker as soon as it is submitted.
+
+    Agent nodes submit their output when they finish, so validation overlaps with the
+    LLM calls of nodes still in flight. join() then only collects the results.
+    """
+
+    def __init__(
+        self,
+        source_content: Dict[str, Any],
+        semantic_threshold: float = SEMANTIC_SIMILARITY_THRESHOLD,
+    ):
+        """Initialize validator and start building the source index in the background."""
+        self.source_content = source_content
+        self.semantic_threshold = semantic_threshold
+        self._lock = threading.Lock()
+        self._futures: Dict[str, Future] = {}
+        # Single worker: validation is CPU-bound, and one thread is enough to keep it
+        # off the critical path while the other nodes wait on the network.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="citation-validation")
+        self._index_future = self._executor.submit(
+            lambda: SentenceIndex(extract_source_text(source_content))
+        )
+
+    def _validate(self, agent_name: str, output: Any) -> List[Dict[str, Any]]:
+        result = validate_citations(
+            {agent_name: output},
+            self.source_content,
+            semantic_threshold=self.semantic_threshold,
+            source_index=self._index_future.result(),
+        )
+        return result["validated_citations"]
+
+    def submit(self, agent_name: str, output: Any) -> None:
+        """Queue validation of one agent's output."""
+        with self._lock:
+            self._futures[agent_name] = self._executor.submit(self._validate, agent_name, output)
+
+    def join(self, agent_outputs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Collect validated citations for all agent outputs.
+
+        Outputs that were never submitted are validated now, so the result matches
+        a single validate_citations() call over agent_outputs. Errors raised on the
+        worker are re-raised here.
+        """
+        validated_citations = []
+        for agent_name, output in agent_outputs.items():
+            with self._lock:
+                future = self._futures.get(agent_name)
+            if future is None:
+                validated_citations.extend(self._validate(agent_name, output))
+            else:
+                validated_citations.extend(future.result())
+
+        return {
+            "agent_name": "citation_validation_agent",
+            "timestamp": datetime.now(UTC).isoformat(),
+            "validated_citations": validated_citations,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker, dropping any validation that has not started."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Validators for in-flight pipeline runs, keyed by the state's run_id.
+# Kept outside the graph state because futures cannot be checkpointed.
+_validators: Dict[str, IncrementalCitationValidator] = {}
+_validators_lock = threading.Lock()
+
+
+def register_validator(run_id: str, validator: IncrementalCitationValidator) -> None:
+    """Register the validator for a pipeline run."""
+    with _validators_lock:
+        _validators[run_id] = validator
+
+
+def get_validator(run_id: Optional[str]) -> Optional[IncrementalCitationValidator]:
+    """Get the validator for a pipeline run, if one is registered."""
+    if not run_id:
+        return None
+    with _validators_lock:
+        return _validators.get(run_id)
+
+
+def release_validator(run_id: str) -> None:
+    """Shut down and unregister the validator for a pipeline run."""
+    with _validators_lock:
+        validator = _validators.pop(run_id, None)
+    if validator:
+        validator.shutdown()
@@ -1,5 +1,6 @@
 """Agent pipeline orchestration using LangGraph."""
 
+import uuid
 from datetime import datetime, UTC
 from typing import Dict, Any, Optional
 from langgraph.graph import StateGraph, END
@@ -14,6 +15,12 @@ from src.agents.voice_agent import evaluate_voice
 from src.agents.vividness_agent import evaluate_vividness
 from src.agents.citation_validation_agent import validate_citations
 from src.agents.synthesis_agent import generate_report
+from src.orchestration.incremental_validation import (
+    IncrementalCitationValidator,
+    get_validator,
+    register_validator,
+    release_validator,
+)
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -34,6 +41,13 @@ class CriticalFailureError(Exception):
     pass
 
 
+def _submit_for_validation(state: AgentPipelineState, agent_name: str, output: Any) -> None:
+    """Start validating a finished node's citations in the background, if enabled."""
+    validator = get_validator(state.get("run_id"))
+    if validator:
+        validator.submit(agent_name, output)
+
+
 def audience_identification_node(state: AgentPipelineState) -> Dict[str, Any]:
     """
     Identify audiences from content.
@@ -54,6 +68,7 @@ def audience_identification_node(state: AgentPipelineState) -> Dict[str, Any]:
             logger.error("Critical failure: No audiences identified")
             raise CriticalFailureError(error_msg)
 
+        _submit_for_validation(state, "audience_identification", result)
         return {
             "audiences": audiences,
             "agent_outputs": {"audience_identification": result},
@@ -96,6 +111,7 @@ def clarity_evaluation_node(state: AgentPipelineState) -> Dict[str, Any]:
         if "clarity_agent" not in failed_agents:
             failed_agents = failed_agents + ["clarity_agent"]
 
+    _submit_for_validation(state, "clarity_agent", clarity_outputs)
     return {
         "agent_outputs": {"clarity_agent": clarity_outputs},
         "failed_agents": failed_agents,
@@ -129,6 +145,7 @@ def technical_level_node(state: AgentPipelineState) -> Dict[str, Any]:
         if "technical_level_agent" not in failed_agents:
             failed_agents = failed_agents + ["technical_level_agent"]
 
+    _submit_for_validation(state, "technical_level_agent", technical_outputs)
     return {
         "agent_outputs": {"technical_level_agent": technical_outputs},
         "failed_agents": failed_agents,
@@ -162,6 +179,7 @@ def importance_node(state: AgentPipelineState) -> Dict[str, Any]:
         if "importance_agent" not in failed_agents:
             failed_agents = failed_agents + ["importance_agent"]
 
+    _submit_for_validation(state, "importance_agent", importance_outputs)
     return {
         "agent_outputs": {"importance_agent": importance_outputs},
         "failed_agents": failed_agents,
@@ -177,6 +195,7 @@ def voice_node(state: AgentPipelineState) -> Dict[str, Any]:
     failed_agents = state.get("failed_agents", [])
     try:
         result = evaluate_voice(state["content"])
+        _submit_for_validation(state, "voice_agent", result)
         return {
             "agent_outputs": {"voice_agent": result},
             "failed_agents": failed_agents,
@@ -201,6 +220,7 @@ def vividness_node(state: AgentPipelineState) -> Dict[str, Any]:
     failed_agents = state.get("failed_agents", [])
     try:
         result = evaluate_vividness(state["content"])
+        _submit_for_validation(state, "vividness_agent", result)
         return {
             "agent_outputs": {"vividness_agent": result},
             "failed_agents": failed_agents,
@@ -220,10 +240,17 @@ def citation_validation_node(state: AgentPipelineState) -> Dict[str, Any]:
     """
     Validate all citations.
 
+    Each assessment node starts validating its own citations in the background as
+    soon as it finishes, so this node usually only joins already-computed results.
+
     CRITICAL: This is a critical agent. Failures must fail fast.
     """
     try:
-        result = validate_citations(state["agent_outputs"], state["content"])
+        validator = get_validator(state.get("run_id"))
+        if validator:
+            result = validator.join(state["agent_outputs"])
+        else:
+            result = validate_citations(state["agent_outputs"], state["content"])
         validated_citations = result.get("validated_citations", [])
 
         # Note: Citation validation failure doesn't necessarily mean we should fail
@@ -255,8 +282,15 @@ def synthesis_node(state: AgentPipelineState) -> Dict[str, Any]:
     agent_outputs = state.get("agent_outputs", {})
 
     try:
-        # Pass failed agents info to synthesis agent so it can note limitations
-        result = generate_report(agent_outputs, failed_agents=failed_agents)
+        # Pass failed agents and sampled uploads to synthesis so it can note limitations
+        sampling_notes = [
+            f"{item.get('filename')}: {item['sampling']}"
+            for item in (state.get("content") or {}).get("uploaded_content") or []
+            if item.get("sampling")
+        ]
+        result = generate_report(
+            agent_outputs, failed_agents=failed_agents, sampling_notes=sampling_notes
+        )
         logger.info(
             "Report generation completed",
             {
@@ -334,8 +368,11 @@ def process_evaluation(
     Returns:
         Dictionary with audiences, assessments, and report
     """
+    run_id = str(uuid.uuid4())
+
     # Initialize state
     initial_state: AgentPipelineState = {
+        "run_id": run_id,
         "content": content,
         "user_provided_audience": user_provided_audience,
         "audiences": [],
@@ -352,6 +389,9 @@ def process_evaluation(
     pipeline = create_pipeline()
     config = {"configurable": {"thread_id": "1"}}
 
+    # Validate citations in the background as each agent node finishes
+    register_validator(run_id, IncrementalCitationValidator(content))
+
     try:
         final_state = pipeline.invoke(initial_state, config)
 
@@ -383,3 +423,5 @@ def process_evaluation(
         logger.error("Pipeline execution failed", exc_info=True)
         # For unexpected errors, treat as critical failure
         raise CriticalFailureError(f"Pipeline execution failed: {str(e)}") from e
+    finally:
+        release_validator(run_id)
@@ -23,6 +23,9 @@ def merge_lists(left: List[str], right: List[str]) -> List[str]:
 class AgentPipelineState(TypedDict):
     """State object for agent pipeline orchestration."""
 
+    # Identifies this pipeline run (used to look up its background citation validator)
+    run_id: str
+
     # Input content
     content: Dict[str, Any]  # scraped_content and/or uploaded_content
     user_provided_audience: Optional[str]
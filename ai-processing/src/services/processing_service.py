@@ -18,13 +18,28 @@ class ProcessingTimeoutError(Exception):
 
 
 class ProcessingService:
-    """Service for processing evaluation requests through the full pipeline."""
+    """
+    Service for processing evaluation requests through the full pipeline.
+
+    Whoever creates the service owns its browsers and worker processes: call
+    close() when done, or use the service as a context manager.
+    """
 
     def __init__(self, storage_client: Optional[storage.Client] = None):
         """Initialize processing service."""
         self.ingestion_service = IngestionService(storage_client=storage_client)
         self.storage_client = storage_client or storage.Client()
 
+    def close(self) -> None:
+        """Release long-lived resources held by the ingestion layer."""
+        self.ingestion_service.close()
+
+    def __enter__(self) -> "ProcessingService":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def process_evaluation_request(
         self,
         submission_id: str,
@@ -63,6 +78,7 @@ class ProcessingService:
             ProcessingTimeoutError: If processing exceeds timeout_seconds
             ScrapingError: If URL scraping fails
             InsufficientContentError: If scraped content is insufficient
+            ContentQualityError: If no content passes the ingestion quality gate
             UnsupportedFileFormatError: If file format is unsupported
             FileParsingError: If file parsing fails
         """
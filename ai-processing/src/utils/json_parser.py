@@ -1,335 +1,231 @@
 """Utility functions for parsing JSON from LLM responses."""
 
-import json
 import re
-from typing import Optional, Union
+from typing import List, NamedTuple, Optional, Sequence, Tuple, Union
 
+import orjson
 
-def extract_json_from_text(text: str) -> Optional[Union[dict, list]]:
-    """
-    Extract and parse JSON from text that may contain markdown, explanations, etc.
+# What the scanner stops at outside values: brackets, fences and quotes
+_OUTSIDE_PATTERN = re.compile(r'[{\[}"`]')
+# Inside a value: everything up to the next bracket, fence or string that is
+# not well-formed (raw control characters, or unterminated), skipped in one match
+_VALUE_SKIP_PATTERN = re.compile(r'(?:[^"{}\[\]`]+|"[^"\\\n\r\t]*(?:\\.[^"\\\n\r\t]*)*"|`(?!``))*')
+# Inside such a string
+_STRING_PATTERN = re.compile(r'["\\\n\r\t]')
+# A comma, skipping well-formed strings
+_COMMA_PATTERN = re.compile(r'"[^"\\\n\r\t]*(?:\\.[^"\\\n\r\t]*)*"|,')
+_KEY_PATTERN = re.compile(r'"(?:[^"\\\n]|\\.)*"\s*:')
+_CLOSERS = {"{": "}", "[": "]"}
+_OPENERS = {"}": "{", "]": "["}
+# Raw control characters are invalid inside JSON strings
+_CONTROL_ESCAPES = {"\n": "\\n", "\r": "\\r", "\t": "\\t"}
 
-    Handles:
-    - JSON in markdown code blocks (```json ... ```)
-    - JSON objects/arrays embedded in text
-    - Multiple JSON objects/arrays (returns the first valid one)
-    - Trailing commas (attempts to fix)
+# (start, end, replacement) applied to the original text
+_Edit = Tuple[int, int, str]
 
-    Args:
-        text: Text that may contain JSON
 
-    Returns:
-        Parsed JSON object (dict or list), or None if no valid JSON found
-    """
-    if not text:
-        return None
+class _Candidate(NamedTuple):
+    """A top-level JSON value found in the text, as repaired strings to try in order."""
 
-    # Strategy 1: Look for JSON in markdown code blocks
-    # Match ```json ... ``` or ``` ... ``` (with json language tag)
-    # Use a more robust pattern that captures the entire code block content
-    # Try both greedy and non-greedy patterns to handle nested structures
-    code_block_patterns = [
-        r"```json\s*(.*?)```",  # Explicit json tag
-        r"```\s*(.*?)```",  # Generic code block
-    ]
-
-    for pattern in code_block_patterns:
-        matches = list(re.finditer(pattern, text, re.DOTALL))
-        if matches:
-            # Use the last match (most likely to be complete) or try all matches
-            for match in reversed(matches):  # Try from end to start
-                code_block_content = match.group(1).strip()
-                if not code_block_content:
-                    continue
-
-                # Try to find the outermost JSON structure
-                json_str = balance_json(code_block_content)
-                if json_str:
-                    try:
-                        result = json.loads(json_str)
-                        if isinstance(result, (dict, list)):
-                            return result
-                    except json.JSONDecodeError:
-                        # Try fixing trailing commas
-                        json_str_fixed = fix_trailing_commas(json_str)
-                        try:
-                            result = json.loads(json_str_fixed)
-                            if isinstance(result, (dict, list)):
-                                return result
-                        except json.JSONDecodeError:
-                            pass
-
-                # If balance_json didn't work, try direct parsing
-                try:
-                    result = json.loads(code_block_content)
-                    if isinstance(result, (dict, list)):
-                        return result
-                except json.JSONDecodeError:
-                    json_str_fixed = fix_trailing_commas(code_block_content)
-                    try:
-                        result = json.loads(json_str_fixed)
-                        if isinstance(result, (dict, list)):
-                            return result
-                    except json.JSONDecodeError:
-                        continue
-
-    # Strategy 2: Check if text looks like JSON missing opening brace (do this EARLY)
-    # This must run before Strategy 3 to avoid matching nested arrays/objects
-    trimmed_text = text.strip()
-    looks_like_missing_brace = (
-        not trimmed_text.startswith("{")
-        and not trimmed_text.startswith("[")
-        and "}" in trimmed_text
-        and '"' in trimmed_text
-    )
+    start: int
+    fenced: bool
+    texts: List[str]
+    # Raw text of a value that was cut off, to close at its last comma if need be
+    cut: Optional[str] = None
 
-    # Strategy 4 (moved earlier): Handle responses that look like JSON but are missing opening brace
-    # This must run BEFORE Strategy 3 to avoid matching nested structures
-    if looks_like_missing_brace or (
-        "}" in trimmed_text and '"' in trimmed_text and not trimmed_text.startswith("{")
-    ):
-        # Try multiple approaches to reconstruct the JSON
-
-        # Approach 1: Find the last } and reconstruct from there
-        last_brace = trimmed_text.rfind("}")
-        if last_brace != -1:
-            # Extract content up to the last }
-            potential_content = trimmed_text[: last_brace + 1].strip()
-
-            # Check if this looks like JSON object content (has key-value pairs)
-            # Pattern: "key": value or "key": "value" (more flexible to handle various key names)
-            json_like_pattern = r'["\'][^"\']+["\']\s*:\s*[^,}]+'
-            if re.search(json_like_pattern, potential_content, re.DOTALL):
-                # Try adding opening brace if missing
-                if not potential_content.strip().startswith("{"):
-                    reconstructed = "{" + potential_content
-                else:
-                    reconstructed = potential_content
-
-                try:
-                    result = json.loads(reconstructed)
-                    # Only return if it's a dict (not a list or other type)
-                    if isinstance(result, dict):
-                        return result
-                except json.JSONDecodeError:
-                    # Try fixing trailing commas
-                    reconstructed_fixed = fix_trailing_commas(reconstructed)
-                    try:
-                        result = json.loads(reconstructed_fixed)
-                        if isinstance(result, dict):
-                            return result
-                    except json.JSONDecodeError:
-                        pass
-
-        # Approach 2: Look for the first quoted key and reconstruct from there
-        # Find the first occurrence of a quoted key followed by colon (handle multiline)
-        first_key_match = re.search(r'["\']([^"\']+)["\']\s*:', trimmed_text, re.MULTILINE)
-        if first_key_match:
-            start_pos = first_key_match.start()
-            # Find the last closing brace after this position
-            last_brace_after_start = trimmed_text.rfind("}", start_pos)
-            if last_brace_after_start != -1:
-                # Start from before the first key (where { should be)
-                potential_content = trimmed_text[
-                    max(0, start_pos - 1) : last_brace_after_start + 1
-                ].strip()
-                # Ensure it starts with {
-                if not potential_content.startswith("{"):
-                    potential_content = "{" + potential_content.lstrip()
-
-                try:
-                    result = json.loads(potential_content)
-                    if isinstance(result, dict):
-                        return result
-                except json.JSONDecodeError:
-                    potential_content_fixed = fix_trailing_commas(potential_content)
-                    try:
-                        result = json.loads(potential_content_fixed)
-                        if isinstance(result, dict):
-                            return result
-                    except json.JSONDecodeError:
-                        pass
-
-        # Approach 3: Try to reconstruct by finding the content between first key and last brace
-        # This handles multiline strings and complex nested structures
-        # Find the first key and the last closing brace
-        first_key_match = re.search(
-            r'["\']([^"\']+)["\']\s*:', trimmed_text, re.MULTILINE | re.DOTALL
-        )
-        last_brace = trimmed_text.rfind("}")
-
-        if first_key_match and last_brace != -1 and last_brace > first_key_match.start():
-            # Extract everything from before the first key to the last brace
-            # Start a bit before the first key to capture any leading whitespace/newlines
-            start_idx = max(0, first_key_match.start() - 2)
-            content = trimmed_text[start_idx : last_brace + 1].strip()
-
-            # Ensure it starts with {
-            if not content.startswith("{"):
-                content = "{" + content.lstrip()
 
-            # Try parsing
-            try:
-                result = json.loads(content)
-                if isinstance(result, dict):
-                    return result
-            except json.JSONDecodeError:
-                # If it fails, try fixing trailing commas
-                content_fixed = fix_trailing_commas(content)
-                try:
-                    result = json.loads(content_fixed)
-                    if isinstance(result, dict):
-                        return result
-                except json.JSONDecodeError:
-                    # Last resort: try to extract just the object content
-                    # Find where the actual object content starts (first key)
-                    obj_start = first_key_match.start()
-                    obj_content = trimmed_text[obj_start : last_brace + 1]
-                    reconstructed = "{" + obj_content
-                    try:
-                        result = json.loads(reconstructed)
-                        if isinstance(result, dict):
-                            return result
-                    except json.JSONDecodeError:
-                        reconstructed_fixed = fix_trailing_commas(reconstructed)
-                        try:
-                            result = json.loads(reconstructed_fixed)
-                            if isinstance(result, dict):
-                                return result
-                        except json.JSONDecodeError:
-                            pass
-
-    # Strategy 2: Look for JSON objects/arrays in the text
-    # Try to find the first valid JSON object or array
-    patterns = [
-        r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}",  # JSON object (nested braces)
-        r"\[[^\[\]]*(?:\[[^\[\]]*\][^\[\]]*)*\]",  # JSON array (nested brackets)
-    ]
-
-    for pattern in patterns:
-        matches = re.finditer(pattern, text, re.DOTALL)
-        for match in matches:
-            json_str = match.group(0)
-            try:
-                parsed = json.loads(json_str)
-                # Prefer dicts over arrays if we're looking for object responses
-                if isinstance(parsed, dict):
-                    return parsed
-                # Only return arrays if no dicts found
-                if isinstance(parsed, list) and not any(isinstance(m, dict) for m in matches):
-                    return parsed
-            except json.JSONDecodeError:
-                # Try fixing trailing commas
-                json_str_fixed = fix_trailing_commas(json_str)
-                try:
-                    parsed = json.loads(json_str_fixed)
-                    if isinstance(parsed, dict):
-                        return parsed
-                except json.JSONDecodeError:
-                    continue
-
-    # Strategy 3: Try to find JSON by looking for common JSON patterns
-    # Look for content between first { and last } or first [ and last ]
-    brace_start = text.find("{")
-    brace_end = text.rfind("}")
-    if brace_start != -1 and brace_end != -1 and brace_end > brace_start:
-        json_str = text[brace_start : brace_end + 1]
-        try:
-            result = json.loads(json_str)
-            if isinstance(result, dict):
-                return result
-        except json.JSONDecodeError:
-            json_str_fixed = fix_trailing_commas(json_str)
-            try:
-                result = json.loads(json_str_fixed)
-                if isinstance(result, dict):
-                    return result
-            except json.JSONDecodeError:
-                pass
-
-    bracket_start = text.find("[")
-    bracket_end = text.rfind("]")
-    if bracket_start != -1 and bracket_end != -1 and bracket_end > bracket_start:
-        json_str = text[bracket_start : bracket_end + 1]
-        try:
-            result = json.loads(json_str)
-            # Only return arrays as last resort
-            if isinstance(result, list):
-                return result
-        except json.JSONDecodeError:
-            json_str_fixed = fix_trailing_commas(json_str)
-            try:
-                result = json.loads(json_str_fixed)
-                if isinstance(result, list):
-                    return result
-            except json.JSONDecodeError:
-                pass
+def _closers(stack: Sequence[str]) -> str:
+    return "".join(_CLOSERS[opener] for opener in reversed(stack))
 
-    return None
 
+def _apply(text: str, start: int, end: int, edits: Sequence[_Edit], suffix: str = "") -> str:
+    """text[start:end] with edits (in order, inside that range) applied, then suffix."""
+    pieces = []
+    position = start
+    for edit_start, edit_end, replacement in edits:
+        pieces.append(text[position:edit_start])
+        pieces.append(replacement)
+        position = edit_end
+    pieces.append(text[position:end])
+    pieces.append(suffix)
+    return "".join(pieces)
 
-def balance_json(json_str: str) -> str:
-    """
-    Attempt to balance braces and brackets in a JSON string.
 
-    This tries to extract a complete JSON structure by finding matching braces/brackets.
-    Returns the outermost complete structure.
+def _trailing_comma(text: str, position: int) -> Optional[_Edit]:
+    """Edit deleting a comma that only whitespace separates from position, if any."""
+    index = position - 1
+    while index >= 0 and text[index] in " \t\r\n":
+        index -= 1
+    return (index, index + 1, "") if index >= 0 and text[index] == "," else None
 
-    Args:
-        json_str: JSON string that may be incomplete or have extra content
 
-    Returns:
-        Balanced JSON string (outermost complete structure), or empty string if none found
+def _scan(text: str) -> List[_Candidate]:
     """
-    if not json_str:
-        return ""
-
-    # Find the first opening brace or bracket
-    start_idx = -1
-    for i, char in enumerate(json_str):
-        if char in "{[":
-            start_idx = i
-            break
-
-    if start_idx == -1:
-        return ""
-
-    # Track depth to find the matching closing brace/bracket
-    depth = 0
-    end_idx = -1
-    opening_char = json_str[start_idx]
-    closing_char = "}" if opening_char == "{" else "]"
-
-    for i in range(start_idx, len(json_str)):
-        char = json_str[i]
-        if char == opening_char:
-            depth += 1
-        elif char == closing_char:
-            depth -= 1
-            if depth == 0:
-                end_idx = i
+    Find the balanced top-level JSON values in text in one pass, repairing them.
+
+    Outside values, only brackets, markdown fences and quoted keys matter.
+    Inside a value, a bracket stack is kept and strings, scalars and commas
+    are skipped a run at a time; only strings with raw control characters or
+    no closing quote are walked character by character. Edits are recorded
+    for:
+
+    - trailing commas before '}' or ']'
+    - raw newlines and tabs inside strings
+    - closers that skip a level (missing closers are inserted) or match no
+      open bracket (dropped)
+    - values cut off at the end of the text or by a closing fence; these are
+      closed as they stand, or else at their last comma (see _close_at_last_comma)
+
+    A response missing its opening brace ('"score": 7, ...}') becomes one
+    more candidate, from its first quoted key to the last unmatched '}'.
+    """
+    candidates: List[_Candidate] = []
+    fenced = False
+    stack: List[str] = []
+    start = 0
+    edits: List[_Edit] = []
+    in_string = False
+    first_key = last_unmatched = None
+
+    def truncated(end: int) -> _Candidate:
+        if in_string:
+            texts = [_apply(text, start, end, edits, '"' + _closers(stack))]
+        else:
+            comma = _trailing_comma(text, end)
+            texts = [_apply(text, start, end, edits + [comma] * bool(comma), _closers(stack))]
+        return _Candidate(start, fenced, texts, cut=text[start:end])
+
+    position = 0
+    length = len(text)
+    while position < length:
+        if in_string:
+            match = _STRING_PATTERN.search(text, position)
+            if match is None:
+                break
+            position = match.end()
+            token = match.group()
+            if token == "\\":
+                position += 1
+            elif token == '"':
+                in_string = False
+            else:
+                edits.append((position - 1, position, _CONTROL_ESCAPES[token]))
+            continue
+
+        if not stack:
+            match = _OUTSIDE_PATTERN.search(text, position)
+            if match is None:
                 break
+            position = match.end()
+            token = match.group()
+            if token in _CLOSERS:
+                stack.append(token)
+                start = match.start()
+                edits = []
+            elif token == "`":
+                if text.startswith("```", match.start()):
+                    fenced = not fenced
+                    position += 2
+            elif token == "}":
+                last_unmatched = match.start()
+            elif first_key is None and _KEY_PATTERN.match(text, match.start()):
+                first_key = match.start()
+            continue
+
+        position = _VALUE_SKIP_PATTERN.match(text, position).end()
+        if position == length:
+            break
+        token = text[position]
+        if token == "`":
+            # The fence closed before the value did: the response was cut off
+            candidates.append(truncated(position))
+            stack = []
+            fenced = not fenced
+            position += 3
+            continue
+        if token == '"':
+            in_string = True
+        elif token in _CLOSERS:
+            stack.append(token)
+        else:
+            comma = _trailing_comma(text, position)
+            if comma:
+                edits.append(comma)
+            opener = _OPENERS[token]
+            if opener not in stack:
+                edits.append((position, position + 1, ""))
+            else:
+                level = len(stack) - 1 - stack[::-1].index(opener)
+                if level < len(stack) - 1:
+                    edits.append((position, position, _closers(stack[level + 1 :])))
+                del stack[level:]
+                if not stack:
+                    candidates.append(
+                        _Candidate(start, fenced, [_apply(text, start, position + 1, edits)])
+                    )
+        position += 1
+
+    if stack:
+        candidates.append(truncated(length))
+    if first_key is not None and last_unmatched is not None and first_key < last_unmatched:
+        wrapped = "{" + text[first_key : last_unmatched + 1]
+        for candidate in _scan(wrapped):
+            if candidate.start == 0:
+                candidates.append(candidate._replace(start=first_key))
+    return candidates
+
+
+def _close_at_last_comma(value: str) -> Optional[str]:
+    """A cut-off value closed after its last complete member, or None without a comma."""
+    last_comma = 0
+    for match in _COMMA_PATTERN.finditer(value):
+        if match.group() == ",":
+            last_comma = match.start()
+    candidates = _scan(value[:last_comma]) if last_comma else []
+    return candidates[0].texts[0] if candidates else None
 
-    if end_idx != -1:
-        return json_str[start_idx : end_idx + 1]
 
-    return ""
+def extract_json_from_text(text: str) -> Optional[Union[dict, list]]:
+    """
+    Extract and parse JSON from text that may contain markdown, explanations, etc.
 
+    The text is scanned once (see _scan) and the candidates are decoded with
+    orjson in order of preference:
 
-def fix_trailing_commas(json_str: str) -> str:
-    """
-    Attempt to fix trailing commas in JSON strings.
+    - JSON in markdown code blocks, the last block first
+    - objects before arrays
+    - earlier values before later ones
 
-    This is a simple fix that removes trailing commas before closing braces/brackets.
-    More complex fixes would require a proper JSON parser.
+    Handles trailing commas, raw newlines in strings, unbalanced or missing
+    brackets, output cut off mid-value, and a missing opening brace.
 
     Args:
-        json_str: JSON string that may have trailing commas
+        text: Text that may contain JSON
 
     Returns:
-        JSON string with trailing commas removed
+        Parsed JSON object (dict or list), or None if no valid JSON found
     """
-    # Remove trailing commas before } or ]
-    # This regex matches: ,\s*} or ,\s*]
-    fixed = re.sub(r",\s*([}\]])", r"\1", json_str)
-    return fixed
+    if not text:
+        return None
+
+    candidates = _scan(text)
+    candidates.sort(
+        key=lambda candidate: (
+            not candidate.fenced,
+            not candidate.texts[0].startswith("{"),
+            -candidate.start if candidate.fenced else candidate.start,
+        )
+    )
+    for candidate in candidates:
+        for repaired in candidate.texts:
+            try:
+                return orjson.loads(repaired)
+            except orjson.JSONDecodeError:
+                continue
+        repaired = _close_at_last_comma(candidate.cut) if candidate.cut else None
+        if repaired:
+            try:
+                return orjson.loads(repaired)
+            except orjson.JSONDecodeError:
+                continue
+    return None
@@ -0,0 +1,309 @@
+"""Offline semantic similarity of quotes to sentence windows using sparse word and n-gram vectors."""
+
+import re
+from bisect import bisect_left
+from typing import Dict, FrozenSet, List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+# Sentence windows of 1..N consecutive sentences, so quotes spanning a sentence
+# boundary can still match.
+MAX_WINDOW_SENTENCES = 2
+NGRAM_SIZE = 3
+# Share of a quote's weight on whole content words; the rest is spread over the
+# character n-grams of those words, so 'finance' still partly matches 'financial'
+WORD_WEIGHT = 0.5
+# Upper bound on quote x window scores held at once (float64), so thousands of
+# quotes against a long source are scored in blocks of about 32 MB
+MAX_SCORE_CELLS = 4 * 1024 * 1024
+# Upper bound on window ids gathered at once while multiplying; common n-grams
+# are in most windows, so their postings are added in blocks
+MAX_GATHERED_POSTINGS = 2 * 1024 * 1024
+# Best-scoring windows checked for contradictions per quote
+MAX_CANDIDATE_WINDOWS = 5
+# Share of the quote's matched content words that must keep their source order;
+# moving an adverb passes, swapping subject and object does not
+MIN_ORDER_RATIO = 0.8
+# Words before the first matched word searched for a negation ("we never sell")
+NEGATION_REACH = 3
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+|\n+")
+_TOKEN_PATTERN = re.compile(r"\w+")
+_CONTRACTION_PATTERN = re.compile(r"n['’]t\b")
+_NEGATIONS = frozenset(
+    "not no never none nobody nothing nowhere neither nor cannot without".split()
+)
+_FUNCTION_WORDS = frozenset(
+    "a about after all also am an and any are as at be because been being but by can could "
+    "did do does for from had has have he her his how i if in into is it its may me might "
+    "more most must my of on or our ours out over shall she should so than that the their "
+    "them then there these they this those through to up us very was we were what when "
+    "where which while who whom why will with would you your yours".split()
+)
+
+
+class _QuoteTerms(NamedTuple):
+    """What a quote has to share with a source window to match it."""
+
+    # Distinct content words in quote order
+    content: List[str]
+    # Numbers and capitalised words (names, acronyms) that must appear in the window
+    keys: FrozenSet[str]
+    negations: int
+
+
+def split_sentences(text: str) -> List[Tuple[int, str]]:
+    """
+    Split text into sentences.
+
+    Returns:
+        List of (character offset, sentence text) tuples
+    """
+    sentences = []
+    position = 0
+    for match in _SENTENCE_SPLIT.finditer(text):
+        sentence = text[position : match.start()]
+        if sentence.strip():
+            sentences.append((position, sentence))
+        position = match.end()
+    if text[position:].strip():
+        sentences.append((position, text[position:]))
+    return sentences
+
+
+def _stem(word: str) -> str:
+    """Strip a plural or third-person 's' so 'helps'/'help' and 'CFOs'/'CFO' match."""
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased, stemmed words of text, with "n't" split off as "not"."""
+    text = _CONTRACTION_PATTERN.sub(" not", text.lower())
+    return [_stem(word) for word in _TOKEN_PATTERN.findall(text)]
+
+
+def _is_content(token: str) -> bool:
+    return token not in _FUNCTION_WORDS and token not in _NEGATIONS
+
+
+def _ngrams(words: Sequence[str]) -> List[str]:
+    """Distinct character n-grams of words, padded so word starts and ends count."""
+    ngrams = []
+    for word in words:
+        padded = f" {word} "
+        ngrams.extend(padded[i : i + NGRAM_SIZE] for i in range(len(padded) - NGRAM_SIZE + 1))
+    return list(dict.fromkeys(ngrams))
+
+
+def _content_words(tokens: Sequence[str]) -> List[str]:
+    """Distinct content words in order of first use."""
+    return list(dict.fromkeys(token for token in tokens if _is_content(token)))
+
+
+def _quote_terms(quote: str) -> _QuoteTerms:
+    tokens = tokenize(quote)
+    content = _content_words(tokens)
+    keys = {
+        _stem(word.lower())
+        for index, word in enumerate(_TOKEN_PATTERN.findall(quote))
+        if any(c.isdigit() for c in word) or (index and any(c.isupper() for c in word))
+    }
+    return _QuoteTerms(
+        content=content,
+        keys=frozenset(keys.intersection(content)),
+        negations=sum(token in _NEGATIONS for token in tokens),
+    )
+
+
+def _longest_increasing(values: Sequence[int]) -> int:
+    """Length of the longest strictly increasing subsequence of values."""
+    tails: List[int] = []
+    for value in values:
+        index = bisect_left(tails, value)
+        if index == len(tails):
+            tails.append(value)
+        else:
+            tails[index] = value
+    return len(tails)
+
+
+def _consistent(terms: _QuoteTerms, tokens: Sequence[str]) -> bool:
+    """
+    Whether a window says what the quote says, not merely something similar.
+
+    Rejects a window that shares no content word with the quote, lacks one of
+    its numbers or names, has the shared words in a different order (swapped
+    subject and object), or has a different number of negations around them.
+    """
+    first_positions: Dict[str, int] = {}
+    for position, token in enumerate(tokens):
+        first_positions.setdefault(token, position)
+    if any(key not in first_positions for key in terms.keys):
+        return False
+
+    positions = [first_positions[word] for word in terms.content if word in first_positions]
+    if not positions or _longest_increasing(positions) < MIN_ORDER_RATIO * len(positions):
+        return False
+    start = max(min(positions) - NEGATION_REACH, 0)
+    negations = sum(token in _NEGATIONS for token in tokens[start : max(positions) + 1])
+    return negations == terms.negations
+
+
+class SentenceIndex:
+    """Sparse feature matrix over the sentence windows of a source text."""
+
+    def __init__(self, source_text: str, max_window_sentences: int = MAX_WINDOW_SENTENCES):
+        """
+        Build the index: one sparse matrix of window vectors, stored by feature.
+
+        Only the windows containing each feature are stored, so memory grows with
+        the source text rather than with windows x vector width.
+
+        Args:
+            source_text: Source text to index
+            max_window_sentences: Largest number of consecutive sentences per window
+        """
+        sentences = split_sentences(source_text)
+        self._sentence_offsets = [offset for offset, _ in sentences]
+        self._sentence_tokens = [tokenize(sentence) for _, sentence in sentences]
+
+        # Word features are "w:<word>"; n-grams never contain ':' so cannot collide
+        self._vocabulary: Dict[str, int] = {}
+        word_features: Dict[str, np.ndarray] = {}
+        sentence_features = []
+        for tokens in self._sentence_tokens:
+            ids = [np.empty(0, dtype=np.int32)]
+            for word in _content_words(tokens):
+                if word not in word_features:
+                    word_features[word] = np.array(
+                        [
+                            self._vocabulary.setdefault(feature, len(self._vocabulary))
+                            for feature in [f"w:{word}", *_ngrams([word])]
+                        ],
+                        dtype=np.int32,
+                    )
+                ids.append(word_features[word])
+            sentence_features.append(np.unique(np.concatenate(ids)))
+
+        self._windows: List[Tuple[int, int]] = []
+        window_features = []
+        for first in range(len(sentences)):
+            for size in range(1, max_window_sentences + 1):
+                if first + size > len(sentences):
+                    break
+                self._windows.append((first, size))
+                window_features.append(
+                    np.unique(np.concatenate(sentence_features[first : first + size]))
+                )
+        self._sizes = np.array([size for _, size in self._windows], dtype=np.int32)
+
+        # Column-compressed layout: windows containing feature f are
+        # _feature_windows[_feature_starts[f] : _feature_starts[f + 1]]
+        feature_ids = np.concatenate(window_features or [np.empty(0, dtype=np.int32)])
+        window_ids = np.repeat(
+            np.arange(len(self._windows), dtype=np.int32), [len(f) for f in window_features]
+        )
+        order = np.argsort(feature_ids, kind="stable")
+        self._feature_windows = window_ids[order]
+        self._feature_starts = np.zeros(len(self._vocabulary) + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(feature_ids, minlength=len(self._vocabulary)),
+            out=self._feature_starts[1:],
+        )
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
+    def _window_tokens(self, window_id: int) -> List[str]:
+        first, size = self._windows[window_id]
+        return [token for tokens in self._sentence_tokens[first : first + size] for token in tokens]
+
+    def _quote_vector(self, terms: _QuoteTerms) -> Tuple[List[int], List[float]]:
+        """Feature ids and weights of a quote; the weights of all its features sum to 1."""
+        words = terms.content
+        if not words:
+            return [], []
+        ngrams = _ngrams(words)
+        weighted = [(f"w:{word}", WORD_WEIGHT / len(words)) for word in words]
+        weighted += [(ngram, (1 - WORD_WEIGHT) / len(ngrams)) for ngram in ngrams]
+        pairs = [(self._vocabulary[f], w) for f, w in weighted if f in self._vocabulary]
+        return [f for f, _ in pairs], [w for _, w in pairs]
+
+    def _scores(self, vectors: Sequence[Tuple[List[int], List[float]]]) -> np.ndarray:
+        """
+        Multiply quote vectors by the window matrix.
+
+        Returns:
+            Matrix of shape (len(vectors), windows): the share of each quote's
+            weight found in each window
+        """
+        rows = np.repeat(np.arange(len(vectors)), [len(ids) for ids, _ in vectors])
+        ids = np.array([f for ids, _ in vectors for f in ids], dtype=np.int64)
+        weights = np.array([w for _, ws in vectors for w in ws], dtype=np.float64)
+        starts = self._feature_starts[ids]
+        lengths = self._feature_starts[ids + 1] - starts
+        ends = np.cumsum(lengths)
+
+        scores = np.zeros(len(vectors) * len(self._windows))
+        first = 0
+        while first < len(ids):
+            # Quote features whose postings together fit in one gather
+            last = max(
+                int(np.searchsorted(ends, ends[first] - lengths[first] + MAX_GATHERED_POSTINGS)),
+                first + 1,
+            )
+            block = slice(first, last)
+            counts = lengths[block]
+            offsets = np.repeat(starts[block] - (np.cumsum(counts) - counts), counts)
+            windows = self._feature_windows[offsets + np.arange(counts.sum())]
+            cells = np.repeat(rows[block], counts) * len(self._windows) + windows
+            scores += np.bincount(
+                cells, weights=np.repeat(weights[block], counts), minlength=len(scores)
+            )
+            first = last
+        return scores.reshape(len(vectors), len(self._windows))
+
+    def best_matches(self, quotes: Sequence[str]) -> List[Tuple[float, int]]:
+        """
+        Score all quotes against all windows, then drop windows that contradict them.
+
+        The score is the share of the quote's word and n-gram weight found in
+        the window, computed for every quote and window in one sparse matrix
+        product. Of the best-scoring windows, those that contradict the quote
+        (see _consistent) are skipped.
+
+        Args:
+            quotes: Quotes to score
+
+        Returns:
+            List of (score, character offset of the window) per quote.
+            (0.0, -1) when no window shares a content word without contradiction.
+        """
+        if not quotes:
+            return []
+        if not len(self):
+            return [(0.0, -1) for _ in quotes]
+
+        terms = [_quote_terms(quote) for quote in quotes]
+        vectors = [self._quote_vector(quote_terms) for quote_terms in terms]
+        batch = max(1, MAX_SCORE_CELLS // len(self))
+        results = []
+        for start in range(0, len(quotes), batch):
+            scores = self._scores(vectors[start : start + batch])
+            for quote_terms, row in zip(terms[start : start + batch], scores):
+                results.append(self._best_consistent(quote_terms, row))
+        return results
+
+    def _best_consistent(self, terms: _QuoteTerms, scores: np.ndarray) -> Tuple[float, int]:
+        # Highest score first, then the shorter window
+        for window_id in np.lexsort((self._sizes, -scores))[:MAX_CANDIDATE_WINDOWS]:
+            if not scores[window_id]:
+                break
+            if _consistent(terms, self._window_tokens(window_id)):
+                first, _ = self._windows[window_id]
+                return float(scores[window_id]), self._sentence_offsets[first]
+        return 0.0, -1
@@ -4,6 +4,8 @@ This module defines consistent JSON schemas for all agents using Anthropic's Too
 Tool Use guarantees valid JSON conforming to the schema, eliminating parsing errors.
 """
 
+from typing import Any, Dict
+
 # Common reusable schema components
 CITATION_SCHEMA = {
     "type": "object",
@@ -26,6 +28,25 @@ EVIDENCE_SCHEMA = {
     "required": ["quote", "source"],
 }
 
+CLARITY_DIMENSION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "score": {
+            "type": "integer",
+            "minimum": 0,
+            "maximum": 100,
+            "description": "Clarity score for this dimension (0-100)",
+        },
+        "assessment": {"type": "string", "description": "Textual assessment of this dimension"},
+        "citations": {
+            "type": "array",
+            "description": "Quotes from the content supporting the assessment",
+            "items": CITATION_SCHEMA,
+        },
+    },
+    "required": ["score", "assessment", "citations"],
+}
+
 # Clarity Agent Tool
 CLARITY_TOOL = {
     "name": "record_clarity_assessment",
@@ -33,49 +54,20 @@ CLARITY_TOOL = {
     "input_schema": {
         "type": "object",
         "properties": {
-            "overall_clarity_score": {
-                "type": "integer",
-                "minimum": 0,
-                "maximum": 100,
-                "description": "Overall clarity score (0-100)",
+            "what_they_do": {
+                **CLARITY_DIMENSION_SCHEMA,
+                "description": "Is it clear what the company/product does?",
             },
-            "overall_assessment": {
-                "type": "string",
-                "description": "Overall textual assessment of clarity",
+            "how_theyre_different": {
+                **CLARITY_DIMENSION_SCHEMA,
+                "description": "Is it clear how they differ from competitors?",
             },
-            "issues": {
-                "type": "array",
-                "description": "List of clarity issues identified",
-                "items": {
-                    "type": "object",
-                    "properties": {
-                        "category": {
-                            "type": "string",
-                            "description": (
-                                "Category of clarity issue (e.g., 'what_they_do', "
-                                "'how_theyre_different', 'who_uses_them')"
-                            ),
-                        },
-                        "severity": {
-                            "type": "string",
-                            "enum": ["high", "medium", "low"],
-                            "description": "Severity level of the issue",
-                        },
-                        "description": {
-                            "type": "string",
-                            "description": "Description of the clarity issue",
-                        },
-                        "evidence": {
-                            "type": "array",
-                            "description": "Supporting quotes from content",
-                            "items": EVIDENCE_SCHEMA,
-                        },
-                    },
-                    "required": ["category", "severity", "description"],
-                },
+            "who_uses_them": {
+                **CLARITY_DIMENSION_SCHEMA,
+                "description": "Is it clear who the target users/customers are?",
             },
         },
-        "required": ["overall_clarity_score", "overall_assessment"],
+        "required": ["what_they_do", "how_theyre_different", "who_uses_them"],
     },
 }
 
@@ -221,7 +213,11 @@ VOICE_TOOL = {
                 "type": "string",
                 "description": "Description of the dominant voice characteristics",
             },
-            "overall_assessment": {"type": "string", "description": "Overall voice assessment"},
+            "overall_assessment": {
+                "type": "string",
+                "enum": ["distinct", "generic", "mixed"],
+                "description": "Whether the content has a distinct voice",
+            },
             "voice_patterns": {
                 "type": "array",
                 "description": "Voice patterns detected in content",
@@ -271,7 +267,11 @@ VIVIDNESS_TOOL = {
                 "maximum": 100,
                 "description": "Overall vividness/concreteness score (0-100)",
             },
-            "overall_assessment": {"type": "string", "description": "Overall vividness assessment"},
+            "overall_assessment": {
+                "type": "string",
+                "enum": ["vivid", "generic", "mixed"],
+                "description": "Whether the language is vivid or generic overall",
+            },
             "vivid_elements": {
                 "type": "array",
                 "description": "Vivid elements identified in content",
@@ -326,6 +326,55 @@ VIVIDNESS_TOOL = {
     },
 }
 
+# Audience Identification Agent Tool
+AUDIENCE_TOOL = {
+    "name": "record_audiences",
+    "description": "Record the target audiences identified in the content",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "audiences": {
+                "type": "array",
+                "description": "Target audiences, most specific description possible",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "description": {
+                            "type": "string",
+                            "description": (
+                                "Specific audience description (e.g., 'CFOs at Fortune 500 "
+                                "companies', not just 'CFOs')"
+                            ),
+                        },
+                        "specificity_score": {
+                            "type": "integer",
+                            "minimum": 0,
+                            "maximum": 100,
+                            "description": "How specific the description is (0-100)",
+                        },
+                        "source": {
+                            "type": "string",
+                            "enum": ["user_provided", "content_analysis", "both"],
+                            "description": "Where the audience came from",
+                        },
+                        "rationale": {
+                            "type": "string",
+                            "description": "Why this audience was identified",
+                        },
+                        "citations": {
+                            "type": "array",
+                            "description": "Quotes from the content supporting this audience",
+                            "items": CITATION_SCHEMA,
+                        },
+                    },
+                    "required": ["description", "specificity_score", "source", "rationale"],
+                },
+            },
+        },
+        "required": ["audiences"],
+    },
+}
+
 # Synthesis Agent Tool
 SYNTHESIS_TOOL = {
     "name": "record_synthesis_report",
@@ -473,3 +522,31 @@ SYNTHESIS_TOOL = {
         ],
     },
 }
+
+
+def tool_choice(tool: Dict[str, Any]) -> Dict[str, str]:
+    """tool_choice forcing the model to answer with tool."""
+    return {"type": "tool", "name": tool["name"]}
+
+
+def tool_input(response: Any, tool: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Get the input of tool's tool_use block from a forced tool use response.
+
+    Args:
+        response: Anthropic messages response
+        tool: Tool the response was forced to use
+
+    Returns:
+        The tool input, which conforms to tool's input_schema
+
+    Raises:
+        ValueError: If the response has no such block (e.g. it was cut off at max_tokens)
+    """
+    for block in response.content:
+        if block.type == "tool_use" and block.name == tool["name"]:
+            return block.input
+    raise ValueError(
+        f"No {tool['name']} tool_use block in response "
+        f"(stop_reason: {getattr(response, 'stop_reason', None)})"
+    )
@@ -25,3 +25,10 @@ def test_process_endpoint_placeholder():
     data = response.json()
     assert data["message"] == "Processing endpoint is implemented in the evaluation pipeline"
 
+
+def test_app_lifespan_starts_and_stops():
+    """Test that the app starts up and shuts down cleanly with its lifespan run."""
+    with TestClient(app) as lifespan_client:
+        response = lifespan_client.get("/health")
+
+    assert response.status_code == 200
@@ -108,3 +108,134 @@ class TestCitationValidation:
 
         assert result["validated"] is False
 
+    def test_semantic_validation_accepts_paraphrase(self):
+        """Test that a reworded quote validates via the semantic stage."""
+        from src.agents.citation_validation_agent import validate_citation
+
+        source_text = (
+            "We build software for enterprises. "
+            "Our platform helps CFOs manage financial operations efficiently."
+        )
+        quote = "Our platform helps CFOs efficiently manage their financial operations"
+
+        result = validate_citation(quote, source_text)
+
+        assert result["validated"] is True
+        assert result["method"] == "semantic"
+        assert result["similarity"] == pytest.approx(1.0)
+        assert result["location"] == source_text.index("Our platform")
+
+    @pytest.mark.parametrize(
+        "quote",
+        [
+            "Our platform helps CFOs run financial operations efficiently",
+            "Our platform lets CFOs manage finance operations efficiently",
+            "Founded in 2001 by two engineers wanting to simplify payroll for small clinics",
+        ],
+        ids=["synonym", "word_form", "two_words"],
+    )
+    def test_semantic_validation_accepts_substituted_words(self, quote):
+        """Test that a paraphrase with a few reworded words still validates."""
+        from src.agents.citation_validation_agent import validate_citation
+
+        source_text = (
+            "Our platform helps CFOs manage financial operations efficiently. "
+            "Acme was founded in 2001 by two engineers who wanted to make payroll simple "
+            "for small clinics."
+        )
+
+        result = validate_citation(quote, source_text)
+
+        assert result["validated"] is True
+        assert result["method"] == "semantic"
+        assert 0.75 <= result["similarity"] < 1.0
+
+    def test_semantic_threshold_is_configurable(self):
+        """Test that the semantic threshold sets how similar a reworded quote must be."""
+        from src.agents.citation_validation_agent import validate_citation
+
+        source_text = (
+            "Our platform helps CFOs manage financial operations efficiently. "
+            "Acme was founded in 2001 by two engineers who wanted to make payroll simple "
+            "for small clinics."
+        )
+        quote = "Founded in 2001 by two engineers wanting to simplify payroll for small clinics"
+
+        similarity = validate_citation(quote, source_text)["similarity"]
+        assert validate_citation(quote, source_text, semantic_threshold=0.9)["validated"] is False
+        result = validate_citation(quote, source_text, semantic_threshold=similarity)
+        assert result["validated"] is True
+
+    @pytest.mark.parametrize(
+        "quote",
+        [
+            "We always sell customer data",
+            "Our platform does not help CFOs manage financial operations",
+            "Our platform helps CEOs manage marketing operations efficiently",
+            "Our platform helps CEOs manage financial operations efficiently",
+            "Enterprises build software for us",
+            "Our platform helps CFOs manage 40 financial operations efficiently",
+        ],
+        ids=["contradicted", "negated", "substituted", "substituted_name", "reordered", "number"],
+    )
+    def test_semantic_validation_rejects_changed_meaning(self, quote):
+        """Test that quotes sharing the source's words but not its meaning are rejected."""
+        from src.agents.citation_validation_agent import validate_citation
+
+        source_text = (
+            "We build software for enterprises. "
+            "Our platform helps CFOs manage financial operations efficiently. "
+            "We never sell customer data."
+        )
+
+        result = validate_citation(quote, source_text)
+
+        assert result["validated"] is False
+
+    def test_validate_citations_batches_semantic_stage(self):
+        """Test that exact, semantic and rejected quotes are resolved in one call."""
+        from src.agents.citation_validation_agent import validate_citations
+
+        all_agent_outputs = {
+            "voice_agent": {
+                "citations": [
+                    {"quote": "We build software", "source": "homepage"},
+                    {
+                        "quote": "Our platform helps CFOs efficiently manage their financial operations",
+                        "source": "homepage",
+                    },
+                    {"quote": "Completely unrelated fabricated claim", "source": "homepage"},
+                ]
+            }
+        }
+        source_content = {
+            "scraped_content": {
+                "homepage": {
+                    "text": "We build software for enterprises. "
+                    "Our platform helps CFOs manage financial operations efficiently."
+                }
+            },
+            "uploaded_content": [],
+        }
+
+        result = validate_citations(all_agent_outputs, source_content)
+        citations = result["validated_citations"]
+
+        assert [c.get("method") for c in citations] == ["exact", "semantic", None]
+        assert [c["validated"] for c in citations] == [True, True, False]
+        assert all(c["source"] == "homepage" for c in citations)
+
+    def test_source_text_includes_collapsed_uploads(self):
+        """Test that citations are checked against uploads removed as duplicates."""
+        from src.agents.citation_validation_agent import extract_source_text
+
+        source_content = {
+            "scraped_content": None,
+            "uploaded_content": [{"filename": "deck.pptx", "text": "Deck text."}],
+            "original_uploaded_content": [
+                {"filename": "deck.pptx", "text": "Deck text."},
+                {"filename": "deck.pdf", "text": "Deck text as PDF."},
+            ],
+        }
+
+        assert "Deck text as PDF." in extract_source_text(source_content)
@@ -0,0 +1,127 @@
+"""Tests for agents answering through forced tool use."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.tool_schemas import CLARITY_TOOL, VOICE_TOOL, tool_input
+
+CONTENT = {
+    "scraped_content": {"homepage": {"text": "We build payroll software for clinics."}},
+    "uploaded_content": [],
+}
+AUDIENCE = {"id": "audience-1", "description": "Clinic office managers"}
+
+
+def _response(*blocks, stop_reason="tool_use"):
+    return SimpleNamespace(content=list(blocks), stop_reason=stop_reason)
+
+
+def _tool_use(tool, data):
+    return SimpleNamespace(type="tool_use", name=tool["name"], input=data)
+
+
+class TestToolInput:
+    """Test reading the tool input from a forced tool use response."""
+
+    def test_returns_matching_block_input(self):
+        """Test that text and other tools' blocks are skipped."""
+        response = _response(
+            SimpleNamespace(type="text", text="Here is my assessment."),
+            _tool_use(VOICE_TOOL, {"voice_consistency_score": 10}),
+            _tool_use(CLARITY_TOOL, {"what_they_do": {}}),
+        )
+        assert tool_input(response, CLARITY_TOOL) == {"what_they_do": {}}
+
+    def test_missing_block_raises(self):
+        """Test that a response cut off before the tool call raises with its stop reason."""
+        response = _response(SimpleNamespace(type="text", text="{"), stop_reason="max_tokens")
+        with pytest.raises(ValueError, match="max_tokens"):
+            tool_input(response, CLARITY_TOOL)
+
+
+class TestAgentsUseTools:
+    """Test that agents force their tool and map its input to the agent contract."""
+
+    def test_clarity_agent(self):
+        """Test the clarity dimensions are passed through as the assessments."""
+        from src.agents.clarity_agent import evaluate_clarity
+
+        dimension = {
+            "score": 72,
+            "assessment": "Clear.",
+            "citations": [{"quote": "We build payroll software", "source": "homepage"}],
+        }
+        data = {key: dimension for key in ("what_they_do", "how_theyre_different", "who_uses_them")}
+        with patch("src.agents.clarity_agent.Anthropic") as anthropic:
+            create = anthropic.return_value.messages.create
+            create.return_value = _response(_tool_use(CLARITY_TOOL, data))
+            result = evaluate_clarity(AUDIENCE, CONTENT)
+
+        kwargs = create.call_args.kwargs
+        assert kwargs["tools"] == [CLARITY_TOOL]
+        assert kwargs["tool_choice"] == {"type": "tool", "name": "record_clarity_assessment"}
+        assert result["assessments"] == data
+        assert result["audience_id"] == "audience-1"
+
+    def test_voice_agent(self):
+        """Test the voice tool fields are mapped to score, assessment and findings."""
+        from src.agents.voice_agent import evaluate_voice
+
+        data = {
+            "voice_consistency_score": 64,
+            "dominant_voice_characteristics": "Plain and practical",
+            "overall_assessment": "distinct",
+        }
+        with patch("src.agents.voice_agent.Anthropic") as anthropic:
+            create = anthropic.return_value.messages.create
+            create.return_value = _response(_tool_use(VOICE_TOOL, data))
+            result = evaluate_voice(CONTENT)
+
+        assert result["overall_assessment"] == "distinct"
+        assert result["score"] == 64
+        assert result["findings"] == {
+            "dominant_voice_characteristics": "Plain and practical",
+            "voice_patterns": [],
+        }
+
+    def test_missing_tool_call_is_an_error_not_a_default_score(self):
+        """Test that a response without the tool call gives the error result."""
+        from src.agents.importance_agent import evaluate_importance
+
+        with patch("src.agents.importance_agent.Anthropic") as anthropic:
+            anthropic.return_value.messages.create.return_value = _response(
+                SimpleNamespace(type="text", text='{"score": 90}'), stop_reason="max_tokens"
+            )
+            result = evaluate_importance(AUDIENCE, CONTENT)
+
+        assert result["score"] == 0
+        assert result["assessment"] == "Error in evaluation"
+
+    def test_audience_identification(self):
+        """Test identified audiences become Audience records with citations."""
+        from src.agents.audience_identification import identify_audiences
+        from src.utils.tool_schemas import AUDIENCE_TOOL
+
+        data = {
+            "audiences": [
+                {
+                    "description": "Office managers at independent clinics",
+                    "specificity_score": 80,
+                    "source": "content_analysis",
+                    "rationale": "The homepage names clinics.",
+                    "citations": [{"quote": "software for clinics", "source": "homepage"}],
+                }
+            ]
+        }
+        with patch("src.agents.audience_identification.Anthropic") as anthropic:
+            create = anthropic.return_value.messages.create
+            create.return_value = _response(_tool_use(AUDIENCE_TOOL, data))
+            result = identify_audiences(CONTENT)
+
+        assert create.call_args.kwargs["tool_choice"]["name"] == "record_audiences"
+        [audience] = result["audiences"]
+        assert audience["description"] == "Office managers at independent clinics"
+        assert audience["specificity_score"] == 80
+        assert audience["citations"][0]["quote"] == "software for clinics"
@@ -122,3 +122,34 @@ class TestEnvConfig:
             with pytest.raises(ValueError, match="Project ID must be set"):
                 load_env_config()
 
+    def test_validate_parse_budget_mode(self):
+        """Test that a misspelt parse budget mode fails at startup instead of disabling budgets."""
+        with patch.dict(
+            os.environ,
+            {
+                "ANTHROPIC_API_KEY": "test-key-123",
+                "FIRESTORE_PROJECT_ID": "test-project",
+                "CLOUD_STORAGE_BUCKET": "test-bucket",
+                "GCP_PROJECT_ID": "test-project",
+                "PARSE_BUDGET_MODE": "sampel",
+            },
+            clear=False,
+        ):
+            with pytest.raises(ValueError, match="parse_budget_mode"):
+                load_env_config()
+
+    def test_validate_scrape_job_timeout(self):
+        """Test that a zero scrape job timeout fails at startup instead of failing every scrape."""
+        with patch.dict(
+            os.environ,
+            {
+                "ANTHROPIC_API_KEY": "test-key-123",
+                "FIRESTORE_PROJECT_ID": "test-project",
+                "CLOUD_STORAGE_BUCKET": "test-bucket",
+                "GCP_PROJECT_ID": "test-project",
+                "SCRAPE_JOB_TIMEOUT_SECONDS": "0",
+            },
+            clear=False,
+        ):
+            with pytest.raises(ValueError, match="SCRAPE_JOB_TIMEOUT_SECONDS must be positive"):
+                load_env_config()
@@ -0,0 +1,134 @@
+"""Unit tests for the pooled browser manager (Playwright is mocked)."""
+
+import time
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+
+@pytest.fixture
+def playwright_mock():
+    """Patch sync_playwright so launches return fresh mock browsers."""
+    with patch("src.ingestion.browser_pool.sync_playwright") as sync_playwright:
+        playwright = sync_playwright.return_value.start.return_value
+        playwright.browsers = []
+
+        def launch(**kwargs):
+            browser = MagicMock()
+            browser.is_connected.return_value = True
+            browser.new_context.side_effect = lambda: MagicMock()
+            playwright.browsers.append(browser)
+            return browser
+
+        playwright.chromium.launch.side_effect = launch
+        yield playwright
+
+
+class TestBrowserPool:
+    """Test browser pool functionality."""
+
+    def test_reuses_warm_browser_with_fresh_contexts(self, playwright_mock):
+        """Test that jobs share a browser but each gets its own context."""
+        from src.ingestion.browser_pool import BrowserPool
+
+        pool = BrowserPool(size=1)
+        try:
+            contexts = [pool.run(lambda context: context) for _ in range(3)]
+        finally:
+            pool.shutdown()
+
+        assert playwright_mock.chromium.launch.call_count == 1
+        assert len({id(c) for c in contexts}) == 3
+        for context in contexts:
+            context.close.assert_called_once()
+        metrics = pool.metrics()
+        assert metrics["contexts_created"] == 3
+        assert metrics["jobs_completed"] == 3
+        assert metrics["active_contexts"] == 0
+
+    def test_recycles_browser_after_max_contexts(self, playwright_mock):
+        """Test that a browser is relaunched after serving N contexts."""
+        from src.ingestion.browser_pool import BrowserPool
+
+        pool = BrowserPool(size=1, max_contexts_per_browser=2)
+        try:
+            for _ in range(5):
+                pool.run(lambda context: None)
+        finally:
+            pool.shutdown()
+
+        assert playwright_mock.chromium.launch.call_count == 3
+        assert pool.metrics()["browsers_recycled"] == 2
+
+    def test_relaunches_disconnected_browser(self, playwright_mock):
+        """Test that a failed health check triggers a relaunch."""
+        from src.ingestion.browser_pool import BrowserPool
+
+        pool = BrowserPool(size=1)
+        try:
+            pool.run(lambda context: None)
+            playwright_mock.browsers[0].is_connected.return_value = False
+            pool.run(lambda context: None)
+        finally:
+            pool.shutdown()
+
+        assert playwright_mock.chromium.launch.call_count == 2
+        assert pool.metrics()["health_check_failures"] == 1
+
+    def test_propagates_job_errors(self, playwright_mock):
+        """Test that job exceptions reach the caller and the context is closed."""
+        from src.ingestion.browser_pool import BrowserPool
+
+        def failing_job(context):
+            raise ValueError("scrape failed")
+
+        pool = BrowserPool(size=1)
+        try:
+            with pytest.raises(ValueError, match="scrape failed"):
+                pool.run(failing_job)
+        finally:
+            pool.shutdown()
+
+        assert pool.metrics()["jobs_failed"] == 1
+        assert pool.metrics()["active_contexts"] == 0
+
+    def test_shutdown_closes_browsers_and_rejects_jobs(self, playwright_mock):
+        """Test that shutdown closes browsers and stops Playwright."""
+        from src.ingestion.browser_pool import BrowserPool, BrowserPoolClosedError
+
+        pool = BrowserPool(size=1)
+        pool.run(lambda context: None)
+        pool.shutdown()
+
+        playwright_mock.browsers[0].close.assert_called_once()
+        playwright_mock.stop.assert_called_once()
+        with pytest.raises(BrowserPoolClosedError):
+            pool.run(lambda context: None)
+
+    def test_timed_out_job_frees_its_slot(self, playwright_mock):
+        """Test that a job past its timeout fails in Playwright and the slot is reused."""
+        from concurrent.futures import TimeoutError
+
+        from src.ingestion.browser_pool import BrowserPool
+
+        def stuck_job(context):
+            # A page wait that only ends at the context's default timeout
+            [timeout_ms] = context.set_default_timeout.call_args.args
+            time.sleep(timeout_ms / 1000 + 0.05)
+            raise RuntimeError("Timeout exceeded")
+
+        pool = BrowserPool(size=1)
+        try:
+            with pytest.raises(TimeoutError):
+                pool.run(stuck_job, timeout=0.2)
+            assert pool.run(lambda context: "ok", timeout=5) == "ok"
+        finally:
+            pool.shutdown()
+
+        first_browser = playwright_mock.browsers[0]
+        first_browser.close.assert_called_once()
+        assert playwright_mock.chromium.launch.call_count == 2
+        metrics = pool.metrics()
+        assert metrics["jobs_timed_out"] == 1
+        assert metrics["browsers_recycled"] == 1
+        assert metrics["active_contexts"] == 0
@@ -0,0 +1,107 @@
+"""Unit tests for main-content extraction."""
+
+import lxml.html
+
+BODY = " ".join(["We help finance teams close the books in days, not weeks."] * 6)
+
+
+def _extract(html):
+    from src.ingestion.content_extractor import extract_main_content
+
+    return extract_main_content(lxml.html.document_fromstring(html))
+
+
+class TestExtractMainContent:
+    """Test boilerplate stripping and heading markers."""
+
+    def test_drops_site_chrome_and_consent_banner(self):
+        """Test that nav, page header/footer, aside and cookie banners are removed."""
+        content = _extract(
+            "<html><body>"
+            "<header><a href='/'>Logo</a><nav><a>Products</a><a>Pricing</a></nav></header>"
+            "<div id='onetrust-banner-sdk'>We use cookies. Accept all</div>"
+            f"<div><h1>Close faster</h1><p>{BODY}</p></div>"
+            "<aside>Related posts</aside>"
+            "<footer>Privacy Terms (c) 2024</footer>"
+            "</body></html>"
+        )
+
+        assert content.text.startswith("# Close faster\nWe help finance teams")
+        for boilerplate in ("Logo", "Pricing", "cookies", "Related", "Privacy"):
+            assert boilerplate not in content.text
+
+    def test_keeps_hero_header(self):
+        """Test that a page-level header with the headline is content, not chrome."""
+        content = _extract(
+            "<html><body>"
+            "<header class='hero'><h1>Close the books in days</h1>"
+            "<p>Finance automation for mid-size companies.</p></header>"
+            "<header role='banner'><h1>Acme</h1></header>"
+            f"<div><p>{BODY}</p></div>"
+            "</body></html>"
+        )
+
+        assert content.outline == ["# Close the books in days"]
+        assert content.text.startswith(
+            "# Close the books in days\nFinance automation for mid-size companies."
+        )
+
+    def test_keeps_trusted_by_section(self):
+        """Test that consent names must be whole id/class words ('trusted-by' is not 'truste')."""
+        content = _extract(
+            "<html><body>"
+            "<section class='trusted-by logos'><h2>Trusted by</h2><p>Globex and Initech</p></section>"
+            "<div class='truste_box_overlay'>Privacy choices</div>"
+            "<div id='CybotCookiebotDialog'>Allow selection</div>"
+            f"<div><p>{BODY}</p></div>"
+            "</body></html>"
+        )
+
+        assert content.text.startswith("## Trusted by\nGlobex and Initech\n")
+        assert "Privacy choices" not in content.text
+        assert "Allow selection" not in content.text
+
+    def test_heading_outline_and_blocks(self):
+        """Test that headings become markers and blocks become lines."""
+        content = _extract(
+            "<html><body><h1>Acme</h1><section><header><h2>Why Acme</h2></header>"
+            "<ul><li>Fast</li><li>Safe <b>and</b> simple</li></ul></section>"
+            "<h3>Customers</h3><p>Used by <!-- note -->200 teams.</p></body></html>"
+        )
+
+        assert content.outline == ["# Acme", "## Why Acme", "### Customers"]
+        assert content.text.split("\n") == [
+            "# Acme",
+            "## Why Acme",
+            "Fast",
+            "Safe and simple",
+            "### Customers",
+            "Used by 200 teams.",
+        ]
+
+    def test_prefers_main_element(self):
+        """Test that text outside <main> is dropped when <main> has enough content."""
+        content = _extract(
+            f"<html><body><div class='promo'>Newsletter signup</div>"
+            f"<main><p>{BODY}</p></main><div>Legal text</div></body></html>"
+        )
+
+        assert content.text == BODY
+
+    def test_falls_back_to_body_for_thin_main(self):
+        """Test that a near-empty <main> does not hide the page body."""
+        content = _extract(
+            f"<html><body><main><p>Hero</p></main><div><p>{BODY}</p></div></body></html>"
+        )
+
+        assert content.text == f"Hero\n{BODY}"
+
+    def test_skips_hidden_elements(self):
+        """Test that hidden and aria-hidden elements are skipped."""
+        content = _extract(
+            "<html><body><p>Visible</p><div hidden>Gone</div>"
+            "<div style='display: none'>Gone</div><span aria-hidden='true'>Gone</span>"
+            "</body></html>"
+        )
+
+        assert content.text == "Visible"
@@ -0,0 +1,164 @@
+"""Unit tests for the pre-flight content quality gate."""
+
+import pytest
+
+from src.ingestion.content_gate import (
+    ContentQualityError,
+    assess_text,
+    assess_upload,
+    gate_content,
+)
+from src.ingestion.text_stats import text_stats
+
+PROSE = (
+    "We help regional hospitals cut the time their nurses spend on paperwork. "
+    "Our scheduling tool plans shifts around the skills each ward needs, and it "
+    "learns from the changes managers make by hand. Since we launched in 2021, "
+    "forty hospitals have moved their rotas onto it and report that they spend "
+    "about a third less time on planning every month.\n"
+)
+
+
+def _reasons(text):
+    return [issue.reason for issue in assess_text(text, text_stats(text, True), "site")]
+
+
+def _page(text, url="https://example.com"):
+    return {"url": url, "text": text, "stats": text_stats(text, True).to_dict()}
+
+
+class TestAssessText:
+    """Test the text heuristics on single pages."""
+
+    def test_prose_passes(self):
+        """Test that ordinary company copy raises no issue."""
+        assert _reasons(PROSE * 3) == []
+
+    @pytest.mark.parametrize(
+        "text, reason",
+        [
+            ("example.com\nThis domain is for sale! Make an offer today.", "parked_domain"),
+            ("Acme Ltd\nOur new website is coming soon.", "placeholder_page"),
+            ("Loading...\nPlease enable JavaScript to use this site.", "javascript_required"),
+            ("", "no_text"),
+        ],
+    )
+    def test_short_notices_rejected(self, text, reason):
+        """Test that parking, placeholder and JavaScript notices are rejected."""
+        assert _reasons(text) == [reason]
+
+    def test_notice_phrase_in_long_page_ignored(self):
+        """Test that a phrase like 'coming soon' on a real page is not a placeholder."""
+        wards = " ".join(f"Ward {n} has {n + 3} nurses on the late shift." for n in range(40))
+        assert _reasons(f"{PROSE}{wards}\nNew pricing plans are coming soon.\n") == []
+
+    @pytest.mark.parametrize(
+        "notice",
+        ["Mobile app coming soon.", "You need to enable JavaScript to run this app."],
+    )
+    def test_notice_phrase_in_short_real_page_passes(self, notice):
+        """Test that a short homepage with an incidental notice still goes ahead."""
+        wards = " ".join(f"Ward {n} has {n + 3} nurses on the late shift." for n in range(20))
+        text = f"{PROSE}{wards}\n{notice}\n"
+
+        assert _reasons(text) == []
+        assert gate_content({"scraped_content": {"homepage": _page(text)}}) == []
+
+    def test_page_mostly_notice_rejected(self):
+        """Test that a page past TINY_TEXT_WORDS that is mostly a placeholder is rejected."""
+        notice = (
+            "Our brand new website is coming soon, with everything you need to know about "
+            "our products, our team and the places we work, so please check back shortly "
+            "and sign up below to hear the moment it goes live for all of our customers.\n"
+        )
+        assert _reasons(f"Acme Ltd\n{notice}Sign up for updates from the whole team.\n") == [
+            "placeholder_page"
+        ]
+
+    def test_cookie_wall_rejected(self):
+        """Test that a page that is mostly a consent banner is rejected."""
+        banner = (
+            "We use cookies to personalise content and ads and to analyse our traffic.\n"
+            "Accept all cookies or manage your cookie settings at any time.\n"
+        )
+        assert _reasons("Acme\n" + banner * 3) == ["cookie_wall"]
+        assert _reasons(PROSE * 3 + banner) == []
+
+    def test_repetitive_text_rejected(self):
+        """Test that text made of the same few words is rejected."""
+        assert _reasons("best cheap widgets " * 200) == ["repetitive_text"]
+
+    def test_non_english_text_flagged(self):
+        """Test that text without common English words is only flagged."""
+        text = " ".join(f"Produktlinie{n} Qualität Lösung" for n in range(60))
+        issues = assess_text(text, text_stats(text), "deck.docx")
+        assert [(issue.reason, issue.reject) for issue in issues] == [
+            ("unrecognised_language", False)
+        ]
+
+
+class TestAssessUpload:
+    """Test checks on parsed uploads."""
+
+    def _pdf(self, page_texts):
+        from src.ingestion.file_parser import ContentBuilder
+
+        builder = ContentBuilder("pdf", "page")
+        for number, text in enumerate(page_texts, 1):
+            builder.add(text, number=number)
+        return builder.build("deck.pdf")
+
+    def test_image_only_pdf_rejected(self):
+        """Test that a PDF whose pages have no text layer is rejected."""
+        issues = assess_upload(self._pdf(["", "12", "", "", "", "", "", "", "", ""]))
+        assert [issue.reason for issue in issues] == ["image_only"]
+        assert "10 of 10 pages" in issues[0].detail
+
+    def test_pdf_with_text_passes(self):
+        """Test that a PDF with a few blank pages is judged on its text."""
+        assert assess_upload(self._pdf([PROSE, "", PROSE, PROSE])) == []
+
+
+class TestGateContent:
+    """Test the corpus-level decision."""
+
+    def test_all_sources_rejected_raises(self):
+        """Test that content with nothing usable raises with every reason."""
+        content = {
+            "scraped_content": {"homepage": _page("Buy this domain.\nRelated searches")},
+            "uploaded_content": [
+                {
+                    "filename": "scan.pdf",
+                    "text": "",
+                    "quality_issues": [
+                        {
+                            "source": "scan.pdf",
+                            "reason": "image_only",
+                            "detail": "has no extractable text on 3 of 3 pages",
+                            "reject": True,
+                        }
+                    ],
+                }
+            ],
+        }
+        with pytest.raises(ContentQualityError) as e:
+            gate_content(content)
+        assert [issue.reason for issue in e.value.issues] == ["parked_domain", "image_only"]
+        assert "https://example.com looks like a parked or for-sale domain" in str(e.value)
+
+    def test_one_usable_page_lets_site_through(self):
+        """Test that a rejected page is only flagged when another page passes."""
+        content = {
+            "scraped_content": {
+                "homepage": _page("Please enable JavaScript to continue."),
+                "about_page": _page(PROSE * 3, "https://example.com/about"),
+            },
+            "uploaded_content": [],
+        }
+        issues = gate_content(content)
+        assert [issue.reason for issue in issues] == ["javascript_required"]
+
+    def test_pages_without_stats_measured(self):
+        """Test that pages from older cache entries are measured on the fly."""
+        content = {"scraped_content": {"homepage": {"url": "x", "text": PROSE * 3}}}
+        assert gate_content(content) == []
@@ -0,0 +1,164 @@
+"""Unit tests for the bounded site crawler."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+from src.models.scraped_content import PageContent
+
+
+def _page(url, words=100):
+    return PageContent(text=" ".join(["word"] * words), url=url, word_count=words)
+
+
+def _sitemap_response(body, status=200):
+    response = MagicMock()
+    response.status_code = status
+    response.content = body.encode("utf-8")
+    return response
+
+
+class TestBuildFrontier:
+    """Test ranking of crawl candidates."""
+
+    def test_ranks_by_path_keywords(self):
+        """Test that customer and product pages outrank others and irrelevant links are dropped."""
+        from src.ingestion.crawler import build_frontier
+
+        links = [
+            "/blog/some-post",
+            "/products",
+            "https://other.com/customers",
+            "/customers#top",
+            "/careers",
+            "/brochure.pdf",
+            "mailto:hello@example.com",
+        ]
+
+        assert build_frontier("https://example.com/", links) == [
+            "https://example.com/customers",
+            "https://example.com/products",
+        ]
+
+    def test_sitemap_hints(self):
+        """Test that sitemap entries add candidates and boost linked pages."""
+        from src.ingestion.crawler import build_frontier
+
+        frontier = build_frontier(
+            "https://www.example.com/",
+            ["/products", "/solutions"],
+            sitemap_urls=["https://example.com/solutions/", "https://example.com/case-studies"],
+        )
+
+        assert frontier == [
+            "https://example.com/case-studies",
+            "https://www.example.com/solutions",
+            "https://www.example.com/products",
+        ]
+
+    def test_excludes_scraped_pages(self):
+        """Test that the homepage and About page are not crawled again."""
+        from src.ingestion.crawler import build_frontier
+
+        frontier = build_frontier(
+            "https://example.com/",
+            ["/about/", "/about/team", "/"],
+            exclude=["https://example.com/about"],
+        )
+
+        assert frontier == ["https://example.com/about/team"]
+
+
+class TestFetchSitemapUrls:
+    """Test sitemap.xml reading (network mocked)."""
+
+    @patch("src.ingestion.crawler.get_session")
+    def test_follows_sitemap_index(self, get_session):
+        """Test that a sitemap index is followed to its page sitemaps."""
+        from src.ingestion.crawler import fetch_sitemap_urls
+
+        ns = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+        get_session.return_value.get.side_effect = [
+            _sitemap_response(
+                f"<sitemapindex {ns}><sitemap><loc>https://example.com/pages.xml</loc>"
+                "</sitemap></sitemapindex>"
+            ),
+            _sitemap_response(
+                f"<urlset {ns}><url><loc> https://example.com/products </loc></url></urlset>"
+            ),
+        ]
+
+        assert fetch_sitemap_urls("https://example.com/") == ["https://example.com/products"]
+
+    @patch("src.ingestion.crawler.get_session")
+    def test_missing_sitemap(self, get_session):
+        """Test that a missing sitemap yields no URLs."""
+        from src.ingestion.crawler import fetch_sitemap_urls
+
+        get_session.return_value.get.return_value = _sitemap_response("Not found", status=404)
+
+        assert fetch_sitemap_urls("https://example.com/") == []
+
+
+class TestCrawlSite:
+    """Test budgeted parallel crawling."""
+
+    @patch("src.ingestion.crawler.fetch_sitemap_urls", return_value=[])
+    def test_respects_page_and_word_budgets(self, _sitemap):
+        """Test that only the top pages are fetched and pages over the word budget are dropped."""
+        from src.ingestion.crawler import CrawlBudget, crawl_site
+
+        homepage = _page("https://example.com/")
+        homepage.links = [
+            "https://example.com/customers",
+            "https://example.com/products",
+            "https://example.com/solutions",
+        ]
+        sizes = {"customers": 300, "products": 500, "solutions": 50}
+        fetched = []
+
+        def fetch(url):
+            fetched.append(url)
+            return _page(url, sizes[url.rsplit("/", 1)[1]])
+
+        pages = crawl_site(homepage, fetch, CrawlBudget(max_pages=2, max_words=600))
+
+        assert sorted(fetched) == ["https://example.com/customers", "https://example.com/products"]
+        assert [page.url for page in pages] == ["https://example.com/customers"]
+
+    @patch("src.ingestion.crawler.fetch_sitemap_urls", return_value=[])
+    def test_stops_at_time_budget(self, _sitemap):
+        """Test that slow pages are dropped once the time budget is spent."""
+        from src.ingestion.crawler import CrawlBudget, crawl_site
+
+        homepage = _page("https://example.com/")
+        homepage.links = ["https://example.com/customers", "https://example.com/products"]
+
+        def fetch(url):
+            if url.endswith("products"):
+                time.sleep(0.5)
+            return _page(url)
+
+        started = time.monotonic()
+        pages = crawl_site(homepage, fetch, CrawlBudget(time_budget_seconds=0.1))
+
+        assert time.monotonic() - started < 0.4
+        assert [page.url for page in pages] == ["https://example.com/customers"]
+
+    @patch("src.ingestion.crawler.fetch_sitemap_urls", return_value=[])
+    def test_skips_disallowed_and_failed_pages(self, _sitemap):
+        """Test that robots-disallowed URLs are not fetched and fetch errors are tolerated."""
+        from src.ingestion.crawler import CrawlBudget, crawl_site
+
+        homepage = _page("https://example.com/")
+        homepage.links = ["https://example.com/customers", "https://example.com/products"]
+        fetch = MagicMock(side_effect=RuntimeError("boom"))
+
+        pages = crawl_site(
+            homepage,
+            fetch,
+            CrawlBudget(),
+            is_allowed=lambda url: not url.endswith("products"),
+        )
+
+        assert pages == []
+        fetch.assert_called_once_with("https://example.com/customers")
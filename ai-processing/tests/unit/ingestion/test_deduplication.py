@@ -0,0 +1,111 @@
+"""Unit tests for near-duplicate detection across uploads and scraped pages."""
+
+import random
+
+
+def _paragraphs(count, seed, words_per_paragraph=14):
+    rng = random.Random(seed)
+    vocabulary = [f"term{i}" for i in range(2000)]
+    return [
+        " ".join(rng.choice(vocabulary) for _ in range(words_per_paragraph)) for _ in range(count)
+    ]
+
+
+def _content(homepage, *uploads):
+    return {
+        "scraped_content": {"homepage": {"text": homepage, "url": "https://example.com"}},
+        "uploaded_content": [{"filename": filename, "text": text} for filename, text in uploads],
+    }
+
+
+class TestFingerprints:
+    """Test the shingle, MinHash and SimHash building blocks."""
+
+    def test_minhash_estimates_jaccard_similarity(self):
+        """Test that signatures agree in proportion to shared shingles."""
+        from src.ingestion.deduplication import (
+            estimated_jaccard,
+            minhash,
+            shingle_hashes,
+            tokenize,
+        )
+
+        text = " ".join(_paragraphs(40, seed=1))
+        same = minhash(shingle_hashes(tokenize(text.upper()).words))
+        other = minhash(shingle_hashes(tokenize(" ".join(_paragraphs(40, seed=2))).words))
+        signature = minhash(shingle_hashes(tokenize(text).words))
+
+        assert estimated_jaccard(signature, same) == 1.0
+        assert estimated_jaccard(signature, other) < 0.1
+        assert minhash(shingle_hashes(tokenize("").words)) is None
+
+    def test_paragraph_simhashes_ignore_punctuation_and_skip_short_lines(self):
+        """Test that reformatted paragraphs match and short lines are not fingerprinted."""
+        from src.ingestion.deduplication import paragraph_simhashes, shingle_hashes, tokenize
+
+        paragraph = "Our platform helps finance teams close the books in days, not weeks."
+        text = f"Overview\n{paragraph}\n{paragraph.lower().replace(',', '')}\n"
+        tokens = tokenize(text)
+
+        indexes, fingerprints = paragraph_simhashes(tokens, shingle_hashes(tokens.words))
+
+        assert list(indexes) == [1, 2]
+        assert fingerprints[0] == fingerprints[1]
+
+
+class TestCollapseDuplicates:
+    """Test collapsing duplicate uploads before the agents read them."""
+
+    def test_same_deck_in_two_formats_is_collapsed(self):
+        """Test that a re-wrapped copy of an upload is dropped but kept as an original."""
+        from src.ingestion.deduplication import collapse_duplicates
+
+        deck = "\n".join(_paragraphs(60, seed=3))
+        rewrapped = deck.replace("\n", " ").replace(" term1", "\nterm1")
+        content = _content(
+            "\n".join(_paragraphs(10, seed=4)), ("deck.pptx", deck), ("deck.pdf", rewrapped)
+        )
+
+        result = collapse_duplicates(content)
+
+        assert [upload["filename"] for upload in result["uploaded_content"]] == ["deck.pptx"]
+        assert [upload["filename"] for upload in result["original_uploaded_content"]] == [
+            "deck.pptx",
+            "deck.pdf",
+        ]
+        assert result["duplicates"]["documents"] == [
+            {"filename": "deck.pdf", "duplicate_of": "deck.pptx", "similarity": 1.0}
+        ]
+        assert len(content["uploaded_content"]) == 2
+
+    def test_paragraphs_repeating_the_homepage_are_removed(self):
+        """Test that only the paragraphs already on the website are dropped from an upload."""
+        from src.ingestion.deduplication import collapse_duplicates
+
+        homepage = _paragraphs(10, seed=5)
+        new = _paragraphs(3, seed=6)
+        one_pager = "Company one-pager\n" + "\n".join(homepage[:4] + new) + "\n"
+        content = _content("\n".join(homepage), ("one-pager.docx", one_pager))
+
+        result = collapse_duplicates(content)
+
+        assert (
+            result["uploaded_content"][0]["text"] == "Company one-pager\n" + "\n".join(new) + "\n"
+        )
+        assert result["original_uploaded_content"][0]["text"] == one_pager
+        assert result["duplicates"]["paragraphs"] == [
+            {"filename": "one-pager.docx", "paragraphs_removed": 4}
+        ]
+        assert result["scraped_content"] is content["scraped_content"]
+
+    def test_distinct_content_is_returned_unchanged(self):
+        """Test that nothing is added when there are no duplicates."""
+        from src.ingestion.deduplication import collapse_duplicates
+
+        content = _content(
+            "\n".join(_paragraphs(10, seed=7)),
+            ("a.pdf", "\n".join(_paragraphs(10, seed=8))),
+            ("b.pdf", "\n".join(_paragraphs(10, seed=9))),
+        )
+
+        assert collapse_duplicates(content) is content
@@ -0,0 +1,88 @@
+"""Unit tests for the streaming DOCX extractor."""
+
+import io
+import zipfile
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+MC_NS = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+
+
+def _docx_from_body(body, styles=None):
+    """Build a minimal DOCX archive around a w:body fragment."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr(
+            "word/document.xml",
+            f'<w:document xmlns:w="{W_NS}" xmlns:mc="{MC_NS}"><w:body>{body}</w:body></w:document>',
+        )
+        if styles:
+            archive.writestr("word/styles.xml", f'<w:styles xmlns:w="{W_NS}">{styles}</w:styles>')
+    return buffer.getvalue()
+
+
+def _p(text, style=None):
+    properties = f'<w:pPr><w:pStyle w:val="{style}"/></w:pPr>' if style else ""
+    return f"<w:p>{properties}<w:r><w:t>{text}</w:t></w:r></w:p>"
+
+
+class TestIterDocxBlocks:
+    """Test streaming extraction of paragraphs, tables and headings."""
+
+    def test_paragraphs_tables_and_headings_in_order(self):
+        """Test that blocks keep document order, with tables as ' | ' rows."""
+        from docx import Document
+
+        from src.ingestion.docx_extractor import DocxBlock, iter_docx_blocks
+
+        document = Document()
+        document.add_heading("Pricing", 1)
+        document.add_paragraph("Plans for every team.")
+        table = document.add_table(rows=2, cols=2)
+        for row, cells in enumerate([("Plan", "Price"), ("Pro", "$10")]):
+            for column, text in enumerate(cells):
+                table.cell(row, column).text = text
+        document.add_heading("Support", 2)
+        buffer = io.BytesIO()
+        document.save(buffer)
+
+        assert list(iter_docx_blocks(buffer.getvalue())) == [
+            DocxBlock("Pricing", heading_level=1),
+            DocxBlock("Plans for every team."),
+            DocxBlock("Plan | Price", is_table_row=True),
+            DocxBlock("Pro | $10", is_table_row=True),
+            DocxBlock("Support", heading_level=2),
+        ]
+
+    def test_localised_heading_styles_use_outline_level(self):
+        """Test that styles with an outline level, or based on one, are headings."""
+        from src.ingestion.docx_extractor import iter_docx_blocks
+
+        styles = (
+            '<w:style w:type="paragraph" w:styleId="Titre1"><w:name w:val="Titre 1"/>'
+            '<w:pPr><w:outlineLvl w:val="0"/></w:pPr></w:style>'
+            '<w:style w:type="paragraph" w:styleId="Perso"><w:name w:val="Perso"/>'
+            '<w:basedOn w:val="Titre1"/></w:style>'
+        )
+        data = _docx_from_body(
+            _p("Histoire", "Titre1") + _p("Vision", "Perso") + _p("Texte"), styles
+        )
+        assert [block.heading_level for block in iter_docx_blocks(data)] == [1, 1, None]
+
+    def test_text_box_read_once_and_nested_table_flattened(self):
+        """Test that legacy text box copies are skipped and nested tables join their cell."""
+        from src.ingestion.docx_extractor import iter_docx_blocks
+
+        text_box = (
+            "<w:p><w:r><mc:AlternateContent>"
+            f"<mc:Choice><w:txbxContent>{_p('Callout')}</w:txbxContent></mc:Choice>"
+            f"<mc:Fallback><w:txbxContent>{_p('Callout')}</w:txbxContent></mc:Fallback>"
+            "</mc:AlternateContent></w:r></w:p>"
+        )
+        nested = f"<w:tbl><w:tr><w:tc>{_p('inner')}</w:tc></w:tr></w:tbl>"
+        table = (
+            f"<w:tbl><w:tr><w:tc>{_p('outer')}{nested}</w:tc><w:tc>{_p('b')}</w:tc></w:tr></w:tbl>"
+        )
+
+        texts = [block.text for block in iter_docx_blocks(_docx_from_body(text_box + table))]
+
+        assert texts == ["Callout", "outer inner | b"]
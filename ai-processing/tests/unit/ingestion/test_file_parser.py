@@ -100,3 +100,181 @@ class TestFileParser:
         with pytest.raises(FileParsingError):
             parse_file(file_content, filename)
 
+
+def _pdf_bytes(page_count):
+    import fitz
+
+    document = fitz.open()
+    for number in range(1, page_count + 1):
+        document.new_page().insert_text((72, 72), f"Page {number} text")
+    data = document.tobytes()
+    document.close()
+    return data
+
+
+class TestPdfPageRanges:
+    """Test page-range PDF extraction used for parallel parsing."""
+
+    def test_page_ranges_cover_document(self):
+        """Test that ranges are contiguous and cover every page once."""
+        from src.ingestion.file_parser import index_ranges
+
+        assert index_ranges(10, 4) == [(0, 3), (3, 6), (6, 9), (9, 10)]
+        assert index_ranges(2, 4) == [(0, 1), (1, 2)]
+        assert index_ranges(0, 4) == []
+
+    def test_merged_ranges_match_serial_parse(self, tmp_path):
+        """Test that ranges extracted separately merge into the serial result."""
+        from src.ingestion.file_parser import (
+            index_ranges,
+            parse_pdf,
+            parse_pdf_pages,
+            pdf_page_count,
+        )
+        from src.models.parsed_content import ParsedContent
+
+        path = tmp_path / "report.pdf"
+        path.write_bytes(_pdf_bytes(7))
+
+        parts = [
+            parse_pdf_pages(str(path), start, stop)
+            for start, stop in index_ranges(pdf_page_count(str(path)), 3)
+        ]
+        merged = ParsedContent.concatenate("report.pdf", "pdf", parts)
+
+        assert [page.page_number for page in merged.pages] == list(range(1, 8))
+        assert merged == parse_pdf(str(path), "report.pdf")
+
+
+class TestCompactParsedContent:
+    """Test the single-buffer, offset-based ParsedContent representation."""
+
+    def test_page_views_slice_the_shared_text(self):
+        """Test that pages are built on demand from offsets into the document text."""
+        from src.ingestion.file_parser import parse_pdf
+
+        parsed = parse_pdf(_pdf_bytes(3), "deck.pdf")
+
+        assert parsed.segment_count == 3
+        assert parsed.sections is None
+        for page, (start, end, number) in zip(parsed.pages, parsed.boundaries()):
+            assert page.text == parsed.text[start:end]
+            assert page.page_number == number
+            assert page.text.strip() == f"Page {number} text"
+            assert page.word_count == 3
+        assert parsed.word_count == 9
+
+    def test_page_and_document_stats(self):
+        """Test that every page carries its statistics and the document sums them."""
+        from src.ingestion.file_parser import parse_pdf
+
+        parsed = parse_pdf(_pdf_bytes(3), "deck.pdf")
+
+        pages = [parsed.segment_stats(index) for index in range(parsed.segment_count)]
+        assert [(page.words, page.sentences, page.paragraphs) for page in pages] == [(3, 1, 1)] * 3
+        assert parsed.stats.words == parsed.word_count == 9
+        assert parsed.stats.characters == sum(page.characters for page in pages)
+        assert parsed.to_dict()["stats"]["words"] == 9
+
+    def test_round_trips_through_json(self):
+        """Test that offsets and titles survive model_dump/model_validate, as in the parse cache."""
+        import json
+
+        from src.ingestion.file_parser import ContentBuilder
+        from src.models.parsed_content import ParsedContent
+
+        builder = ContentBuilder("docx", "section")
+        builder.add("Pricing", number=1, level=1, title="Pricing")
+        builder.add("Plans for every team.", number=2)
+        parsed = builder.build("terms.docx")
+
+        restored = ParsedContent.model_validate(json.loads(json.dumps(parsed.model_dump())))
+
+        assert restored == parsed
+        assert [(s.title, s.level, s.text) for s in restored.sections] == [
+            ("Pricing", 1, "Pricing"),
+            (None, None, "Plans for every team."),
+        ]
+
+    def test_concatenate_shifts_offsets_and_skips_empty_parts(self):
+        """Test that merged parts keep section order, titles and text offsets."""
+        from src.ingestion.file_parser import ContentBuilder
+        from src.models.parsed_content import ParsedContent
+
+        parts = []
+        for slides in ([(1, "Intro")], [], [(3, "Pricing"), (4, "Thanks")]):
+            builder = ContentBuilder("pptx", "section")
+            for number, text in slides:
+                builder.add(text, number=number, page_number=number, title=f"Slide {number}")
+            parts.append(builder.build(""))
+
+        merged = ParsedContent.concatenate("deck.pptx", "pptx", parts)
+
+        assert merged.text == "Intro\n\nPricing\n\nThanks"
+        assert [(s.title, s.text, s.order) for s in merged.sections] == [
+            ("Slide 1", "Intro", 1),
+            ("Slide 3", "Pricing", 3),
+            ("Slide 4", "Thanks", 4),
+        ]
+
+
+class TestParseBudget:
+    """Test sampling and early-stop parsing of oversized documents."""
+
+    def test_sample_indexes_take_head_strata_and_tail(self):
+        """Test that samples are the first pages, one per middle stratum, and the last pages."""
+        from src.ingestion.file_parser import ParseBudget, sample_indexes
+
+        budget = ParseBudget(sample_threshold=10, head=2, middle=3, tail=2)
+
+        assert sample_indexes(10, budget) == list(range(10))
+        assert sample_indexes(100, budget) == [0, 1, 18, 50, 82, 98, 99]
+
+    def test_large_pdf_is_sampled_and_marked(self):
+        """Test that a PDF above the threshold is sampled and says so."""
+        from src.ingestion.file_parser import ParseBudget, parse_file
+
+        budget = ParseBudget(sample_threshold=10, head=2, middle=3, tail=2)
+        parsed = parse_file(_pdf_bytes(30), "annual-report.pdf", budget)
+
+        assert [page.page_number for page in parsed.pages] == [1, 2, 7, 16, 24, 29, 30]
+        assert parsed.sampling == (
+            "Sampled 7 of 30 pages: the first 2, 3 spread across the middle and the last 2"
+        )
+        assert parsed.to_dict()["sampling"] == parsed.sampling
+
+    def test_stop_mode_reads_until_word_budget(self):
+        """Test that stop mode ends the parse once the word budget is reached."""
+        from src.ingestion.file_parser import ParseBudget, parse_file
+
+        parsed = parse_file(_pdf_bytes(30), "report.pdf", ParseBudget(mode="stop", max_words=7))
+
+        assert parsed.segment_count == 3
+        assert parsed.sampling == "Stopped after 3 of 30 pages at the 7-word budget"
+
+    def test_small_documents_are_not_marked(self):
+        """Test that documents within the budget are parsed in full without a note."""
+        from src.ingestion.file_parser import ParseBudget, parse_file
+
+        parsed = parse_file(_pdf_bytes(5), "brief.pdf", ParseBudget())
+
+        assert parsed.segment_count == 5
+        assert parsed.sampling is None
+        assert "sampling" not in parsed.to_dict()
+
+    def test_docx_stops_at_word_budget(self):
+        """Test that DOCX, which has no pages to sample, stops at the word budget."""
+        from docx import Document
+
+        from src.ingestion.file_parser import ParseBudget, parse_file
+
+        document = Document()
+        for number in range(10):
+            document.add_paragraph(f"Clause {number} applies")
+        buffer = BytesIO()
+        document.save(buffer)
+
+        parsed = parse_file(buffer.getvalue(), "terms.docx", ParseBudget(max_words=7))
+
+        assert parsed.segment_count == 3
+        assert parsed.sampling == "Stopped after 3 sections at the 7-word budget"
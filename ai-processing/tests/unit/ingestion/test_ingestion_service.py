@@ -0,0 +1,526 @@
+"""Unit tests for the ingestion service."""
+
+import io
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+def _docx_bytes(text):
+    from docx import Document
+
+    buffer = io.BytesIO()
+    document = Document()
+    document.add_paragraph(text)
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def _pdf_bytes(page_count):
+    import fitz
+
+    document = fitz.open()
+    for number in range(1, page_count + 1):
+        document.new_page().insert_text((72, 72), f"Page {number} text")
+    data = document.tobytes()
+    document.close()
+    return data
+
+
+@pytest.fixture
+def bucket(tmp_path):
+    """Local stand-in for a storage bucket named 'uploads'."""
+    (tmp_path / "uploads").mkdir()
+    return tmp_path / "uploads"
+
+
+@pytest.fixture
+def service(tmp_path):
+    from src.ingestion.ingestion_service import IngestionService
+    from src.ingestion.storage_backend import LocalStorageBackend
+
+    service = IngestionService(
+        browser_pool=MagicMock(),
+        parse_workers=2,
+        storage_backend=LocalStorageBackend(str(tmp_path)),
+    )
+    yield service
+    service.close()
+
+
+class TestServiceLifecycle:
+    """Test releasing the service's long-lived resources."""
+
+    def test_context_manager_closes_service(self, tmp_path):
+        """Test that leaving the with block shuts down the browser pool and executors."""
+        from src.ingestion.ingestion_service import IngestionService
+        from src.ingestion.storage_backend import LocalStorageBackend
+
+        browser_pool = MagicMock()
+        with IngestionService(
+            browser_pool=browser_pool, storage_backend=LocalStorageBackend(str(tmp_path))
+        ) as service:
+            pass
+
+        browser_pool.shutdown.assert_called_once()
+        assert service._io_executor._shutdown
+
+
+class TestConcurrentIngestion:
+    """Test that sources are ingested concurrently and in order."""
+
+    def test_downloads_run_concurrently_and_keep_order(self, service, bucket):
+        """Test that downloads overlap and parsed files keep their input order."""
+        for name in "abc":
+            (bucket / f"{name}.docx").write_bytes(_docx_bytes(f"Text of {name}"))
+        started = threading.Barrier(3, timeout=5)
+        download_to = service.storage_backend.download_to
+
+        def download(*args):
+            # Only proceeds once all three downloads are in flight
+            started.wait()
+            download_to(*args)
+
+        service.storage_backend.download_to = download
+
+        result = service.ingest_content(
+            file_paths=[{"path": f"{name}.docx"} for name in "abc"], bucket_name="uploads"
+        )
+
+        assert [item["filename"] for item in result["uploaded_content"]] == [
+            "a.docx",
+            "b.docx",
+            "c.docx",
+        ]
+        assert result["uploaded_content"][1]["text"] == "Text of b"
+
+    @patch("src.ingestion.ingestion_service.scrape_website")
+    def test_scrape_overlaps_downloads(self, scrape_website, service, bucket):
+        """Test that the scrape and downloads run at the same time."""
+        (bucket / "deck.docx").write_bytes(_docx_bytes("Deck"))
+        scrape_started = threading.Event()
+        download_to = service.storage_backend.download_to
+
+        def scrape(url, **kwargs):
+            scrape_started.set()
+            time.sleep(0.2)
+            scraped = MagicMock()
+            scraped.to_dict.return_value = {"homepage": {"text": "Home", "url": url}}
+            return scraped
+
+        def download(*args):
+            assert scrape_started.wait(timeout=5)
+            download_to(*args)
+
+        scrape_website.side_effect = scrape
+        service.storage_backend.download_to = download
+
+        result = service.ingest_content(
+            url="https://example.com/", file_paths=[{"path": "deck.docx", "bucket": "uploads"}]
+        )
+
+        assert result["scraped_content"]["homepage"]["text"] == "Home"
+        assert result["uploaded_content"][0]["text"] == "Deck"
+
+    def test_unsupported_format_rejected_before_download(self, service):
+        """Test that an unsupported file raises without being downloaded."""
+        from src.ingestion.file_parser import UnsupportedFileFormatError
+
+        service.storage_backend.download_to = MagicMock()
+
+        with pytest.raises(UnsupportedFileFormatError):
+            service.ingest_content(file_paths=[{"path": "notes.txt", "bucket": "uploads"}])
+        service.storage_backend.download_to.assert_not_called()
+
+    def test_parse_errors_keep_their_type(self, service, bucket):
+        """Test that a parse failure in the process pool surfaces as FileParsingError."""
+        from src.ingestion.file_parser import FileParsingError
+
+        (bucket / "broken.docx").write_bytes(b"not a docx")
+
+        with pytest.raises(FileParsingError):
+            service.ingest_content(file_paths=[{"path": "broken.docx", "bucket": "uploads"}])
+
+    @patch("src.ingestion.ingestion_service.scrape_website")
+    def test_scrape_error_raised_first(self, scrape_website, service, bucket):
+        """Test that a scraping error wins over later file errors, as when sequential."""
+        from src.ingestion.scraper import ScrapingError
+
+        (bucket / "broken.docx").write_bytes(b"not a docx")
+        scrape_website.side_effect = ScrapingError("blocked")
+
+        with pytest.raises(ScrapingError):
+            service.ingest_content(
+                url="https://example.com/",
+                file_paths=[{"path": "broken.docx", "bucket": "uploads"}],
+            )
+
+
+class TestStreamedDownloads:
+    """Test spooled downloads and parsing by path."""
+
+    def test_large_file_parsed_from_spooled_path(self, service, bucket, monkeypatch):
+        """Test that a file above the memory limit is spooled to disk and removed after."""
+        from src.ingestion import storage_backend
+
+        monkeypatch.setattr(storage_backend, "SPOOL_MAX_MEMORY_BYTES", 1024)
+        (bucket / "big.docx").write_bytes(
+            _docx_bytes("Large deck " + " ".join(f"slide {n}" for n in range(500)))
+        )
+        sources = []
+        parse = service.parse_in_process_pool
+
+        def record_source(source, filename):
+            sources.append(source)
+            return parse(source, filename)
+
+        service.parse_in_process_pool = record_source
+        result = service.ingest_content(file_paths=[{"path": "big.docx", "bucket": "uploads"}])
+
+        assert result["uploaded_content"][0]["text"].startswith("Large deck")
+        assert isinstance(sources[0], str)
+        assert not (bucket.parent / sources[0]).exists()
+
+    def test_small_file_stays_in_memory(self):
+        """Test that a small download never touches disk."""
+        from src.ingestion.storage_backend import SpooledFile
+
+        with SpooledFile(max_memory_bytes=10) as spool:
+            spool.write(b"abc")
+            assert spool.path is None
+            assert spool.source == b"abc"
+
+    def test_local_backend_refuses_escaping_paths(self, tmp_path):
+        """Test that object paths cannot leave the bucket directory."""
+        from src.ingestion.storage_backend import LocalStorageBackend
+
+        with pytest.raises(ValueError):
+            LocalStorageBackend(str(tmp_path)).resolve("uploads", "../secrets.txt")
+
+
+@pytest.fixture
+def range_server(tmp_path):
+    """Range-capable HTTP stand-in for storage, serving tmp_path."""
+    from benchmarks.range_server import RangeServer
+
+    with RangeServer(str(tmp_path)) as server:
+        yield server
+
+
+class TestSlicedDownloads:
+    """Test parallel byte-range downloads of large files."""
+
+    def test_slice_ranges_cover_object(self):
+        """Test that slices are contiguous, inclusive and cover every byte once."""
+        from src.ingestion.storage_backend import slice_ranges
+
+        assert slice_ranges(10, 3) == [(0, 3), (4, 7), (8, 9)]
+        assert slice_ranges(2, 8) == [(0, 0), (1, 1)]
+        assert slice_ranges(100, 1) == [(0, 99)]
+        assert slice_ranges(0, 4) == []
+
+    def test_local_backend_reads_ranges(self, tmp_path, bucket):
+        """Test that the local backend honours inclusive byte ranges."""
+        from src.ingestion.storage_backend import LocalStorageBackend
+
+        (bucket / "data.bin").write_bytes(bytes(range(256)))
+        destination = io.BytesIO()
+        LocalStorageBackend(str(tmp_path)).download_to("uploads", "data.bin", destination, 10, 19)
+
+        assert destination.getvalue() == bytes(range(10, 20))
+
+    def test_sliced_download_reassembles_file(self, range_server, bucket):
+        """Test that slices fetched in parallel reassemble the original bytes on disk."""
+        import os
+        from pathlib import Path
+
+        from src.ingestion.storage_backend import HTTPStorageBackend
+
+        data = os.urandom(1024 * 1024 + 7)
+        (bucket / "deck.pdf").write_bytes(data)
+        backend = HTTPStorageBackend(range_server.url)
+        info = backend.stat("uploads", "deck.pdf")
+
+        with backend.download_sliced("uploads", "deck.pdf", info, 4) as spool:
+            path = Path(spool.path)
+            assert path.read_bytes() == data
+        assert info.size == len(data)
+        assert range_server.range_requests == 4
+        assert not path.exists()
+
+    def test_changed_object_fails_instead_of_mixing_versions(self, range_server, bucket):
+        """Test that a slice of a changed object raises rather than returning mixed bytes."""
+        import requests
+
+        from src.ingestion.storage_backend import HTTPStorageBackend, ObjectInfo
+
+        (bucket / "deck.pdf").write_bytes(b"x" * 4096)
+        backend = HTTPStorageBackend(range_server.url)
+
+        with pytest.raises(requests.HTTPError):
+            backend.download_sliced("uploads", "deck.pdf", ObjectInfo(4096, '"old"'), 2)
+
+    def test_service_slices_files_above_threshold(self, tmp_path, bucket):
+        """Test that only files above the threshold are downloaded in slices."""
+        from src.ingestion.ingestion_service import IngestionService
+        from src.ingestion.storage_backend import LocalStorageBackend
+
+        (bucket / "big.docx").write_bytes(
+            _docx_bytes("Large deck " + " ".join(f"slide {n}" for n in range(500)))
+        )
+        (bucket / "small.txt").write_bytes(b"small")
+        service = IngestionService(
+            browser_pool=MagicMock(),
+            storage_backend=LocalStorageBackend(str(tmp_path)),
+            sliced_download_threshold_bytes=1024,
+            download_slices=4,
+        )
+        with patch.object(
+            service.storage_backend,
+            "download_sliced",
+            wraps=service.storage_backend.download_sliced,
+        ) as download_sliced:
+            with service.download_file_from_storage("uploads", "small.txt") as spool:
+                assert spool.source == b"small"
+            download_sliced.assert_not_called()
+
+            result = service.ingest_content(file_paths=[{"path": "big.docx", "bucket": "uploads"}])
+        service.close()
+
+        assert download_sliced.call_args.args[3] == 4
+        assert result["uploaded_content"][0]["text"].startswith("Large deck")
+
+    def test_empty_file_not_sliced_at_zero_threshold(self, tmp_path, bucket):
+        """Test that an empty object is downloaded whole even when every size is sliced."""
+        from src.ingestion.ingestion_service import IngestionService
+        from src.ingestion.storage_backend import LocalStorageBackend
+
+        (bucket / "empty.txt").write_bytes(b"")
+        with IngestionService(
+            browser_pool=MagicMock(),
+            storage_backend=LocalStorageBackend(str(tmp_path)),
+            sliced_download_threshold_bytes=0,
+            download_slices=4,
+        ) as service:
+            with service.download_file_from_storage("uploads", "empty.txt") as downloaded:
+                assert downloaded.source == b""
+
+    def test_explicit_zero_settings_kept(self, tmp_path):
+        """Test that 0 overrides the env defaults instead of falling back to them."""
+        from src.ingestion.ingestion_service import IngestionService
+        from src.ingestion.storage_backend import LocalStorageBackend
+
+        service = IngestionService(
+            browser_pool=MagicMock(),
+            storage_backend=LocalStorageBackend(str(tmp_path)),
+            sliced_download_threshold_bytes=0,
+            download_slices=0,
+        )
+        service.close()
+
+        assert service.sliced_download_threshold_bytes == 0
+        assert service.download_slices == 0
+
+
+class TestParseCache:
+    """Test that re-uploaded files are served from the parse cache."""
+
+    def test_cache_hit_skips_download_and_parse(self, tmp_path, bucket):
+        """Test that a second ingest of the same object neither downloads nor parses."""
+        from src.ingestion.ingestion_service import IngestionService
+        from src.ingestion.parse_cache import ParseCache
+        from src.ingestion.storage_backend import LocalStorageBackend
+
+        (bucket / "deck.docx").write_bytes(_docx_bytes("Brand story"))
+        service = IngestionService(
+            browser_pool=MagicMock(),
+            storage_backend=LocalStorageBackend(str(tmp_path)),
+            parse_cache=ParseCache(directory=str(tmp_path / "cache")),
+        )
+        file_paths = [{"path": "deck.docx", "bucket": "uploads", "filename": "v1.docx"}]
+        first = service.ingest_content(file_paths=file_paths)
+
+        file_paths[0]["filename"] = "v2.docx"
+        with (
+            patch.object(service.storage_backend, "download_to") as download_to,
+            patch.object(service, "parse_in_process_pool") as parse,
+        ):
+            second = service.ingest_content(file_paths=file_paths)
+        service.close()
+
+        download_to.assert_not_called()
+        parse.assert_not_called()
+        assert second["uploaded_content"][0]["text"] == first["uploaded_content"][0]["text"]
+        assert second["uploaded_content"][0]["filename"] == "v2.docx"
+        assert service.parse_cache.metrics()["hits"] == 1
+
+
+class TestParallelRangeParsing:
+    """Test that large PDFs and decks are parsed as page or slide ranges in separate processes."""
+
+    def test_large_pdf_split_into_ordered_ranges(self, tmp_path, bucket):
+        """Test that PDFs above the page threshold are split and merged in page order."""
+        from src.ingestion.file_parser import parse_pdf
+        from src.ingestion.ingestion_service import IngestionService
+        from src.ingestion.storage_backend import LocalStorageBackend
+
+        path = bucket / "annual-report.pdf"
+        path.write_bytes(_pdf_bytes(9))
+        service = IngestionService(
+            browser_pool=MagicMock(),
+            parse_workers=3,
+            storage_backend=LocalStorageBackend(str(tmp_path)),
+            pdf_parallel_page_threshold=5,
+        )
+        submit = service._get_parse_executor().submit
+        with patch.object(service._get_parse_executor(), "submit", wraps=submit) as submitted:
+            parsed = service.parse_in_process_pool(str(path), "annual-report.pdf")
+        service.close()
+
+        assert submitted.call_count == 3
+        assert [page.page_number for page in parsed.pages] == list(range(1, 10))
+        assert parsed == parse_pdf(str(path), "annual-report.pdf")
+
+    def test_small_pdf_parsed_whole(self, tmp_path, bucket):
+        """Test that PDFs below the threshold are parsed by a single process."""
+        from src.ingestion.ingestion_service import IngestionService
+        from src.ingestion.storage_backend import LocalStorageBackend
+
+        service = IngestionService(
+            browser_pool=MagicMock(),
+            parse_workers=3,
+            storage_backend=LocalStorageBackend(str(tmp_path)),
+            pdf_parallel_page_threshold=5,
+        )
+        with patch.object(service, "_parse_ranges") as parse_ranges:
+            parsed = service.parse_in_process_pool(_pdf_bytes(2), "brief.pdf")
+        service.close()
+
+        parse_ranges.assert_not_called()
+        assert len(parsed.pages) == 2
+
+    def test_large_deck_split_into_slide_ranges(self, tmp_path, bucket):
+        """Test that decks above the slide threshold are parsed in ordered slide ranges."""
+        from pptx import Presentation
+
+        from src.ingestion.file_parser import parse_pptx
+        from src.ingestion.ingestion_service import IngestionService
+        from src.ingestion.storage_backend import LocalStorageBackend
+
+        presentation = Presentation()
+        for number in range(1, 8):
+            slide = presentation.slides.add_slide(presentation.slide_layouts[0])
+            slide.shapes.title.text = f"Slide title {number}"
+        path = bucket / "deck.pptx"
+        presentation.save(path)
+        service = IngestionService(
+            browser_pool=MagicMock(),
+            parse_workers=3,
+            storage_backend=LocalStorageBackend(str(tmp_path)),
+            pptx_parallel_slide_threshold=5,
+        )
+        submit = service._get_parse_executor().submit
+        with patch.object(service._get_parse_executor(), "submit", wraps=submit) as submitted:
+            parsed = service.parse_in_process_pool(str(path), "deck.pptx")
+        service.close()
+
+        assert submitted.call_count == 3
+        assert [section.order for section in parsed.sections] == list(range(1, 8))
+        assert parsed == parse_pptx(str(path), "deck.pptx")
+
+
+class TestParseBudget:
+    """Test that oversized uploads are sampled and flagged for the report."""
+
+    def test_sampled_upload_is_flagged_and_not_split(self, tmp_path, bucket):
+        """Test that a sampled PDF is parsed whole in one process and carries its note."""
+        from src.ingestion.file_parser import ParseBudget
+        from src.ingestion.ingestion_service import IngestionService
+        from src.ingestion.storage_backend import LocalStorageBackend
+
+        (bucket / "archive.pdf").write_bytes(_pdf_bytes(12))
+        service = IngestionService(
+            browser_pool=MagicMock(),
+            parse_workers=3,
+            storage_backend=LocalStorageBackend(str(tmp_path)),
+            pdf_parallel_page_threshold=5,
+            parse_budget=ParseBudget(sample_threshold=10, head=2, middle=2, tail=2),
+        )
+        with patch.object(service, "_parse_ranges") as parse_ranges:
+            result = service.ingest_content(
+                file_paths=[{"path": "archive.pdf", "bucket": "uploads"}]
+            )
+        service.close()
+
+        parse_ranges.assert_not_called()
+        assert result["uploaded_content"][0]["sampling"].startswith("Sampled 6 of 12 pages")
+
+
+class TestDuplicateCollapsing:
+    """Test that duplicate uploads are collapsed at the end of ingestion."""
+
+    def test_duplicate_upload_collapsed_and_kept_as_original(self, tmp_path, bucket):
+        """Test that a second copy of a document reaches the agents once."""
+        from src.ingestion.ingestion_service import IngestionService
+        from src.ingestion.storage_backend import LocalStorageBackend
+
+        text = "Our onboarding programme pairs every new customer with a named success lead."
+        (bucket / "story.docx").write_bytes(_docx_bytes(text))
+        (bucket / "story-copy.docx").write_bytes(_docx_bytes(text))
+        service = IngestionService(
+            browser_pool=MagicMock(),
+            storage_backend=LocalStorageBackend(str(tmp_path)),
+            deduplicate=True,
+        )
+        result = service.ingest_content(
+            file_paths=[
+                {"path": "story.docx", "bucket": "uploads"},
+                {"path": "story-copy.docx", "bucket": "uploads"},
+            ]
+        )
+        service.close()
+
+        assert [upload["filename"] for upload in result["uploaded_content"]] == ["story.docx"]
+        assert len(result["original_uploaded_content"]) == 2
+        assert result["duplicates"]["documents"][0]["duplicate_of"] == "story.docx"
+        # Corpus statistics cover only what the agents see
+        assert result["stats"]["words"] == result["uploaded_content"][0]["stats"]["words"] == 12
+
+
+class TestQualityGate:
+    """Test that content not worth evaluating is stopped at ingestion."""
+
+    def _blank_pdf(self, bucket):
+        import fitz
+
+        document = fitz.open()
+        for _ in range(3):
+            document.new_page()
+        (bucket / "scan.pdf").write_bytes(document.tobytes())
+        document.close()
+
+    def test_image_only_pdf_rejected(self, service, bucket):
+        """Test that a PDF without a text layer raises a specific error."""
+        from src.ingestion.content_gate import ContentQualityError
+
+        self._blank_pdf(bucket)
+        with pytest.raises(ContentQualityError, match="scan.pdf has no extractable text") as e:
+            service.ingest_content(file_paths=[{"path": "scan.pdf", "bucket": "uploads"}])
+        assert [issue.reason for issue in e.value.issues] == ["image_only"]
+
+    def test_usable_upload_lets_flagged_content_through(self, service, bucket):
+        """Test that issues are flagged when another upload is usable."""
+        self._blank_pdf(bucket)
+        (bucket / "story.docx").write_bytes(_docx_bytes("Our story"))
+        result = service.ingest_content(
+            file_paths=[
+                {"path": "scan.pdf", "bucket": "uploads"},
+                {"path": "story.docx", "bucket": "uploads"},
+            ]
+        )
+
+        assert result["uploaded_content"][0]["quality_issues"][0]["reason"] == "image_only"
+        assert "quality_issues" not in result["uploaded_content"][1]
+        assert [flag["source"] for flag in result["quality_flags"]] == ["scan.pdf"]
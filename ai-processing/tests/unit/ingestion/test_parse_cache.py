@@ -0,0 +1,92 @@
+"""Unit tests for the parsed-content cache."""
+
+import os
+import time
+
+from src.ingestion.storage_backend import ObjectInfo
+from src.models.parsed_content import ParsedContent
+
+
+def _parsed(text="Brand deck text", filename="deck.pdf"):
+    return ParsedContent(
+        filename=filename, file_type="pdf", text=text, word_count=len(text.split())
+    )
+
+
+class TestContentFingerprint:
+    """Test fingerprints built from object metadata."""
+
+    def test_checksum_ignores_location(self):
+        """Test that the same MD5 under different paths gives one fingerprint."""
+        from src.ingestion.parse_cache import content_fingerprint
+
+        info = ObjectInfo(size=10, generation="1", md5_hash="abc==", crc32c="xyz==")
+        assert content_fingerprint(info, "a", "one.pdf") == content_fingerprint(
+            info._replace(generation="2"), "b", "two.pdf"
+        )
+
+    def test_generation_is_scoped_to_path(self):
+        """Test that without checksums the fingerprint includes the object path."""
+        from src.ingestion.parse_cache import content_fingerprint
+
+        info = ObjectInfo(size=10, generation="1")
+        assert content_fingerprint(info, "a", "one.pdf") != content_fingerprint(
+            info, "a", "two.pdf"
+        )
+        assert content_fingerprint(ObjectInfo(size=10), "a", "one.pdf") is None
+
+
+class TestParseCache:
+    """Test the disk-backed parse cache."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that stored content is returned for the same fingerprint and type only."""
+        from src.ingestion.parse_cache import ParseCache
+
+        cache = ParseCache(directory=str(tmp_path))
+        cache.put("md5:abc", "pdf", _parsed())
+
+        assert cache.get("md5:abc", "pdf").text == "Brand deck text"
+        assert cache.get("md5:abc", "docx") is None
+        assert cache.metrics()["hits"] == 1
+        assert cache.metrics()["misses"] == 1
+
+    def test_expired_entries_are_discarded(self, tmp_path):
+        """Test that entries older than the TTL are not returned."""
+        from src.ingestion.parse_cache import ParseCache
+
+        cache = ParseCache(directory=str(tmp_path))
+        cache.put("md5:abc", "pdf", _parsed())
+        cache.ttl_seconds = 0
+        time.sleep(0.01)
+
+        assert cache.get("md5:abc", "pdf") is None
+        assert cache.metrics()["expired"] == 1
+
+    def test_evicts_least_recently_used_over_size_limit(self, tmp_path):
+        """Test that the oldest entries are evicted when over the size limit."""
+        from src.ingestion.parse_cache import ParseCache
+
+        cache = ParseCache(directory=str(tmp_path))
+        cache.put("md5:old", "pdf", _parsed(os.urandom(2000).hex()))
+        old_path = next(tmp_path.glob("*.json.zst"))
+        os.utime(old_path, (time.time() - 100, time.time() - 100))
+        cache.max_bytes = old_path.stat().st_size + 100
+        cache.put("md5:new", "pdf", _parsed(os.urandom(2000).hex()))
+
+        assert cache.get("md5:old", "pdf") is None
+        assert cache.get("md5:new", "pdf") is not None
+        assert cache.metrics()["evictions"] == 1
+
+    def test_sweeps_unused_entries_by_age(self, tmp_path):
+        """Test that entries unused for longer than the TTL are removed on store."""
+        from src.ingestion.parse_cache import ParseCache
+
+        cache = ParseCache(directory=str(tmp_path), ttl_seconds=60)
+        cache.put("md5:old", "pdf", _parsed())
+        old_path = next(tmp_path.glob("*.json.zst"))
+        os.utime(old_path, (time.time() - 120, time.time() - 120))
+        cache.put("md5:new", "pdf", _parsed())
+
+        assert not old_path.exists()
+        assert cache.metrics()["evictions"] == 1
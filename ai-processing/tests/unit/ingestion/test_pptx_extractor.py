@@ -0,0 +1,75 @@
+"""Unit tests for the PPTX slide and notes extractor."""
+
+import io
+
+
+def _deck_bytes():
+    """Deck with a grouped shape, a table and speaker notes on slide 1, an empty slide 2."""
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    presentation = Presentation()
+    slide = presentation.slides.add_slide(presentation.slide_layouts[1])
+    slide.shapes.title.text = "Our Story"
+    slide.placeholders[1].text = "Why we exist"
+    group = slide.shapes.add_group_shape()
+    group.shapes.add_textbox(0, 0, Inches(1), Inches(1)).text_frame.text = "Grouped callout"
+    table = slide.shapes.add_table(2, 2, 0, 0, Inches(2), Inches(1)).table
+    for row, cells in enumerate([("Plan", "Price"), ("Pro", "$10")]):
+        for column, text in enumerate(cells):
+            table.cell(row, column).text = text
+    slide.notes_slide.notes_text_frame.text = "Open with the customer quote"
+    presentation.slides.add_slide(presentation.slide_layouts[6])
+    closing = presentation.slides.add_slide(presentation.slide_layouts[0])
+    closing.shapes.title.text = "Thank you"
+
+    buffer = io.BytesIO()
+    presentation.save(buffer)
+    return buffer.getvalue()
+
+
+class TestSlideDeck:
+    """Test slide and notes text extraction."""
+
+    def test_reads_groups_tables_and_notes(self):
+        """Test that grouped shapes, tables and speaker notes are extracted."""
+        from src.ingestion.pptx_extractor import SlideDeck, SlideText
+
+        with SlideDeck(_deck_bytes()) as deck:
+            slides = [deck.slide(index) for index in range(len(deck))]
+
+        assert slides[0] == SlideText(
+            slide_number=1,
+            text="Our Story\nWhy we exist\nGrouped callout\nPlan | Price\nPro | $10",
+            notes="Open with the customer quote",
+        )
+        assert slides[1] == SlideText(slide_number=2, text="")
+        assert slides[2].text == "Thank you"
+
+    def test_ranges_keep_slide_numbers(self):
+        """Test that a slide range is numbered by position in the whole deck."""
+        from src.ingestion.file_parser import parse_pptx_slides
+        from src.ingestion.pptx_extractor import slide_count
+
+        data = _deck_bytes()
+
+        assert slide_count(data) == 3
+        parsed = parse_pptx_slides(data, 1, 3, filename="deck.pptx")
+        assert [(section.title, section.order) for section in parsed.sections] == [("Slide 3", 3)]
+
+
+class TestParsePptx:
+    """Test Section output built from extracted slides."""
+
+    def test_sections_skip_empty_slides_and_include_notes(self):
+        """Test that sections are ordered by slide number and carry speaker notes."""
+        from src.ingestion.file_parser import parse_pptx
+
+        parsed = parse_pptx(_deck_bytes(), "deck.pptx")
+
+        assert [(section.title, section.order) for section in parsed.sections] == [
+            ("Slide 1", 1),
+            ("Slide 3", 3),
+        ]
+        assert parsed.sections[0].text.endswith("Speaker notes: Open with the customer quote")
+        assert parsed.text.endswith("Thank you")
@@ -0,0 +1,90 @@
+"""Unit tests for the scrape cache."""
+
+import os
+
+from src.models.scraped_content import PageContent, ScrapedContent
+
+
+def _content(text="Hello world", url="https://example.com/", etag='"v1"'):
+    page = PageContent(text=text, url=url, word_count=len(text.split()), etag=etag)
+    return ScrapedContent(homepage=page, about_page=None, total_word_count=page.word_count)
+
+
+class TestCanonicalizeUrl:
+    """Test URL canonicalisation for cache keys."""
+
+    def test_equivalent_urls_share_key(self):
+        """Test that case, default ports, fragments and tracking params are ignored."""
+        from src.ingestion.scrape_cache import canonicalize_url
+
+        assert canonicalize_url("HTTPS://Example.com:443?b=2&a=1&utm_source=x#top") == (
+            "https://example.com/?a=1&b=2"
+        )
+
+    def test_keeps_meaningful_parts(self):
+        """Test that non-default ports, paths and other params are kept."""
+        from src.ingestion.scrape_cache import canonicalize_url
+
+        assert canonicalize_url("http://example.com:8080/About?lang=en") == (
+            "http://example.com:8080/About?lang=en"
+        )
+
+
+class TestScrapeCache:
+    """Test the disk-backed scrape cache."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that stored content is returned with its validators."""
+        from src.ingestion.scrape_cache import ScrapeCache
+
+        cache = ScrapeCache(directory=str(tmp_path))
+        cache.put("https://example.com/?utm_campaign=x", _content())
+
+        cached = cache.get("https://example.com")
+        assert cached is not None
+        assert cached.homepage.text == "Hello world"
+        assert cached.homepage.etag == '"v1"'
+        assert cache.metrics()["stores"] == 1
+
+    def test_miss_and_expiry(self, tmp_path):
+        """Test that missing and expired entries are reported separately."""
+        from src.ingestion.scrape_cache import ScrapeCache
+
+        cache = ScrapeCache(directory=str(tmp_path), ttl_seconds=-1)
+        assert cache.get("https://example.com/") is None
+        cache.put("https://example.com/", _content())
+        assert cache.get("https://example.com/") is None
+
+        metrics = cache.metrics()
+        assert metrics["misses"] == 1
+        assert metrics["expired"] == 1
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test that the oldest entry is evicted when over the size limit."""
+        from src.ingestion.scrape_cache import ScrapeCache
+
+        cache = ScrapeCache(directory=str(tmp_path))
+        cache.put("https://old.example.com/", _content(text=os.urandom(2000).hex()))
+        cache.put("https://new.example.com/", _content(text=os.urandom(2000).hex()))
+        old_path = cache._path("https://old.example.com/")
+        os.utime(old_path, (1, 1))
+
+        entry_size = old_path.stat().st_size
+        cache.max_bytes = entry_size + entry_size // 2
+        cache.put("https://new.example.com/", _content(text=os.urandom(2000).hex()))
+
+        assert cache.get("https://old.example.com/") is None
+        assert cache.get("https://new.example.com/") is not None
+        assert cache.metrics()["evictions"] == 1
+
+    def test_page_validators(self):
+        """Test conditional request headers built from a cached page."""
+        from src.ingestion.scrape_cache import page_validators
+
+        page = PageContent(
+            text="x", url="https://example.com/", word_count=1, etag='"v1"', last_modified="Mon"
+        )
+        assert page_validators(page) == {"If-None-Match": '"v1"', "If-Modified-Since": "Mon"}
+        assert (
+            page_validators(PageContent(text="x", url="https://example.com/", word_count=1)) == {}
+        )
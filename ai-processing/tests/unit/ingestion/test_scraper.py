@@ -129,3 +129,438 @@ class TestWebScraper:
 
         assert "insufficient" in str(exc_info.value).lower() or "200" in str(exc_info.value)
 
+
+def _html_response(html, url="https://example.com/", status=200):
+    """Build a mock requests response carrying HTML."""
+    response = MagicMock()
+    response.status_code = status
+    response.url = url
+    response.headers = {"Content-Type": "text/html; charset=utf-8"}
+    response.content = html.encode("utf-8")
+    return response
+
+
+def _html_page(text):
+    """Wrap text in a minimal HTML document."""
+    return f"<html><body><p>{text}</p></body></html>"
+
+
+class TestStaticFastPath:
+    """Test the HTTP-first scraping path (network mocked)."""
+
+    ARTICLE = " ".join(["Our platform helps finance teams close the books faster."] * 30)
+
+    def test_extracts_visible_text_only(self):
+        """Test that scripts and styles are excluded from extracted text."""
+        import lxml.html
+        from src.ingestion.scraper import extract_text_from_html
+
+        document = lxml.html.document_fromstring(
+            "<html><head><style>p{}</style></head><body><h1>Title</h1><p>Para</p>"
+            "<script>var x = 1;</script><noscript>Enable JS</noscript></body></html>"
+        )
+
+        assert extract_text_from_html(document) == "Title Para"
+
+    def test_detects_spa_shell(self):
+        """Test SPA shell heuristics."""
+        import lxml.html
+        from src.ingestion.scraper import looks_like_spa_shell
+
+        shell = lxml.html.document_fromstring(
+            '<html><body><div id="root"></div><script src="/app.js"></script></body></html>'
+        )
+        server_rendered = lxml.html.document_fromstring(
+            f'<html><body><div id="root"><p>{self.ARTICLE}</p></div></body></html>'
+        )
+
+        assert looks_like_spa_shell(shell, "") is True
+        assert looks_like_spa_shell(server_rendered, self.ARTICLE) is False
+
+    @patch("src.ingestion.scraper.scrape_with_browser")
+    @patch("src.ingestion.scraper.check_redirects")
+    @patch("src.ingestion.scraper.check_robots_txt", return_value=True)
+    @patch("src.ingestion.scraper.get_session")
+    def test_uses_static_html_without_browser(self, get_session, _robots, _redirects, browser):
+        """Test that server-rendered sites never start the browser."""
+        from src.ingestion.scraper import scrape_website
+
+        pages = {
+            "https://example.com/": _html_response(
+                f'<html><body><a href="/about-us">About</a><p>{self.ARTICLE}</p></body></html>'
+            ),
+            "https://example.com/about-us": _html_response(
+                "<html><body><p>Founded in 2001.</p></body></html>",
+                url="https://example.com/about-us",
+            ),
+        }
+        get_session.return_value.get.side_effect = lambda url, **kwargs: pages[url]
+
+        result = scrape_website("https://example.com/")
+
+        browser.assert_not_called()
+        assert result.homepage.word_count > 200
+        assert result.about_page.text == "Founded in 2001."
+        assert result.total_word_count == result.homepage.word_count + 3
+
+    @patch("src.ingestion.scraper.scrape_with_browser")
+    @patch("src.ingestion.scraper.check_redirects")
+    @patch("src.ingestion.scraper.check_robots_txt", return_value=True)
+    @patch("src.ingestion.scraper.get_session")
+    def test_escalates_thin_or_js_pages_to_browser(self, get_session, _robots, _redirects, browser):
+        """Test that SPA shells fall back to the browser."""
+        from src.ingestion.scraper import scrape_website
+
+        get_session.return_value.get.return_value = _html_response(
+            '<html><body><div id="__next"></div></body></html>'
+        )
+
+        result = scrape_website("https://example.com/")
+
+        browser.assert_called_once()
+        assert result is browser.return_value
+
+
+class TestFastPageLoad:
+    """Test fast page-load mode (Playwright mocked)."""
+
+    def test_blocks_heavy_resources_and_trackers(self):
+        """Test that the route handler aborts images, fonts and tracker requests."""
+        from src.ingestion.scraper import block_heavy_resources
+
+        context = MagicMock()
+        block_heavy_resources(context)
+        pattern, handler = context.route.call_args[0]
+        assert pattern == "**/*"
+
+        def route_for(resource_type, url):
+            route = MagicMock()
+            route.request.resource_type = resource_type
+            route.request.url = url
+            handler(route)
+            return route
+
+        assert route_for("image", "https://example.com/logo.png").abort.called
+        assert route_for("font", "https://example.com/a.woff2").abort.called
+        assert route_for("script", "https://www.googletagmanager.com/gtm.js").abort.called
+        allowed = route_for("document", "https://example.com/")
+        assert allowed.continue_.called and not allowed.abort.called
+
+    def test_waits_until_text_is_stable(self):
+        """Test that text-stability polling stops once the length settles."""
+        from src.ingestion.scraper import wait_for_text_stable
+
+        page = MagicMock()
+        page.evaluate.side_effect = [0, 120, 480, 480, 480, 999]
+
+        wait_for_text_stable(page, timeout=5000)
+
+        assert page.evaluate.call_count == 5
+
+    def test_finds_about_link_with_single_evaluate(self):
+        """Test that links are read in one page.evaluate round trip."""
+        from src.ingestion.scraper import find_about_page_url
+
+        page = MagicMock()
+        page.evaluate.return_value = ["#top", None, "/products", "/company/team"]
+
+        about_url = find_about_page_url("https://example.com/", page)
+
+        assert about_url == "https://example.com/company/team"
+        page.evaluate.assert_called_once()
+        page.query_selector_all.assert_not_called()
+
+    @patch("src.ingestion.scraper.wait_for_text_stable")
+    def test_loads_homepage_once_without_networkidle(self, _stable):
+        """Test that fast mode navigates once per page without networkidle."""
+        from src.ingestion.scraper import scrape_with_context
+
+        context = MagicMock()
+        page = context.new_page.return_value
+        page.url = "https://example.com/"
+        page.goto.return_value.status = 200
+        page.goto.return_value.headers = {}
+        page.evaluate.return_value = []
+        page.content.return_value = _html_page(" ".join(["word"] * 250))
+
+        result = scrape_with_context(context, "https://example.com/")
+
+        context.route.assert_called_once()
+        page.goto.assert_called_once()
+        assert page.goto.call_args.kwargs["wait_until"] == "commit"
+        load_states = [c.args[0] for c in page.wait_for_load_state.call_args_list]
+        assert "networkidle" not in load_states
+        assert result.homepage.word_count == 250
+
+
+class TestConcurrentAboutPage:
+    """Test that the About page loads alongside the homepage (Playwright mocked)."""
+
+    def _context(self, about_status=200):
+        manager = MagicMock()
+        home, about = manager.home, manager.about
+        context = MagicMock()
+        context.new_page.side_effect = [home, about]
+
+        home.url = "https://example.com/"
+        home.goto.return_value.status = 200
+        home.goto.return_value.headers = {"etag": '"home"'}
+        home.evaluate.return_value = ["/about-us"]
+        home.content.return_value = _html_page(" ".join(["home"] * 150))
+        about.goto.return_value.status = about_status
+        about.goto.return_value.headers = {}
+        about.content.return_value = _html_page(" ".join(["about"] * 100))
+        return manager, context
+
+    @patch("src.ingestion.scraper.wait_for_text_stable")
+    def test_about_load_starts_before_homepage_extraction(self, _stable):
+        """Test that the About tab is navigating while homepage text is extracted."""
+        from src.ingestion.scraper import scrape_with_context
+
+        manager, context = self._context()
+
+        result = scrape_with_context(context, "https://example.com/")
+
+        calls = [name for name, args, _ in manager.mock_calls]
+        about_goto = calls.index("about.goto")
+        homepage_text = [
+            i for i, (name, args, _) in enumerate(manager.mock_calls) if name == "home.content"
+        ]
+        assert about_goto < homepage_text[0]
+        assert result.about_page.url == "https://example.com/about-us"
+        assert result.total_word_count == 250
+        manager.about.close.assert_called_once()
+
+    @patch("src.ingestion.scraper.wait_for_text_stable")
+    def test_failed_about_page_falls_back_to_homepage(self, _stable):
+        """Test that an About page error is ignored when the homepage suffices."""
+        from src.ingestion.scraper import scrape_with_context
+
+        manager, context = self._context(about_status=404)
+        manager.home.content.return_value = _html_page(" ".join(["home"] * 250))
+
+        result = scrape_with_context(context, "https://example.com/")
+
+        assert result.about_page is None
+        assert result.total_word_count == 250
+
+
+class TestPooledBrowserScrape:
+    """Test that pooled browser scrapes are bounded by the page timeout."""
+
+    def test_pool_job_gets_scrape_timeout(self):
+        """Test that the pool job is given the page timeout for both pages plus a margin."""
+        from src.ingestion.scraper import BROWSER_JOB_MARGIN_SECONDS, scrape_with_browser
+
+        pool = MagicMock()
+        scrape_with_browser("https://example.com/", timeout=5000, browser_pool=pool)
+
+        assert pool.run.call_args.kwargs["timeout"] == 10 + BROWSER_JOB_MARGIN_SECONDS
+
+    def test_pool_timeout_is_scraping_error(self):
+        """Test that a pool job past its timeout surfaces as a ScrapingError."""
+        from concurrent.futures import TimeoutError
+
+        from src.ingestion.scraper import ScrapingError, scrape_with_browser
+
+        pool = MagicMock()
+        pool.run.side_effect = TimeoutError()
+
+        with pytest.raises(ScrapingError, match="Timeout while scraping"):
+            scrape_with_browser("https://example.com/", browser_pool=pool)
+
+
+def _status_response(status, headers=None, text=""):
+    """Build a mock requests response with a status code."""
+    response = MagicMock()
+    response.status_code = status
+    response.headers = headers or {}
+    response.text = text
+    return response
+
+
+class TestHostCaches:
+    """Test robots.txt and redirect caching (network mocked)."""
+
+    @pytest.fixture(autouse=True)
+    def clear_caches(self):
+        from src.ingestion import scraper
+
+        scraper._robots_cache.clear()
+        scraper._redirect_cache.clear()
+        yield
+        scraper._robots_cache.clear()
+        scraper._redirect_cache.clear()
+
+    @patch("src.ingestion.scraper.get_session")
+    def test_robots_rules_cached_per_host(self, get_session):
+        """Test that robots.txt is fetched once per host with a timeout."""
+        from src.ingestion.scraper import check_robots_txt
+
+        get_session.return_value.get.return_value = _status_response(
+            200, text="User-agent: *\nDisallow: /private"
+        )
+
+        assert check_robots_txt("https://example.com/") is True
+        assert check_robots_txt("https://example.com/private/page") is False
+        assert get_session.return_value.get.call_count == 1
+        assert get_session.return_value.get.call_args.kwargs["timeout"] > 0
+
+    @patch("src.ingestion.scraper.get_session")
+    def test_robots_forbidden_disallows(self, get_session):
+        """Test that a 403 robots.txt disallows scraping, like RobotFileParser.read()."""
+        from src.ingestion.scraper import check_robots_txt
+
+        get_session.return_value.get.return_value = _status_response(403)
+
+        assert check_robots_txt("https://example.com/") is False
+
+    @patch("src.ingestion.scraper.get_session")
+    def test_redirect_chain_cached(self, get_session):
+        """Test that a resolved redirect chain is reused without probing."""
+        from src.ingestion.scraper import check_redirects
+
+        get_session.return_value.get.side_effect = [
+            _status_response(301, {"Location": "https://example.com/"}),
+            _status_response(200),
+        ]
+
+        check_redirects("http://example.com/")
+        check_redirects("http://example.com/")
+
+        assert get_session.return_value.get.call_count == 2
+
+    @patch("src.ingestion.scraper.get_session")
+    def test_cached_chain_still_enforces_limits(self, get_session):
+        """Test that a cached chain is checked against each call's redirect limit."""
+        from src.ingestion.scraper import ScrapingError, check_redirects
+
+        get_session.return_value.get.side_effect = [
+            _status_response(302, {"Location": "/a"}),
+            _status_response(302, {"Location": "/b"}),
+            _status_response(200),
+        ]
+
+        check_redirects("https://example.com/", max_redirects=5)
+        with pytest.raises(ScrapingError, match="Too many redirects"):
+            check_redirects("https://example.com/", max_redirects=1)
+
+    @patch("src.ingestion.scraper.get_session")
+    def test_detects_redirect_loop(self, get_session):
+        """Test redirect loop detection."""
+        from src.ingestion.scraper import ScrapingError, check_redirects
+
+        get_session.return_value.get.side_effect = [
+            _status_response(302, {"Location": "/b"}),
+            _status_response(302, {"Location": "/a"}),
+            _status_response(302, {"Location": "/b"}),
+        ]
+
+        with pytest.raises(ScrapingError, match="Redirect loop"):
+            check_redirects("https://example.com/a")
+
+
+class TestScrapeCacheRevalidation:
+    """Test that cached scrapes are revalidated instead of re-scraped."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        from src.ingestion.scrape_cache import ScrapeCache
+        from src.models.scraped_content import PageContent, ScrapedContent
+
+        cache = ScrapeCache(directory=str(tmp_path))
+        page = PageContent(text="Cached", url="https://example.com/", word_count=1, etag='"v1"')
+        cache.put(
+            "https://example.com/",
+            ScrapedContent(homepage=page, about_page=None, total_word_count=1),
+        )
+        return cache
+
+    @patch("src.ingestion.scraper.scrape_with_browser")
+    @patch("src.ingestion.scraper.scrape_static")
+    @patch("src.ingestion.scraper.get_session")
+    @patch("src.ingestion.scraper.check_redirects")
+    @patch("src.ingestion.scraper.check_robots_txt", return_value=True)
+    def test_not_modified_skips_scrape(
+        self, _robots, _redirects, get_session, scrape_static, scrape_with_browser, cache
+    ):
+        """Test that a 304 returns the cached content without fetching the page."""
+        from src.ingestion.scraper import scrape_website
+
+        get_session.return_value.get.return_value = _status_response(304)
+
+        result = scrape_website("https://example.com/", cache=cache)
+
+        assert result.homepage.text == "Cached"
+        headers = get_session.return_value.get.call_args.kwargs["headers"]
+        assert headers == {"If-None-Match": '"v1"'}
+        scrape_static.assert_not_called()
+        scrape_with_browser.assert_not_called()
+        assert cache.metrics()["hits"] == 1
+
+    @patch("src.ingestion.scraper.scrape_with_browser")
+    @patch("src.ingestion.scraper.scrape_static")
+    @patch("src.ingestion.scraper.get_session")
+    @patch("src.ingestion.scraper.check_redirects")
+    @patch("src.ingestion.scraper.check_robots_txt", return_value=True)
+    def test_changed_page_is_rescraped_and_stored(
+        self, _robots, _redirects, get_session, scrape_static, scrape_with_browser, cache
+    ):
+        """Test that a changed page is scraped again and replaces the cache entry."""
+        from src.ingestion.scraper import scrape_website
+        from src.models.scraped_content import PageContent, ScrapedContent
+
+        get_session.return_value.get.return_value = _status_response(200)
+        fresh = PageContent(text="Fresh", url="https://example.com/", word_count=1, etag='"v2"')
+        scrape_static.return_value = ScrapedContent(
+            homepage=fresh, about_page=None, total_word_count=1
+        )
+
+        result = scrape_website("https://example.com/", cache=cache)
+
+        assert result.homepage.text == "Fresh"
+        assert cache.get("https://example.com/").homepage.etag == '"v2"'
+        assert cache.metrics()["stale"] == 1
+        scrape_with_browser.assert_not_called()
+
+
+class TestCrawlMode:
+    """Test that crawl mode adds pages to a scrape (network mocked)."""
+
+    @patch("src.ingestion.scraper.crawl_site")
+    @patch("src.ingestion.scraper.scrape_static")
+    @patch("src.ingestion.scraper.check_redirects")
+    @patch("src.ingestion.scraper.check_robots_txt", return_value=True)
+    def test_adds_crawled_pages(self, _robots, _redirects, scrape_static, crawl_site):
+        """Test that crawled pages are appended and counted."""
+        from src.ingestion.crawler import CrawlBudget
+        from src.ingestion.scraper import scrape_website
+        from src.models.scraped_content import PageContent, ScrapedContent
+
+        homepage = PageContent(text="Home", url="https://example.com/", word_count=250)
+        scrape_static.return_value = ScrapedContent(
+            homepage=homepage, about_page=None, total_word_count=250
+        )
+        crawl_site.return_value = [
+            PageContent(text="Customers", url="https://example.com/customers", word_count=40)
+        ]
+
+        result = scrape_website("https://example.com/", crawl=CrawlBudget(max_pages=2))
+
+        assert result.total_word_count == 290
+        assert result.to_dict()["additional_pages"] == [
+            {"text": "Customers", "url": "https://example.com/customers"}
+        ]
+        assert crawl_site.call_args.args[2].max_pages == 2
+
+    def test_static_scrape_records_homepage_links(self):
+        """Test that the static path keeps absolute homepage links for the frontier."""
+        from src.ingestion.scraper import scrape_static
+
+        article = " ".join(["Our platform helps finance teams close the books faster."] * 30)
+        html = f'<html><body><a href="/products">P</a><a href="/products">P</a><p>{article}</p>'
+        with patch("src.ingestion.scraper.get_session") as get_session:
+            get_session.return_value.get.return_value = _html_response(html + "</body></html>")
+            result = scrape_static("https://example.com/")
+
+        assert result.homepage.links == ["https://example.com/products"]
@@ -0,0 +1,133 @@
+"""Unit tests for the out-of-process scraper worker pool."""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+ARTICLE = " ".join(["Our platform helps finance teams close the books faster."] * 30)
+
+
+class _SiteHandler(BaseHTTPRequestHandler):
+    """Serves a static homepage, and a page that never finishes loading."""
+
+    def do_GET(self):
+        if self.path == "/slow":
+            time.sleep(30)
+        if self.path == "/robots.txt":
+            self.send_response(404)
+            self.end_headers()
+            return
+        body = f"<html><body><p>{ARTICLE}</p></body></html>".encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def site():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SiteHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.fixture
+def pool():
+    from src.ingestion.scraper_workers import ScraperWorkerPool
+
+    pool = ScraperWorkerPool(size=1, job_timeout_seconds=20)
+    yield pool
+    pool.shutdown()
+
+
+class TestScraperWorkerPool:
+    """Test scraping in worker processes against a local server."""
+
+    def test_scrapes_in_worker_process(self, pool, site):
+        """Test that a scrape runs in a separate process and returns content."""
+        result = pool.scrape(f"{site}/")
+
+        assert result.homepage.word_count >= 200
+        metrics = pool.metrics()
+        assert metrics["jobs_completed"] == 1
+        assert metrics["live_workers"] == 1
+
+    def test_stuck_worker_is_killed_and_replaced(self, pool, site):
+        """Test that a job over its timeout kills the worker and a new one takes over."""
+        from src.ingestion.scraper import ScrapingError
+
+        with pytest.raises(ScrapingError, match="Timeout"):
+            pool.scrape(f"{site}/slow", job_timeout_seconds=2)
+
+        assert pool.scrape(f"{site}/").homepage.word_count >= 200
+        metrics = pool.metrics()
+        assert metrics["jobs_timed_out"] == 1
+        assert metrics["workers_killed"] == 1
+        assert metrics["workers_started"] == 2
+
+    def test_recycles_worker_over_memory_limit(self, pool, site):
+        """Test that a worker above the RSS limit is replaced after its job."""
+        pool.max_rss_bytes = 1
+
+        pool.scrape(f"{site}/")
+
+        metrics = pool.metrics()
+        assert metrics["workers_recycled"] == 1
+        assert metrics["live_workers"] == 1
+
+    def test_rejects_jobs_after_shutdown(self, pool):
+        """Test that a closed pool refuses new jobs."""
+        from src.ingestion.scraper_workers import ScraperWorkerPoolClosedError
+
+        pool.shutdown()
+
+        with pytest.raises(ScraperWorkerPoolClosedError):
+            pool.scrape("https://example.com/")
+
+
+class TestPoolSettings:
+    """Test timeouts and replacement of workers without starting processes."""
+
+    @pytest.mark.parametrize("timeout", [0, -1])
+    def test_non_positive_timeout_rejected(self, timeout):
+        """Test that a zero or negative job timeout is rejected instead of failing every job."""
+        from src.ingestion.scraper_workers import ScraperWorkerPool
+
+        with pytest.raises(ValueError, match="timeout must be positive"):
+            ScraperWorkerPool(size=1, job_timeout_seconds=timeout)
+
+        pool = ScraperWorkerPool(size=1)
+        with pytest.raises(ValueError, match="timeout must be positive"):
+            pool.scrape("https://example.com/", job_timeout_seconds=timeout)
+        assert pool.metrics()["workers_started"] == 0
+
+    def test_failed_respawn_keeps_slot(self):
+        """Test that a replacement worker that fails to start is started by the next job."""
+        from unittest.mock import MagicMock, patch
+
+        from src.ingestion.scraper import ScrapingError
+        from src.ingestion.scraper_workers import ScraperWorkerPool
+
+        pool = ScraperWorkerPool(size=1)
+        pool._started = True
+        replacement = MagicMock()
+        with (
+            patch.object(pool, "_kill"),
+            patch.object(
+                pool,
+                "_spawn",
+                side_effect=[OSError("fork failed"), OSError("still failing"), replacement],
+            ),
+        ):
+            pool._release(MagicMock(), healthy=False)
+            with pytest.raises(ScrapingError, match="still failing"):
+                pool._acquire()
+            assert pool._acquire() is replacement
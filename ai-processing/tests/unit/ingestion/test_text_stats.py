@@ -0,0 +1,108 @@
+"""Unit tests for the single-pass text statistics engine."""
+
+import pytest
+
+
+class TestTextStats:
+    """Test word, sentence, paragraph and syllable counts."""
+
+    def test_counts_sentences_paragraphs_and_syllables(self):
+        """Test counts on a short text with blank-line paragraphs."""
+        from src.ingestion.text_stats import text_stats
+
+        text = "The cat sat on the mat. It was happy!\nStill the same paragraph\n\nA new one here."
+
+        stats = text_stats(text)
+
+        assert stats.words == 17
+        assert stats.sentences == 4
+        assert stats.paragraphs == 2
+        assert stats.characters == len(text)
+        assert stats.tokens == (len(text) + 3) // 4
+
+    def test_line_paragraphs_end_unpunctuated_lines(self):
+        """Test that in line mode a heading line is its own sentence and paragraph."""
+        from src.ingestion.text_stats import text_stats
+
+        text = "## Pricing\nPlans start at 10 dollars. Teams get more"
+
+        assert text_stats(text).sentences == 2
+        stats = text_stats(text, line_paragraphs=True)
+        assert (stats.sentences, stats.paragraphs) == (3, 2)
+
+    def test_syllable_estimates(self):
+        """Test vowel-group syllables with silent final 'e' and a minimum of one."""
+        from src.ingestion.text_stats import text_stats
+
+        syllables = {
+            word: text_stats(word).syllables
+            for word in ("the", "make", "table", "beautiful", "rhythm", "café")
+        }
+
+        assert syllables == {
+            "the": 1,
+            "make": 1,
+            "table": 2,
+            "beautiful": 3,
+            "rhythm": 1,
+            "café": 2,
+        }
+
+    def test_spans_match_whole_text_stats_across_chunks(self, monkeypatch):
+        """Test that measuring spans in small chunks gives the same counts as one by one."""
+        import src.ingestion.text_stats as text_stats_module
+        from src.ingestion.text_stats import measure_spans, span_stats, text_stats
+
+        pages = [f"Page {n} says hello. It has {n} apples!\n\nSecond paragraph." for n in range(50)]
+        text = "\n\n".join(pages)
+        spans, position = [], 0
+        for page in pages:
+            spans.append((position, position + len(page)))
+            position += len(page) + 2
+
+        monkeypatch.setattr(text_stats_module, "CHUNK_CHARACTERS", 100)
+        chunked = measure_spans(text, spans)
+
+        assert span_stats(text, spans) == [text_stats(page) for page in pages]
+        assert chunked.tolist() == [
+            [s.words, s.sentences, s.paragraphs, s.syllables, s.tokens]
+            for s in map(text_stats, pages)
+        ]
+
+    def test_readability_and_totals(self):
+        """Test Flesch scores and that totals add up page statistics."""
+        from src.ingestion.text_stats import text_stats
+        from src.models.text_stats import TextStats
+
+        easy = text_stats("We make tools. You use them. It is fun.")
+        hard = text_stats(
+            "Organisational interoperability considerations necessitate comprehensive "
+            "architectural documentation."
+        )
+
+        assert easy.flesch_reading_ease > 90 > 0 > hard.flesch_reading_ease
+        assert easy.flesch_kincaid_grade < hard.flesch_kincaid_grade
+        assert TextStats.total([easy, hard]).words == easy.words + hard.words
+        assert TextStats.total([]) == TextStats()
+        assert easy.to_dict()["average_sentence_length"] == 3.0
+
+    def test_count_words(self):
+        """Test the allocation-free word count."""
+        from src.ingestion.text_stats import count_words
+
+        assert count_words("Story-first brands, 2 ways") == 5
+        assert count_words("") == 0
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            " Fast  Secure  Simple",
+            "Price: € 20 → now ✓ great 🚀 launch",
+            "Café naïve ª ² © ™ ½ 東京 ✔︎ done",
+        ],
+    )
+    def test_word_count_agrees_with_count_words(self, text):
+        """Test that symbols, emoji and PDF bullet glyphs are not counted as words."""
+        from src.ingestion.text_stats import count_words, text_stats
+
+        assert text_stats(text).words == count_words(text)
@@ -0,0 +1,84 @@
+"""Unit tests for background citation validation."""
+
+import pytest
+from unittest.mock import patch
+
+SOURCE_CONTENT = {
+    "scraped_content": {
+        "homepage": {"text": "We build software for enterprises. Our customers love it."}
+    },
+    "uploaded_content": [],
+}
+
+AGENT_OUTPUTS = {
+    "audience_identification": {
+        "audiences": [{"citations": [{"quote": "We build software", "source": "homepage"}]}]
+    },
+    "voice_agent": {
+        "findings": {"citations": [{"quote": "Our customers love it", "source": "homepage"}]}
+    },
+    "vividness_agent": {"citations": [{"quote": "Made-up quote", "source": "homepage"}]},
+}
+
+
+class TestIncrementalCitationValidator:
+    """Test incremental citation validation."""
+
+    def test_join_matches_single_pass_validation(self):
+        """Test that joined results equal one validate_citations() call."""
+        from src.agents.citation_validation_agent import validate_citations
+        from src.orchestration.incremental_validation import IncrementalCitationValidator
+
+        validator = IncrementalCitationValidator(SOURCE_CONTENT)
+        try:
+            # Submit out of order and leave one output unsubmitted
+            validator.submit("voice_agent", AGENT_OUTPUTS["voice_agent"])
+            validator.submit("audience_identification", AGENT_OUTPUTS["audience_identification"])
+            result = validator.join(AGENT_OUTPUTS)
+        finally:
+            validator.shutdown()
+
+        expected = validate_citations(AGENT_OUTPUTS, SOURCE_CONTENT)
+        assert result["agent_name"] == "citation_validation_agent"
+        assert result["validated_citations"] == expected["validated_citations"]
+
+    def test_join_reraises_worker_errors(self):
+        """Test that a failure on the worker surfaces when results are joined."""
+        from src.orchestration.incremental_validation import IncrementalCitationValidator
+
+        validator = IncrementalCitationValidator(SOURCE_CONTENT)
+        try:
+            with patch(
+                "src.orchestration.incremental_validation.validate_citations",
+                side_effect=RuntimeError("boom"),
+            ):
+                validator.submit("voice_agent", AGENT_OUTPUTS["voice_agent"])
+                with pytest.raises(RuntimeError, match="boom"):
+                    validator.join({"voice_agent": AGENT_OUTPUTS["voice_agent"]})
+        finally:
+            validator.shutdown()
+
+    def test_citation_node_raises_critical_failure(self):
+        """Test that the pipeline node keeps fail-fast semantics for worker errors."""
+        from src.orchestration.incremental_validation import (
+            IncrementalCitationValidator,
+            register_validator,
+            release_validator,
+        )
+        from src.orchestration.pipeline import CriticalFailureError, citation_validation_node
+
+        register_validator("run-1", IncrementalCitationValidator(SOURCE_CONTENT))
+        try:
+            with patch(
+                "src.orchestration.incremental_validation.validate_citations",
+                side_effect=RuntimeError("boom"),
+            ):
+                state = {
+                    "run_id": "run-1",
+                    "content": SOURCE_CONTENT,
+                    "agent_outputs": {"voice_agent": AGENT_OUTPUTS["voice_agent"]},
+                }
+                with pytest.raises(CriticalFailureError, match="Citation validation failed"):
+                    citation_validation_node(state)
+        finally:
+            release_validator("run-1")
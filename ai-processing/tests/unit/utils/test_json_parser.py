@@ -0,0 +1,71 @@
+"""Tests for extracting JSON from LLM responses."""
+
+import pytest
+
+from src.utils.json_parser import extract_json_from_text
+
+
+class TestExtractJsonFromText:
+    """Test the single-pass extractor on well-formed and messy responses."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            '{"score": 7}',
+            'Here is my assessment:\n```json\n{"score": 7}\n```\nLet me know.',
+            'The {0-100} scale [see rubric] applies.\n{"score": 7}',
+            '"score": 7}',
+        ],
+    )
+    def test_finds_object(self, text):
+        """Test that the object is found in bare, fenced, prose and brace-less responses."""
+        assert extract_json_from_text(text) == {"score": 7}
+
+    def test_prefers_last_code_block(self):
+        """Test that a format example before the answer is skipped."""
+        text = 'Format:\n```json\n{"score": 0}\n```\nAnswer:\n```json\n{"score": 7}\n```'
+        assert extract_json_from_text(text) == {"score": 7}
+
+    def test_prefers_object_over_array(self):
+        """Test that an array in the prose does not win over the object."""
+        assert extract_json_from_text('See [1, 2].\n{"score": 7}') == {"score": 7}
+        assert extract_json_from_text("Scores: [1, 2, 3]") == [1, 2, 3]
+
+    def test_brackets_inside_strings_ignored(self):
+        """Test that quoted braces, escaped quotes and fences do not end the value."""
+        text = '{"quote": "He said \\"{wow}\\" ```", "score": 7}'
+        assert extract_json_from_text(text) == {"quote": 'He said "{wow}" ```', "score": 7}
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ('{"notes": ["a", "b",], "score": 7,}', {"notes": ["a", "b"], "score": 7}),
+            ('{"note": "line one\nline two"}', {"note": "line one\nline two"}),
+            ('{"notes": ["a", "b"}', {"notes": ["a", "b"]}),
+            ('{"score": 7}]}', {"score": 7}),
+        ],
+    )
+    def test_repairs_defects(self, text, expected):
+        """Test trailing commas, raw newlines and unbalanced brackets are repaired."""
+        assert extract_json_from_text(text) == expected
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ('```json\n{"findings": [{"id": 1}, {"id": 2', {"findings": [{"id": 1}, {"id": 2}]}),
+            (
+                '{"findings": [{"id": 1}, {"id": 2, "note": "cut',
+                {"findings": [{"id": 1}, {"id": 2, "note": "cut"}]},
+            ),
+            ('{"findings": [{"id": 1}], "summary": ', {"findings": [{"id": 1}]}),
+            ('```json\n{"score": 7, "notes": ["a"\n```\nMore', {"score": 7, "notes": ["a"]}),
+        ],
+    )
+    def test_closes_cut_off_output(self, text, expected):
+        """Test that output cut off at max_tokens is closed or cut at its last member."""
+        assert extract_json_from_text(text) == expected
+
+    @pytest.mark.parametrize("text", ["", "No JSON here.", "{not json}", "```\ncode\n```"])
+    def test_returns_none_without_json(self, text):
+        """Test that text without a JSON object or array gives None."""
+        assert extract_json_from_text(text) is None
@@ -0,0 +1,102 @@
+"""Unit tests for the sparse sentence window index."""
+
+import pytest
+
+
+class TestSemanticIndex:
+    """Test semantic index functionality."""
+
+    def test_tokenize_stems_and_splits_contractions(self):
+        """Test that plurals are stemmed and "n't" becomes a negation."""
+        from src.utils.semantic_index import tokenize
+
+        assert tokenize("CFOs don't like companies") == ["cfo", "do", "not", "like", "company"]
+
+    def test_split_sentences_keeps_offsets(self):
+        """Test that sentence offsets point into the original text."""
+        from src.utils.semantic_index import split_sentences
+
+        text = "First sentence. Second one!\nThird"
+        sentences = split_sentences(text)
+
+        assert [s for _, s in sentences] == ["First sentence.", "Second one!", "Third"]
+        for offset, sentence in sentences:
+            assert text[offset : offset + len(sentence)] == sentence
+
+    def test_best_matches_scores_all_quotes(self):
+        """Test that each quote gets its best window and the share of its features found there."""
+        from src.utils.semantic_index import SentenceIndex
+
+        source = "Cats sleep all day. Dogs bark at the mailman."
+        index = SentenceIndex(source)
+
+        [(full, full_offset), (partial, partial_offset)] = index.best_matches(
+            ["the dogs bark at a mailman", "cats sleep all day long"]
+        )
+
+        assert (full, full_offset) == (pytest.approx(1.0), source.index("Dogs"))
+        assert 0.5 < partial < 1.0
+        assert partial_offset == 0
+
+    def test_word_forms_earn_partial_credit(self):
+        """Test that a reworded form of a source word scores above an unrelated word."""
+        from src.utils.semantic_index import SentenceIndex
+
+        index = SentenceIndex("Our platform manages financial operations for clinics.")
+
+        [(related, _), (unrelated, _)] = index.best_matches(
+            ["platform manages finance operations", "platform manages zebra operations"]
+        )
+
+        assert related > unrelated
+
+    def test_quote_spanning_sentences(self):
+        """Test that a quote across a sentence boundary matches the two-sentence window."""
+        from src.utils.semantic_index import SentenceIndex
+
+        index = SentenceIndex("Cats sleep all day. Dogs bark at the mailman.")
+
+        assert index.best_matches(["cats sleep, dogs bark"]) == [(pytest.approx(1.0), 0)]
+
+    def test_contradicting_window_skipped(self):
+        """Test that a negated or reordered window does not count as a match."""
+        from src.utils.semantic_index import SentenceIndex
+
+        index = SentenceIndex("Dogs never chase cats.")
+
+        assert index.best_matches(["dogs chase cats", "cats chase dogs"]) == [(0.0, -1)] * 2
+
+    def test_index_stores_only_postings(self):
+        """Test that the index keeps window ids per feature, not a row per window."""
+        from src.utils.semantic_index import SentenceIndex
+
+        index = SentenceIndex("Cats sleep. Dogs bark. Cats bark.")
+
+        cat = index._vocabulary["w:cat"]
+        assert len(index) == 5
+        postings = index._feature_windows[
+            index._feature_starts[cat] : index._feature_starts[cat + 1]
+        ]
+        assert postings.tolist() == [0, 1, 3, 4]
+
+    def test_blocked_scoring_matches_single_pass(self, monkeypatch):
+        """Test that scoring in small blocks gives the same results as one pass."""
+        from src.utils import semantic_index
+        from src.utils.semantic_index import SentenceIndex
+
+        index = SentenceIndex("Cats sleep all day. Dogs bark at the mailman. Birds sing at dawn.")
+        quotes = ["dogs bark", "birds sing at sunrise", "cats sleep all day long", "fish swim"]
+        expected = index.best_matches(quotes)
+
+        monkeypatch.setattr(semantic_index, "MAX_SCORE_CELLS", 1)
+        monkeypatch.setattr(semantic_index, "MAX_GATHERED_POSTINGS", 1)
+
+        scores, offsets = zip(*index.best_matches(quotes))
+        assert scores == pytest.approx([score for score, _ in expected])
+        assert list(offsets) == [offset for _, offset in expected]
+
+    def test_empty_source(self):
+        """Test that an empty source yields zero scores."""
+        from src.utils.semantic_index import SentenceIndex
+
+        assert SentenceIndex("").best_matches(["anything"]) == [(0.0, -1)]